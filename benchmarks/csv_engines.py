@@ -0,0 +1,84 @@
+"""Compare CSV parser engines on household_power-sized input.
+
+Generates a semicolon-separated file shaped like the household_power dataset
+(Date, Time and seven measurement columns, ``?`` for missing values) and times
+the parse stage of :class:`DataFrameProvider` with each engine, using the
+dataset's own YAML config (schema and datetime index included).
+
+Usage:
+
+    python benchmarks/csv_engines.py --rows 2075259 --repeat 3
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from dataset_hub._core.config_manager import ConfigManager
+from dataset_hub._core.provider.dataframe_provider import DataFrameProvider
+
+MEASUREMENTS = [
+    "Global_active_power",
+    "Global_reactive_power",
+    "Voltage",
+    "Global_intensity",
+    "Sub_metering_1",
+    "Sub_metering_2",
+    "Sub_metering_3",
+]
+
+
+def write_fixture(path: Path, rows: int, seed: int = 0) -> None:
+    """Write a household_power-like CSV with `rows` minute samples."""
+    rng = np.random.default_rng(seed)
+    stamps = pd.date_range("2006-12-16 17:24", periods=rows, freq="min")
+    df = pd.DataFrame(
+        {
+            "Date": stamps.strftime("%d/%m/%Y"),
+            "Time": stamps.strftime("%H:%M:%S"),
+            **{name: rng.random(rows).round(3).astype(str) for name in MEASUREMENTS},
+        }
+    )
+    missing = rng.random(rows) < 0.0125
+    df.loc[missing, MEASUREMENTS] = "?"
+    df.to_csv(path, sep=";", index=False)
+
+
+def time_engine(path: Path, params: Dict[str, Any], engine: Optional[str]) -> float:
+    """Return the seconds taken to parse `path` with `engine`."""
+    provider = DataFrameProvider({**params, "engine": engine})
+    start = time.perf_counter()
+    provider._read_source(
+        path, provider.config["source"], provider.config["read_kwargs"]
+    )
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_075_259)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    config = ConfigManager.load_config("household_power", "timeseries")
+    params = dict(config["providers"]["data"]["params"])
+    params["source"] = {**params["source"], "url": "file.csv", "format": "csv"}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "household_power.csv"
+        write_fixture(path, args.rows)
+        size_mb = path.stat().st_size / 2**20
+        print(f"{args.rows} rows, {size_mb:.1f} MiB")
+
+        for engine in ("c", "pyarrow"):
+            timings = [time_engine(path, params, engine) for _ in range(args.repeat)]
+            print(f"{engine:>8}: best {min(timings):.2f}s of {args.repeat}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""Benchmark the get_data load pipeline against a local HTTP server.
+
+Generates fixture tables at several sizes in each source format (CSV, zipped
+CSV, Parquet, JSON and Excel), serves them from a local threaded HTTP server
+and times :func:`get_data` end-to-end and per stage (from its tracing spans:
+fetch, download, decompress, parse, package) in three scenarios:
+
+- ``cold``: empty disk and memory caches, so the source is downloaded.
+- ``warm_disk``: the source is in the on-disk cache; it is parsed again.
+- ``warm_memory``: the table is in the in-memory cache.
+
+Results are written as JSON so runs can be compared across commits; pass the
+results of an earlier run to ``--compare`` to print the median ratios. No
+network access is needed.
+
+Usage:
+
+    python benchmarks/load_pipeline.py --rows 10000,100000 --repeat 5
+    python benchmarks/load_pipeline.py --compare benchmarks/results/old.json
+"""
+
+import argparse
+import copy
+import importlib.util
+import io
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from dataset_hub import add_trace_callback, cache_clear, remove_trace_callback
+from dataset_hub._core.config_manager import ConfigManager
+from dataset_hub._core.get_data import get_data
+from dataset_hub._core.settings.user_settings import set_option
+from dataset_hub._core.tracing import Span
+
+FORMATS = ["csv", "zip", "parquet", "json", "excel"]
+SCENARIOS = ["cold", "warm_disk", "warm_memory"]
+STAGES = ["config", "fetch", "download", "decompress", "parse", "package"]
+
+# Writing and parsing xlsx is slow, so larger Excel fixtures are skipped
+EXCEL_MAX_ROWS = 100_000
+
+# memory_cache_size used by the warm_memory scenario
+MEMORY_CACHE_SIZE = 2**40
+
+TASK_TYPE = "benchmark"
+
+RESULTS_PATH = Path(__file__).resolve().parent / "results"
+
+
+@dataclass
+class Fixture:
+    """One served source file and the dataset config loading it."""
+
+    name: str
+    format: str
+    rows: int
+    size: int
+    config: Dict[str, Any]
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Return a table mixing integer, float, string, boolean and date columns."""
+    rng = np.random.default_rng(seed)
+    categories = np.array([f"category_{i}" for i in range(20)])
+    df: pd.DataFrame = pd.DataFrame(
+        {
+            "id": np.arange(rows, dtype="int64"),
+            "value": rng.normal(size=rows).round(6),
+            "count": rng.integers(0, 1000, size=rows),
+            "category": categories[rng.integers(0, len(categories), size=rows)],
+            "flag": rng.random(rows) < 0.5,
+            "date": pd.date_range("2020-01-01", periods=rows, freq="min").strftime(
+                "%Y-%m-%d %H:%M"
+            ),
+        }
+    )
+    return df
+
+
+def write_source(df: pd.DataFrame, format_: str) -> bytes:
+    """Serialize `df` as a source file of `format_`."""
+    if format_ == "csv":
+        return df.to_csv(index=False).encode()
+    if format_ == "zip":
+        payload = io.BytesIO()
+        with zipfile.ZipFile(payload, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("data.csv", df.to_csv(index=False))
+        return payload.getvalue()
+    payload = io.BytesIO()
+    if format_ == "parquet":
+        df.to_parquet(payload, index=False)
+    elif format_ == "json":
+        df.to_json(payload)
+    elif format_ == "excel":
+        df.to_excel(payload, index=False)
+    else:
+        raise ValueError(f"Unsupported fixture format '{format_}'")
+    return payload.getvalue()
+
+
+def build_fixtures(
+    root: Path, base_url: str, formats: List[str], sizes: List[int]
+) -> List[Fixture]:
+    """Write the fixture files into `root` and return their descriptions."""
+    fixtures = []
+    for rows in sizes:
+        df = make_frame(rows)
+        for format_ in formats:
+            if format_ == "excel" and rows > EXCEL_MAX_ROWS:
+                print(f"skipping excel with {rows} rows (> {EXCEL_MAX_ROWS})")
+                continue
+            name = f"{format_}_{rows}"
+            suffix = {"excel": "xlsx"}.get(format_, format_)
+            body = write_source(df, format_)
+            (root / f"{name}.{suffix}").write_bytes(body)
+            source = {
+                "type": "url",
+                "url": f"{base_url}/{name}.{suffix}",
+                "format": "csv" if format_ == "zip" else format_,
+            }
+            config = ConfigManager._transform_to_provider_schema(
+                {"dataset_parts": [{"name": "data", "source": source}]}
+            )
+            fixtures.append(Fixture(name, format_, rows, len(body), config))
+    return fixtures
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Keep-alive static file handler without request logging."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; with Nagle's algorithm the body
+    # waits for the client's delayed ACK (~40 ms per request)
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@contextmanager
+def serve_directory(root: Path) -> Iterator[str]:
+    """Serve `root` over HTTP on a free local port and yield its base URL."""
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(QuietHandler, directory=str(root))
+    )
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address[:2]
+        yield f"http://{host!s}:{port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextmanager
+def fixture_configs(fixtures: List[Fixture]) -> Iterator[None]:
+    """Resolve the fixture names in get_data instead of the bundled catalog."""
+    configs = {fixture.name: fixture.config for fixture in fixtures}
+
+    def load_config(dataset_name: str, task_type: str) -> Dict[str, Any]:
+        return copy.deepcopy(configs[dataset_name])
+
+    with patch.object(ConfigManager, "load_config", side_effect=load_config):
+        yield
+
+
+def time_load(fixture: Fixture) -> Dict[str, float]:
+    """Time one get_data call and return its total and per-stage seconds."""
+    spans: List[Span] = []
+    add_trace_callback(spans.append)
+    try:
+        start = time.perf_counter()
+        get_data(fixture.name, TASK_TYPE, verbose=False)
+        timings = {"total": time.perf_counter() - start}
+    finally:
+        remove_trace_callback(spans.append)
+    for span in spans:
+        if span.name in STAGES:
+            timings[span.name] = timings.get(span.name, 0.0) + span.duration
+    return timings
+
+
+def run_scenario(
+    fixture: Fixture, scenario: str, repeat: int, work_dir: Path
+) -> List[Dict[str, float]]:
+    """Time `repeat` loads of `fixture` in `scenario`, each on fresh caches."""
+    runs = []
+    for i in range(repeat):
+        set_option("data_path", str(work_dir / f"{fixture.name}-{scenario}-{i}"))
+        cache_size = MEMORY_CACHE_SIZE if scenario == "warm_memory" else 0
+        set_option("memory_cache_size", cache_size)
+        cache_clear()
+        if scenario != "cold":
+            get_data(fixture.name, TASK_TYPE, verbose=False)
+        runs.append(time_load(fixture))
+    cache_clear()
+    return runs
+
+
+def summarize(runs: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Return the min and median of every timing measured in `runs`."""
+    names = ["total", *(stage for stage in STAGES if any(stage in r for r in runs))]
+    summary = {}
+    for name in names:
+        values = [run.get(name, 0.0) for run in runs]
+        summary[name] = {"min": min(values), "median": statistics.median(values)}
+    return summary
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the commit and environment the benchmark ran in."""
+    try:
+        commit: Optional[str] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    packages = {}
+    for package in ("pandas", "numpy", "pyarrow", "openpyxl", "requests"):
+        spec = importlib.util.find_spec(package)
+        if spec is not None:
+            packages[package] = getattr(__import__(package), "__version__", None)
+    return {
+        "commit": commit,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "packages": packages,
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: Path) -> None:
+    """Print the median total time of `results` relative to a baseline run."""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    previous = {
+        (r["format"], r["rows"], r["scenario"]): r["seconds"]["total"]["median"]
+        for r in baseline["results"]
+    }
+    print(f"\nmedian total vs {baseline['environment'].get('commit')}:")
+    for result in results:
+        key = (result["format"], result["rows"], result["scenario"])
+        if key not in previous:
+            continue
+        ratio = result["seconds"]["total"]["median"] / previous[key]
+        print(f"{key[0]:>8} {key[1]:>9} {key[2]:>12}: {ratio:6.2f}x")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", default="10000,100000,1000000")
+    parser.add_argument("--formats", default=",".join(FORMATS))
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    sizes = [int(rows) for rows in args.rows.split(",")]
+    formats = args.formats.split(",")
+    scenarios = args.scenarios.split(",")
+    if "excel" in formats and importlib.util.find_spec("openpyxl") is None:
+        print("skipping excel: openpyxl is not installed")
+        formats.remove("excel")
+
+    env = environment()
+    set_option("verbose", False)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="dataset_hub_bench_") as tmp_dir:
+        serve_root = Path(tmp_dir) / "served"
+        serve_root.mkdir()
+        with serve_directory(serve_root) as base_url:
+            fixtures = build_fixtures(serve_root, base_url, formats, sizes)
+            with fixture_configs(fixtures):
+                for fixture in fixtures:
+                    for scenario in scenarios:
+                        runs = run_scenario(
+                            fixture, scenario, args.repeat, Path(tmp_dir)
+                        )
+                        seconds = summarize(runs)
+                        results.append(
+                            {
+                                "format": fixture.format,
+                                "rows": fixture.rows,
+                                "bytes": fixture.size,
+                                "scenario": scenario,
+                                "seconds": seconds,
+                                "runs": runs,
+                            }
+                        )
+                        stages = " ".join(
+                            f"{name}={value['median']:.3f}"
+                            for name, value in seconds.items()
+                            if name != "total"
+                        )
+                        print(
+                            f"{fixture.format:>8} {fixture.rows:>9} {scenario:>12}: "
+                            f"{seconds['total']['median']:.3f}s {stages}"
+                        )
+
+    output = args.output or RESULTS_PATH / f"load_pipeline-{env['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "environment": env,
+        "settings": {"repeat": args.repeat, "rows": sizes},
+        "results": results,
+    }
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"results written to {output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,74 @@
-from . import classification, regression, timeseries, nlp
-from ._core.data_bundle import DataBundle
-from ._core.settings.user_settings import set_option
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-__all__ = ["classification", "regression", "timeseries", "set_option", "DataBundle", "nlp"]
+if TYPE_CHECKING:
+    from . import classification, nlp, regression, timeseries
+    from ._core.data_bundle import DataBundle
+    from ._core.get_data import aget_data, aget_many, get_data
+    from ._core.memory_cache import CacheInfo, cache_clear, cache_info
+    from ._core.metrics import metrics_snapshot, reset_metrics, write_metrics
+    from ._core.prefetch import PrefetchResult, prefetch
+    from ._core.settings.user_settings import set_option
+    from ._core.tracing import Span, add_trace_callback, remove_trace_callback
+
+__all__ = [
+    "classification",
+    "regression",
+    "timeseries",
+    "set_option",
+    "DataBundle",
+    "nlp",
+    "prefetch",
+    "PrefetchResult",
+    "get_data",
+    "aget_data",
+    "aget_many",
+    "cache_info",
+    "cache_clear",
+    "CacheInfo",
+    "add_trace_callback",
+    "remove_trace_callback",
+    "Span",
+    "metrics_snapshot",
+    "write_metrics",
+    "reset_metrics",
+]
+
+# Public names and the modules defining them. They are imported on first
+# access (PEP 562), so ``import dataset_hub`` does not import pandas,
+# requests or yaml until a dataset is actually loaded.
+_LAZY_ATTRS: Dict[str, str] = {
+    "classification": ".classification",
+    "regression": ".regression",
+    "timeseries": ".timeseries",
+    "nlp": ".nlp",
+    "set_option": "._core.settings.user_settings",
+    "DataBundle": "._core.data_bundle",
+    "prefetch": "._core.prefetch",
+    "PrefetchResult": "._core.prefetch",
+    "get_data": "._core.get_data",
+    "aget_data": "._core.get_data",
+    "aget_many": "._core.get_data",
+    "cache_info": "._core.memory_cache",
+    "cache_clear": "._core.memory_cache",
+    "CacheInfo": "._core.memory_cache",
+    "add_trace_callback": "._core.tracing",
+    "remove_trace_callback": "._core.tracing",
+    "Span": "._core.tracing",
+    "metrics_snapshot": "._core.metrics",
+    "write_metrics": "._core.metrics",
+    "reset_metrics": "._core.metrics",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+    value = module if _LAZY_ATTRS[name] == f".{name}" else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
@@ -1,3 +1,52 @@
-from .get_data import get_data
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-__all__ = ["get_data"]
+if TYPE_CHECKING:
+    from .get_data import aget_data, aget_many, get_data
+    from .memory_cache import CacheInfo, cache_clear, cache_info
+    from .metrics import metrics_snapshot, reset_metrics, write_metrics
+    from .tracing import Span, add_trace_callback, remove_trace_callback
+
+__all__ = [
+    "get_data",
+    "aget_data",
+    "aget_many",
+    "cache_info",
+    "cache_clear",
+    "CacheInfo",
+    "add_trace_callback",
+    "remove_trace_callback",
+    "Span",
+    "metrics_snapshot",
+    "write_metrics",
+    "reset_metrics",
+]
+
+# Public names and the modules defining them, imported on first access so
+# that light modules (settings, catalog) can be used without pandas
+_LAZY_ATTRS: Dict[str, str] = {
+    "get_data": ".get_data",
+    "aget_data": ".get_data",
+    "aget_many": ".get_data",
+    "cache_info": ".memory_cache",
+    "cache_clear": ".memory_cache",
+    "CacheInfo": ".memory_cache",
+    "add_trace_callback": ".tracing",
+    "remove_trace_callback": ".tracing",
+    "Span": ".tracing",
+    "metrics_snapshot": ".metrics",
+    "write_metrics": ".metrics",
+    "reset_metrics": ".metrics",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,286 @@
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+
+from dataset_hub._core import tracing
+from dataset_hub._core.loaders.url_loader import UrlLoader
+from dataset_hub._core.settings.loader import load_settings
+from dataset_hub._core.utils.files import file_lock
+from dataset_hub._core.utils.logger import get_logger
+from dataset_hub._core.utils.paths import build_datafile_path
+
+logger = get_logger(__name__)
+
+_refresh_threads: Dict[Path, threading.Thread] = {}
+_refresh_threads_lock = threading.Lock()
+
+
+class CacheManager:
+    """
+    Local on-disk cache for dataset source files.
+
+    Responsibilities:
+        - Decide whether local caching is enabled (``save_local`` setting)
+        - Build a stable cache key from a dataset name and its source config
+        - Resolve cached file paths under the ``data_path`` setting
+        - Download missing sources into the cache
+        - Revalidate cached sources against upstream (ETag / Last-Modified)
+        - Resolve columnar (Parquet/Feather) copies of parsed tables
+
+    Layout::
+
+        <data_path>/<dataset_name>/<config_hash>/<filename>
+        <data_path>/<dataset_name>/<config_hash>/<stem>.<read_hash>.<format>
+    """
+
+    COLUMNAR_FORMATS = ("parquet", "feather")
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """
+        Check whether downloaded sources should be kept on disk.
+
+        Returns:
+            bool: Value of the ``save_local`` setting.
+        """
+        return bool(load_settings()["save_local"])
+
+    @staticmethod
+    def config_hash(config: Dict[str, Any]) -> str:
+        """
+        Build a short, stable hash of a configuration dictionary.
+
+        Keys are sorted before hashing, so the same config always yields the
+        same hash regardless of key order.
+
+        Args:
+            config (Dict[str, Any]): Any JSON-serializable configuration.
+
+        Returns:
+            str: 16-character hexadecimal digest.
+        """
+        payload = json.dumps(config, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def build_cache_path(
+        dataset_name: str, source: Dict[str, Any], filename: str
+    ) -> Path:
+        """
+        Build the path of a cached source file.
+
+        Args:
+            dataset_name (str): Name of the dataset (e.g., 'titanic').
+            source (Dict[str, Any]): Source configuration used as the cache key.
+            filename (str): File name of the downloaded source.
+
+        Returns:
+            Path: Path to the cached file (parent directories are created).
+        """
+        key = CacheManager.config_hash(source)
+        return build_datafile_path(f"{dataset_name}/{key}", filename)
+
+    @staticmethod
+    def source_filename(dataset_name: str, source: Dict[str, Any]) -> str:
+        """
+        Return the local file name for a source.
+
+        The name is taken from the URL path so readers can infer compression
+        from its extension (e.g. '.zip'); URLs without a file name fall back
+        to '<dataset_name>.<format>'.
+
+        Args:
+            dataset_name (str): Name of the dataset.
+            source (Dict[str, Any]): Source configuration with 'url' and 'format'.
+
+        Returns:
+            str: File name for the local copy.
+        """
+        filename = UrlLoader._extract_filename(source["url"])
+        return filename or f"{dataset_name}.{source['format']}"
+
+    @staticmethod
+    def fetch(dataset_name: str, source: Dict[str, Any]) -> Path:
+        """
+        Return a local copy of the source, downloading it on a cache miss.
+
+        The download is written atomically, so concurrent processes sharing
+        the same ``data_path`` never read a partially written file. Downloads
+        of the same file are serialized with a lock file; a process that waited
+        for the lock reuses the file downloaded by the lock holder. Interrupted
+        downloads are resumed from their '.part' file (see
+        :meth:`UrlLoader.download`).
+
+        Args:
+            dataset_name (str): Name of the dataset.
+            source (Dict[str, Any]): Source configuration with 'url' and 'format'.
+
+        Returns:
+            Path: Path to the cached source file.
+
+        Raises:
+            OSError: If the cache directory cannot be created or written.
+        """
+        url = source["url"]
+        with tracing.span("fetch", dataset=dataset_name, url=url) as span:
+            path, downloaded = CacheManager._fetch(dataset_name, source)
+            span.attributes["cache_hit"] = not downloaded
+            span.attributes["bytes"] = path.stat().st_size
+        return path
+
+    @staticmethod
+    def _fetch(dataset_name: str, source: Dict[str, Any]) -> Tuple[Path, bool]:
+        """
+        Body of :meth:`fetch`, run inside its ``fetch`` tracing span.
+
+        Args:
+            dataset_name (str): Name of the dataset.
+            source (Dict[str, Any]): Source configuration with 'url' and 'format'.
+
+        Returns:
+            Tuple[Path, bool]: Path to the cached source file and whether it
+            was downloaded (or replaced by a revalidation) by this call.
+        """
+        url = source["url"]
+        filename = CacheManager.source_filename(dataset_name, source)
+        path = CacheManager.build_cache_path(dataset_name, source, filename)
+
+        if path.exists():
+            logger.debug(f"Cache hit for '{dataset_name}': {path}")
+            settings = load_settings()
+            if settings["revalidate"]:
+                if settings["stale_while_revalidate"]:
+                    CacheManager._refresh_in_background(url, path)
+                else:
+                    return path, CacheManager._refresh(url, path)
+            return path, False
+
+        with file_lock(path.with_name(path.name + ".lock")):
+            if path.exists():
+                return path, False
+            logger.debug(f"Cache miss for '{dataset_name}', downloading {url}")
+            return UrlLoader(url).download(path), True
+
+    @staticmethod
+    def wait_for_refreshes(timeout: Optional[float] = None) -> None:
+        """
+        Block until background revalidations started by :meth:`fetch` finish.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait per refresh.
+        """
+        with _refresh_threads_lock:
+            threads = list(_refresh_threads.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    @staticmethod
+    def _refresh(url: str, path: Path) -> bool:
+        """
+        Revalidate a cached file, keeping it on any error.
+
+        Args:
+            url (str): Source URL.
+            path (Path): Cached file.
+
+        Returns:
+            bool: Whether the file was replaced by a newer version.
+        """
+        try:
+            with file_lock(path.with_name(path.name + ".lock")):
+                changed = UrlLoader(url).revalidate(path)
+        except (requests.RequestException, ValueError, OSError) as e:
+            logger.warning(f"Could not revalidate {url} ({e}), using cached copy")
+            return False
+        if changed:
+            logger.debug(f"Refreshed cached copy of {url}")
+        return changed
+
+    @staticmethod
+    def _refresh_in_background(url: str, path: Path) -> None:
+        """
+        Start a daemon thread revalidating `path`, unless one is running.
+
+        Args:
+            url (str): Source URL.
+            path (Path): Cached file.
+        """
+        with _refresh_threads_lock:
+            running = _refresh_threads.get(path)
+            if running is not None and running.is_alive():
+                return
+            thread = threading.Thread(
+                target=CacheManager._refresh,
+                args=(url, path),
+                name=f"dataset_hub-refresh-{path.name}",
+                daemon=True,
+            )
+            _refresh_threads[path] = thread
+            thread.start()
+
+    @staticmethod
+    def columnar_format() -> Optional[str]:
+        """
+        Return the configured columnar cache format.
+
+        Returns:
+            str, optional: ``"parquet"``, ``"feather"`` or None when the
+            ``columnar_cache`` setting is disabled.
+
+        Raises:
+            ValueError: If the setting holds an unsupported format.
+        """
+        format_ = load_settings().get("columnar_cache")
+        if not format_:
+            return None
+        format_ = str(format_).lower()
+        if format_ not in CacheManager.COLUMNAR_FORMATS:
+            raise ValueError(
+                f"Unsupported columnar_cache '{format_}'. "
+                f"Supported formats: {list(CacheManager.COLUMNAR_FORMATS)}"
+            )
+        return format_
+
+    @staticmethod
+    def build_columnar_path(
+        source_path: Path, read_config: Dict[str, Any], format_: str
+    ) -> Path:
+        """
+        Build the path of the columnar copy of a parsed source file.
+
+        The file sits next to the cached source and its name includes a hash
+        of `read_config`, so any change of the reader options maps to a new
+        file instead of serving a table parsed with stale options.
+
+        Args:
+            source_path (Path): Path to the cached source file.
+            read_config (Dict[str, Any]): Everything that affects parsing
+                (source and reader keyword arguments).
+            format_ (str): Columnar format ("parquet" or "feather").
+
+        Returns:
+            Path: Path to the columnar cache file.
+        """
+        key = CacheManager.config_hash(read_config)
+        stem = source_path.name.split(".", 1)[0]
+        return source_path.with_name(f"{stem}.{key}.{format_}")
+
+    @staticmethod
+    def is_fresh(cache_path: Path, source_path: Path) -> bool:
+        """
+        Check that a derived cache file exists and is not older than its source.
+
+        Args:
+            cache_path (Path): Derived file (e.g. a columnar copy).
+            source_path (Path): File it was derived from.
+
+        Returns:
+            bool: True if `cache_path` can be used instead of parsing `source_path`.
+        """
+        if not cache_path.exists():
+            return False
+        return cache_path.stat().st_mtime >= source_path.stat().st_mtime
@@ -0,0 +1,114 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List
+
+from dataset_hub._core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Root of the installed package, holding the <task_type>/_configs/ directories
+PACKAGE_PATH = Path(__file__).resolve().parent.parent
+
+# Compiled catalog shipped as package data next to this module
+CATALOG_PATH = Path(__file__).resolve().parent / "catalog.json"
+
+
+def build_catalog(package_path: Path = PACKAGE_PATH) -> Dict[str, Any]:
+    """
+    Compile every bundled dataset YAML config into one catalog.
+
+    Args:
+        package_path (Path): Package root holding ``<task_type>/_configs/``.
+
+    Returns:
+        Dict[str, Any]: ``{"datasets": {task_type: {dataset_name: config}}}``
+        with the raw (dataset_parts) configs, sorted by task and name.
+    """
+    import yaml
+
+    datasets: Dict[str, Dict[str, Any]] = {}
+    for configs_path in sorted(package_path.glob("*/_configs")):
+        datasets[configs_path.parent.name] = {
+            path.stem: yaml.safe_load(path.read_text(encoding="utf-8"))
+            for path in sorted(configs_path.glob("*.yaml"))
+        }
+    return {"datasets": datasets}
+
+
+def write_catalog(path: Path = CATALOG_PATH) -> None:
+    """
+    Compile the bundled YAML configs and write the catalog file.
+
+    Args:
+        path (Path): Destination JSON file.
+    """
+    text = json.dumps(build_catalog(), indent=2, sort_keys=True, ensure_ascii=False)
+    path.write_text(text + "\n", encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def load_catalog() -> Dict[str, Any]:
+    """
+    Return the dataset catalog, reading it once per process.
+
+    The compiled ``catalog.json`` is used when present; otherwise (e.g. in a
+    source checkout without it) the YAML configs are compiled in memory.
+
+    Returns:
+        Dict[str, Any]: Catalog as returned by :func:`build_catalog`. It is
+        shared, so callers must not modify it.
+    """
+    try:
+        with open(CATALOG_PATH, encoding="utf-8") as f:
+            catalog: Dict[str, Any] = json.load(f)
+    except FileNotFoundError:
+        logger.debug(f"{CATALOG_PATH.name} not found, compiling the YAML configs")
+        return build_catalog()
+    return catalog
+
+
+def get_raw_config(dataset_name: str, task_type: str) -> Dict[str, Any]:
+    """
+    Return the raw (dataset_parts) config of a bundled dataset.
+
+    Args:
+        dataset_name (str): Name of the dataset.
+        task_type (str): Type of task.
+
+    Returns:
+        Dict[str, Any]: Shared raw configuration; callers must not modify it.
+
+    Raises:
+        FileNotFoundError: If the dataset is not in the catalog.
+    """
+    try:
+        config: Dict[str, Any] = load_catalog()["datasets"][task_type][dataset_name]
+    except KeyError:
+        raise FileNotFoundError(
+            f"Dataset config not found: {(task_type, '_configs', dataset_name)}"
+        ) from None
+    return config
+
+
+def list_datasets(task_type: str) -> List[str]:
+    """
+    List the bundled dataset names of a task type.
+
+    Args:
+        task_type (str): Type of task.
+
+    Returns:
+        List[str]: Dataset names, sorted; empty for an unknown task type.
+    """
+    return list(load_catalog()["datasets"].get(task_type, {}))
+
+
+def list_task_types() -> List[str]:
+    """
+    List the task types that ship dataset configs.
+
+    Returns:
+        List[str]: Task type names, sorted.
+    """
+    return sorted(load_catalog()["datasets"])
@@ -1,7 +1,8 @@
-from pathlib import Path
-from typing import Any, Dict
+import copy
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
-import yaml
+from dataset_hub._core.catalog import get_raw_config
 
 
 class ConfigManager:
@@ -9,11 +10,21 @@ class ConfigManager:
     Factory to load and build dataset configurations.
 
     Responsibilities:
-        - Find config file by dataset_name and task_type
-        - Load YAML into dict
+        - Look up the config by dataset_name and task_type in the compiled
+          catalog (see :mod:`dataset_hub._core.catalog`)
         - Transform dataset_parts schema into provider-based schema
     """
 
+    # Registry of as_type values and the provider type and params producing them
+    _AS_TYPE_REGISTRY: Dict[str, Tuple[str, Dict[str, Any]]] = {
+        "pd.DataFrame": ("dataframe", {}),
+        "pandas.DataFrame": ("dataframe", {}),
+        "pa.Table": ("arrow", {"output": "table"}),
+        "pyarrow.Table": ("arrow", {"output": "table"}),
+        "pa.RecordBatchReader": ("arrow", {"output": "reader"}),
+        "pyarrow.RecordBatchReader": ("arrow", {"output": "reader"}),
+    }
+
     @staticmethod
     def load_config(dataset_name: str, task_type: str) -> Dict[str, Any]:
         """
@@ -21,67 +32,59 @@ class ConfigManager:
 
         Converts from the dataset_parts schema to the provider-based schema:
             Input:  {"dataset_parts": [{"name": "...", "source": {...}, ...}]}
-            Output: {"provider": {"type": "...", "params": {...}}}
+            Output: {"providers": {"<table>": {"type": "...", "params": {...}}}}
+
+        The config is read from the compiled catalog and transformed once per
+        process; later calls return a copy of the memoized result, so no file
+        is touched.
 
         Args:
             dataset_name (str): Name of the dataset (file without extension).
             task_type (str): Type of task (e.g., "classification").
 
         Returns:
-            dict: Loaded configuration with provider-based schema.
+            dict: Loaded configuration with provider-based schema. The caller
+            owns it and may modify it.
+
+        Raises:
+            FileNotFoundError: If the dataset has no bundled config.
         """
-        config_path = ConfigManager.build_config_path(dataset_name, task_type)
-        raw_config = ConfigManager.load_raw_config(config_path)
-        transformed_config = ConfigManager._transform_to_provider_schema(raw_config)
-        return transformed_config
+        transformed_config = ConfigManager._load_cached(dataset_name, task_type)
+        return copy.deepcopy(transformed_config)
 
     @staticmethod
-    def build_config_path(dataset_name: str, task_type: str) -> Path:
+    @lru_cache(maxsize=None)
+    def _load_cached(dataset_name: str, task_type: str) -> Dict[str, Any]:
         """
-        Build the file path to the dataset's YAML configuration.
+        Transform a catalog config, memoized per (dataset_name, task_type).
 
         Args:
             dataset_name (str): Name of the dataset.
             task_type (str): Type of task.
 
         Returns:
-            Path: Full path to the YAML config file.
-        """
-        current_file_path = Path(__file__).resolve()
-        dataset_hub_path = current_file_path.parent.parent
-        config_path = dataset_hub_path / task_type / "_configs" / f"{dataset_name}.yaml"
-        return config_path
-
-    @staticmethod
-    def load_raw_config(config_path: Path) -> Dict[str, Any]:
-        """
-        Load the raw YAML configuration from the given path.
-
-        Args:
-            config_path (Path): Path to the YAML configuration file.
-
-        Returns:
-            dict: Configuration loaded from YAML.
-
-        Raises:
-            FileNotFoundError: If the YAML file does not exist.
+            dict: Shared configuration with provider-based schema.
         """
-        if not config_path.exists():
-            raise FileNotFoundError(
-                f"Dataset config not found: {config_path.parts[-3:]}"
-            )
-        with open(config_path) as f:
-            dataset_config: Dict[str, Any] = yaml.safe_load(f)
-        return dataset_config
+        raw_config = get_raw_config(dataset_name, task_type)
+        return ConfigManager._transform_to_provider_schema(raw_config)
 
     @staticmethod
     def _transform_to_provider_schema(raw_config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Transform dataset_parts schema into provider-based schema.
 
+        Every dataset part becomes one provider, keyed by the name of the table
+        it fills in the resulting :class:`DataBundle`. The table name is taken
+        from the optional ``table`` key of the part; otherwise a single-part
+        dataset uses ``"data"`` and a multi-part dataset uses the part name.
+        The ``columns`` block of a part (declared dtypes) becomes the provider
+        ``schema`` param; ``index`` and ``engine`` are passed through unchanged.
+        ``as_type`` selects the provider (see :meth:`resolve_as_type`).
+
         Input schema:
             dataset_parts:
-              - name: "iris"
+              - name: "adult_train"
+                table: "train"
                 pack_type: "table"
                 as_type: "pd.DataFrame"
                 source:
@@ -90,17 +93,30 @@ class ConfigManager:
                   format: "csv"
                 read_kwargs:
                   sep: ","
+                columns:
+                  age: "int8"
+                  workclass: "category"
+              - name: "adult_test"
+                table: "test"
+                ...
 
         Output schema:
-            provider:
-              type: "dataframe"
-              params:
-                source:
-                  type: "url"
-                  url: "https://..."
-                  format: "csv"
-                read_kwargs:
-                  sep: ","
+            providers:
+              train:
+                type: "dataframe"
+                params:
+                  name: "adult_train"
+                  source:
+                    type: "url"
+                    url: "https://..."
+                    format: "csv"
+                  read_kwargs:
+                    sep: ","
+                  schema:
+                    age: "int8"
+                    workclass: "category"
+              test:
+                ...
 
         Args:
             raw_config (Dict[str, Any]): Raw configuration with dataset_parts.
@@ -118,9 +134,80 @@ class ConfigManager:
         if not isinstance(dataset_parts, list) or len(dataset_parts) == 0:
             raise ValueError("'dataset_parts' must be a non-empty list")
 
-        # Take the first dataset part (for now, support single-part datasets)
-        part = dataset_parts[0]
+        providers: Dict[str, Dict[str, Any]] = {}
+        for part in dataset_parts:
+            table = ConfigManager._table_name(part, single=len(dataset_parts) == 1)
+            if table in providers:
+                raise ValueError(f"Duplicate table name '{table}' in dataset_parts")
+            providers[table] = ConfigManager._transform_part(part)
+
+        # Return provider-based schema
+        return {"providers": providers}
+
+    @staticmethod
+    def _table_name(part: Dict[str, Any], single: bool) -> str:
+        """
+        Return the DataBundle table name filled by a dataset part.
+
+        Args:
+            part (Dict[str, Any]): One entry of dataset_parts.
+            single (bool): Whether it is the only part of the dataset.
+
+        Returns:
+            str: Table name (e.g. "data", "train", "test").
 
+        Raises:
+            ValueError: If a part of a multi-part dataset has neither a
+                'table' nor a 'name' key.
+        """
+        if "table" in part:
+            return str(part["table"])
+        if single:
+            return "data"
+        if "name" not in part:
+            raise ValueError(
+                "Parts of a multi-part dataset must contain 'table' or 'name' key"
+            )
+        return str(part["name"])
+
+    @staticmethod
+    def resolve_as_type(as_type: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Return the provider producing a given output container.
+
+        Args:
+            as_type (str): Output container, e.g. ``"pd.DataFrame"``,
+                ``"pa.Table"`` or ``"pa.RecordBatchReader"``.
+
+        Returns:
+            Tuple[str, Dict[str, Any]]: Provider type and the provider params
+            selecting that container.
+
+        Raises:
+            ValueError: If the container is not supported.
+        """
+        if as_type not in ConfigManager._AS_TYPE_REGISTRY:
+            raise ValueError(
+                f"Unsupported as_type '{as_type}'. "
+                f"Supported: {list(ConfigManager._AS_TYPE_REGISTRY)}"
+            )
+        provider_type, params = ConfigManager._AS_TYPE_REGISTRY[as_type]
+        return provider_type, dict(params)
+
+    @staticmethod
+    def _transform_part(part: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Transform one dataset part into a provider configuration.
+
+        Args:
+            part (Dict[str, Any]): One entry of dataset_parts.
+
+        Returns:
+            Dict[str, Any]: Provider configuration with 'type' and 'params'.
+
+        Raises:
+            ValueError: If the part structure is invalid.
+        """
         if "source" not in part:
             raise ValueError("Dataset part must contain 'source' key")
 
@@ -133,13 +220,27 @@ class ConfigManager:
             "source": source,
         }
 
+        if "name" in part:
+            params["name"] = part["name"]
+
         if "read_kwargs" in part:
             params["read_kwargs"] = part["read_kwargs"]
 
-        # Return provider-based schema
+        if "columns" in part:
+            params["schema"] = part["columns"]
+
+        if "index" in part:
+            params["index"] = part["index"]
+
+        if "engine" in part:
+            params["engine"] = part["engine"]
+
+        provider_type, output_params = ConfigManager.resolve_as_type(
+            part.get("as_type", "pd.DataFrame")
+        )
+        params.update(output_params)
+
         return {
-            "provider": {
-                "type": "dataframe",
-                "params": params,
-            }
+            "type": provider_type,
+            "params": params,
         }
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict, Generic, ItemsView, KeysView, TypeVar
+from typing import Any, Dict, Generic, ItemsView, KeysView, TypeVar
 
 UserDataT = TypeVar("UserDataT")
 """
@@ -19,6 +19,8 @@ class DataBundle(Generic[UserDataT]):
 
     Attributes:
         data (Dict[str, UserDataT]): Dictionary mapping table names to data objects
+        metadata (Dict[str, Dict[str, Any]]): Load details per table name, e.g.
+            estimated and actual memory use (see :ref:`get_data`)
 
     Example:
         Creating:
@@ -33,6 +35,7 @@ class DataBundle(Generic[UserDataT]):
     """
 
     data: Dict[str, UserDataT] = field(default_factory=dict)
+    metadata: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     def __getitem__(self, key: str) -> UserDataT:
         """
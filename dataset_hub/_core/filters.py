@@ -0,0 +1,133 @@
+import operator
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+Filter = Tuple[str, str, Any]
+"""
+A row predicate ``(column, op, value)``, e.g. ``("Voltage", ">=", 240.0)``.
+A list of filters is a conjunction: rows must match every filter. This is the
+same form pyarrow accepts, so filters can be pushed down to Parquet readers.
+"""
+
+# Registry of supported operators and their pandas implementations
+_OPERATORS: Dict[str, Callable[[pd.Series, Any], pd.Series]] = {
+    "==": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda series, value: series.isin(value),
+    "not in": lambda series, value: ~series.isin(value),
+}
+
+
+def validate_filters(filters: Optional[Sequence[Sequence[Any]]]) -> List[Filter]:
+    """
+    Check and normalize a list of row filters.
+
+    Args:
+        filters (Sequence, optional): ``(column, op, value)`` triples; lists
+            (e.g. from YAML) are accepted as well as tuples.
+
+    Returns:
+        List[Filter]: Filters as tuples (empty if `filters` is None).
+
+    Raises:
+        ValueError: If a filter is malformed or uses an unknown operator.
+    """
+    normalized: List[Filter] = []
+    for filter_ in filters or []:
+        if isinstance(filter_, str) or len(filter_) != 3:
+            raise ValueError(
+                f"Filter must be a (column, op, value) triple, got {filter_!r}"
+            )
+        column, op, value = filter_
+        if op not in _OPERATORS:
+            raise ValueError(
+                f"Unsupported filter operator '{op}'. "
+                f"Supported operators: {list(_OPERATORS)}"
+            )
+        if op in ("in", "not in") and isinstance(value, (str, bytes)):
+            raise ValueError(f"Filter '{op}' needs a collection of values")
+        normalized.append((column, op, value))
+    return normalized
+
+
+def filter_columns(filters: Sequence[Filter]) -> List[str]:
+    """
+    Return the columns referenced by filters, in first-use order.
+
+    Args:
+        filters (Sequence[Filter]): Validated filters.
+
+    Returns:
+        List[str]: Column names.
+    """
+    return list(dict.fromkeys(column for column, _, _ in filters))
+
+
+def filters_expression(filters: Sequence[Filter]) -> Any:
+    """
+    Build the pyarrow expression equivalent to :func:`apply_filters`.
+
+    Used by every Arrow reader (Parquet pushdown, dataset scans, table
+    filters), so pandas and Arrow loads select the same rows. Unlike
+    ``pyarrow.parquet.filters_to_expression`` alone, ``not in`` does not
+    match missing values either.
+
+    Args:
+        filters (Sequence[Filter]): Validated, non-empty filters.
+
+    Returns:
+        pyarrow.compute.Expression: Conjunction of the filters.
+    """
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    expression = None
+    for filter_ in filters:
+        predicate = (
+            pq.filters_to_expression([filter_]) & pc.field(filter_[0]).is_valid()
+        )
+        expression = predicate if expression is None else expression & predicate
+    return expression
+
+
+def apply_filters(df: pd.DataFrame, filters: Sequence[Filter]) -> pd.DataFrame:
+    """
+    Keep the rows of `df` that match every filter.
+
+    Missing values never match, whatever the operator (also ``!=`` and
+    ``not in``), as in pyarrow filter expressions. A default ``RangeIndex``
+    is renumbered, so the result looks the same as a table read with the
+    filters pushed down.
+
+    Args:
+        df (pd.DataFrame): Table to filter.
+        filters (Sequence[Filter]): Validated filters.
+
+    Returns:
+        pd.DataFrame: Matching rows (`df` itself if there are no filters).
+
+    Raises:
+        ValueError: If a filter references a column missing from `df`.
+    """
+    if not filters:
+        return df
+
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        if column not in df.columns:
+            raise ValueError(f"Filter column '{column}' not found in the dataset")
+        series = df[column]
+        matches = _OPERATORS[op](series, value)
+        mask &= matches.astype("boolean").fillna(False).astype(bool)
+        mask &= series.notna()
+
+    result: pd.DataFrame = df[mask]
+    if isinstance(df.index, pd.RangeIndex):
+        result = result.reset_index(drop=True)
+    return result
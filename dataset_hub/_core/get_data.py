@@ -1,23 +1,59 @@
-from typing import Any, Optional
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+from dataset_hub._core import memory, tracing
 from dataset_hub._core.config_manager import ConfigManager
 from dataset_hub._core.data_bundle import DataBundle
+from dataset_hub._core.filters import Filter
+from dataset_hub._core.memory_cache import MEMORY_CACHE
 from dataset_hub._core.provider import ProviderFactory
-from dataset_hub._core.utils.logger import log_dataset_doc_doc_link
+from dataset_hub._core.provider.provider import Provider
+from dataset_hub._core.utils.logger import (
+    get_logger,
+    log_dataset_doc_doc_link,
+    log_dataset_doc_link,
+)
+
+logger = get_logger(__name__)
 
 
 @log_dataset_doc_doc_link()
 def get_data(
-    dataset_name: str, task_type: str, verbose: Optional[bool]
+    dataset_name: str,
+    task_type: str,
+    verbose: Optional[bool] = None,
+    chunksize: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    as_type: Optional[str] = None,
+    max_memory: Optional[int] = None,
 ) -> DataBundle[Any]:
     """
     Core backend function used by all `.get_<dataset_name>()` functions to load \
         datasets.
 
+    With the ``memory_cache_size`` option set, loaded datasets are kept in \
+    memory and repeated calls with the same arguments return protected copies \
+    without loading again (see :func:`cache_info`).
+
+    Every stage of the call is timed as a :class:`Span` passed to the \
+    callbacks registered with :func:`add_trace_callback` and, with the \
+    ``trace_path`` option, appended to a JSON-lines file.
+
+    With a ``max_memory`` budget (argument or option), table sizes are \
+    estimated before parsing (``estimated_bytes`` in ``DataBundle.metadata``); if they exceed \
+    the budget, tables that can be read incrementally are returned as \
+    iterators of chunks (``chunked``, ``chunksize``) instead of being loaded \
+    at once. With a budget set or tracing enabled, the metadata and the \
+    ``load`` spans also report the actual memory use of every table \
+    (``memory_bytes``, ``memory_usage(deep=True)`` for DataFrames) and the \
+    process peak RSS after loading (``peak_rss_bytes``).
+
     This function:
         1. Loads the dataset configuration using :ref:`ConfigFactory`.
-        2. Instantiates the appropriate Provider via :ref:`ProviderFactory`.
-        3. Loads the dataset using :ref:`providers`.
+        2. Instantiates one Provider per dataset part via :ref:`ProviderFactory`.
+        3. Loads all parts concurrently using :ref:`providers`.
         4. ``(optional)`` Logs a link to the dataset documentation once per session \
             if verbose is enabled (either via argument or :ref:`settings`).
 
@@ -27,6 +63,24 @@ def get_data(
         task_type (str): The type of task (e.g., "classification", "regression").
         verbose (bool, optional): Whether to print dataset information and \
             documentation link. If None, the global library setting is used.
+        chunksize (int, optional): If given, every table is returned as a lazy \
+            iterator of chunks of at most `chunksize` rows instead of being \
+            loaded at once (see :meth:`Provider.iter_chunks`). The stages run \
+            while iterating are traced as children of this call's \
+            ``get_data`` span.
+        columns (List[str], optional): Columns to return. Other columns are \
+            not parsed where the source format allows it.
+        filters (List[Tuple[str, str, Any]], optional): Row predicates \
+            ``(column, op, value)`` with op in ``==, !=, <, <=, >, >=, in, \
+            not in``; only rows matching all of them are returned.
+        as_type (str, optional): Output container of every table, overriding \
+            the ``as_type`` of the dataset config: ``"pd.DataFrame"``, \
+            ``"pa.Table"`` or ``"pa.RecordBatchReader"`` (the Arrow types \
+            require ``pyarrow``). With `chunksize`, Arrow tables are returned \
+            as iterators of ``pyarrow.RecordBatch``.
+        max_memory (int, optional): Memory budget in bytes for this call, \
+            overriding the ``max_memory`` option. Tables estimated to exceed \
+            it are returned as iterators of chunks (see above).
 
     Returns:
         DataBundle: A consistent wrapper containing the loaded data.
@@ -35,13 +89,369 @@ def get_data(
 
             dataset = get_data("titanic", "classification")
             df = dataset["data"]  # pd.DataFrame
-            
+
+            dataset = get_data("household_power", "timeseries", chunksize=100_000)
+            for chunk in dataset["data"]:  # pd.DataFrame of <= 100_000 rows
+                ...
+
+            dataset = get_data(
+                "household_power",
+                "timeseries",
+                columns=["Date", "Voltage"],
+                filters=[("Voltage", ">=", 240.0)],
+            )
+
+            dataset = get_data("titanic", "classification", as_type="pa.Table")
+            table = dataset["data"]  # pyarrow.Table
+
     Raises:
-        FileNotFoundError: If the dataset configuration YAML file is not found.
+        FileNotFoundError: If the dataset has no bundled configuration.
         ValueError: If the provider type is unknown or misconfigured.
+        MemoryError: If a ``max_memory`` budget is set and the tables that \
+            cannot be read in chunks are estimated to exceed it.
+    """
+    with tracing.span("get_data", dataset=dataset_name, task_type=task_type) as span:
+        key = None
+        if chunksize is None:
+            key = MEMORY_CACHE.build_key(
+                dataset_name, task_type, columns, filters, as_type, max_memory
+            )
+            cached = MEMORY_CACHE.get(key)
+            span.attributes["memory_cache_hit"] = cached is not None
+            if cached is not None:
+                return cached
+
+        with tracing.span("config", dataset=dataset_name, task_type=task_type):
+            config = ConfigManager.load_config(dataset_name, task_type)
+            providers = _build_providers(config, columns, filters, as_type)
+        if chunksize is not None:
+            # Chunks are read after this span ends; their spans join its trace
+            return DataBundle(
+                {
+                    table: tracing.iterate_in_context(provider.iter_chunks(chunksize))
+                    for table, provider in providers.items()
+                },
+                {
+                    table: {"chunked": True, "chunksize": chunksize}
+                    for table in providers
+                },
+            )
+        plans = _plan_memory(providers, max_memory)
+        bundle = DataBundle(load_parts(providers, plans), plans)
+        # Bundles with chunked tables are not cached (their size is unknown)
+        MEMORY_CACHE.put(key, bundle)
+        return bundle
+
+
+async def aget_data(
+    dataset_name: str,
+    task_type: str,
+    verbose: Optional[bool] = None,
+    executor: Optional[Executor] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    as_type: Optional[str] = None,
+    max_memory: Optional[int] = None,
+) -> DataBundle[Any]:
     """
-    config = ConfigManager.load_config(dataset_name, task_type)
-    provider = ProviderFactory.build_provider(config["provider"])
-    data = provider.load()
+    Asynchronous counterpart of :ref:`get_data` for asyncio applications.
+
+    The event loop is never blocked: the configuration is read and the source
+    downloaded in worker threads, and parsing runs in `executor`. Many calls
+    can therefore overlap in one process (see :func:`aget_many`).
+
+    Args:
+        dataset_name (str): The name of the dataset (corresponding to the \
+            YAML config file).
+        task_type (str): The type of task (e.g., "classification", "regression").
+        verbose (bool, optional): Whether to print the documentation link. If \
+            None, the global library setting is used.
+        executor (Executor, optional): Executor for parsing (e.g. a small \
+            ``ThreadPoolExecutor`` to bound CPU use). Default is the event \
+            loop's default thread pool.
+        columns (List[str], optional): Columns to return (see :ref:`get_data`).
+        filters (List[Tuple[str, str, Any]], optional): Row predicates (see \
+            :ref:`get_data`).
+        as_type (str, optional): Output container (see :ref:`get_data`).
+        max_memory (int, optional): Memory budget in bytes (see \
+            :ref:`get_data`).
+
+    Returns:
+        DataBundle: A consistent wrapper containing the loaded data.
+
+        Example::
+
+            dataset = await aget_data("titanic", "classification")
+            df = dataset["data"]  # pd.DataFrame
+
+    Raises:
+        FileNotFoundError: If the dataset has no bundled configuration.
+        ValueError: If the provider type is unknown or misconfigured.
+        MemoryError: If the ``max_memory`` budget cannot be met (see \
+            :ref:`get_data`).
+    """
+    with tracing.span("get_data", dataset=dataset_name, task_type=task_type) as span:
+        key = MEMORY_CACHE.build_key(
+            dataset_name, task_type, columns, filters, as_type, max_memory
+        )
+        bundle = MEMORY_CACHE.get(key)
+        span.attributes["memory_cache_hit"] = bundle is not None
+        if bundle is None:
+            with tracing.span("config", dataset=dataset_name, task_type=task_type):
+                config = await asyncio.to_thread(
+                    ConfigManager.load_config, dataset_name, task_type
+                )
+                providers = _build_providers(config, columns, filters, as_type)
+            plans = await asyncio.to_thread(
+                tracing.run_in_context(_plan_memory), providers, max_memory
+            )
+            tables = await asyncio.gather(
+                *(
+                    _aload_table(table, provider, executor, plans[table])
+                    for table, provider in providers.items()
+                )
+            )
+            bundle = DataBundle(dict(zip(providers, tables)), plans)
+            MEMORY_CACHE.put(key, bundle)
+
+    log_dataset_doc_link(dataset_name, task_type, verbose)
+    return bundle
+
+
+async def aget_many(
+    datasets: Iterable[Tuple[str, str]],
+    verbose: Optional[bool] = None,
+    executor: Optional[Executor] = None,
+    return_exceptions: bool = False,
+) -> List[Union[DataBundle[Any], BaseException]]:
+    """
+    Load several datasets concurrently with :func:`aget_data`.
+
+    Args:
+        datasets (Iterable[Tuple[str, str]]): ``(dataset_name, task_type)`` pairs.
+        verbose (bool, optional): Passed to every :func:`aget_data` call.
+        executor (Executor, optional): Executor shared by all parsing steps.
+        return_exceptions (bool): As in :func:`asyncio.gather`: if True, a \
+            failed load is returned in place of its bundle instead of raising.
+
+    Returns:
+        List[DataBundle]: Bundles in the order of `datasets`.
+
+        Example::
+
+            iris, titanic = await aget_many(
+                [("iris", "classification"), ("titanic", "classification")]
+            )
+    """
+    return await asyncio.gather(
+        *(
+            aget_data(dataset_name, task_type, verbose, executor)
+            for dataset_name, task_type in datasets
+        ),
+        return_exceptions=return_exceptions,
+    )
+
 
-    return DataBundle({"data": data})
+def load_parts(
+    providers: Dict[str, Provider[Any]],
+    plans: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Load the tables of a dataset, in parallel when there are several.
+
+    Each part is downloaded and parsed on its own thread, so a dataset with
+    train/test/metadata tables loads in about the time of its largest part.
+
+    Args:
+        providers (Dict[str, Provider]): Mapping of table name to Provider.
+        plans (Dict[str, Dict[str, Any]], optional): Per-table metadata from
+            :func:`_plan_memory`; tables with a ``chunksize`` are returned as
+            iterators of chunks. Load details are added to it.
+
+    Returns:
+        Dict[str, Any]: Mapping of table name to loaded data, in the order of
+        `providers`.
+    """
+    if plans is None:
+        plans = {table: {} for table in providers}
+    if len(providers) == 1:
+        return {
+            table: _load_table(table, provider, plans[table])
+            for table, provider in providers.items()
+        }
+
+    with ThreadPoolExecutor(max_workers=len(providers)) as pool:
+        futures = {
+            table: pool.submit(
+                tracing.run_in_context(_load_table), table, provider, plans[table]
+            )
+            for table, provider in providers.items()
+        }
+        return {table: future.result() for table, future in futures.items()}
+
+
+def _plan_memory(
+    providers: Dict[str, Provider[Any]], max_memory: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Decide which tables to load in chunks to honor the ``max_memory`` budget.
+
+    Table sizes are estimated (in parallel for several tables). If their sum
+    exceeds the budget, every streamable table is assigned a chunk size whose
+    chunks use a fraction of the budget. Tables without an estimate are
+    assumed to fit.
+
+    Args:
+        providers (Dict[str, Provider]): Mapping of table name to Provider.
+        max_memory (int, optional): Budget of the call; if None, the
+            ``max_memory`` option is used.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Per-table metadata with ``estimated_bytes``
+        and, for tables to load in chunks, ``chunksize``. Empty dicts when no
+        budget is set.
+
+    Raises:
+        ValueError: If the budget is invalid.
+        MemoryError: If the tables that cannot be read in chunks are estimated
+            to exceed the budget.
+    """
+    plans: Dict[str, Dict[str, Any]] = {table: {} for table in providers}
+    budget = memory.max_memory(max_memory)
+    if budget is None:
+        return plans
+
+    if len(providers) == 1:
+        estimates = {
+            table: _estimate_table(table, provider)
+            for table, provider in providers.items()
+        }
+    else:
+        with ThreadPoolExecutor(max_workers=len(providers)) as pool:
+            futures = {
+                table: pool.submit(
+                    tracing.run_in_context(_estimate_table), table, provider
+                )
+                for table, provider in providers.items()
+            }
+            estimates = {table: future.result() for table, future in futures.items()}
+
+    known = {table: e for table, e in estimates.items() if e is not None}
+    for table, estimate in estimates.items():
+        plans[table]["estimated_bytes"] = estimate.bytes if estimate else None
+    total = sum(estimate.bytes for estimate in known.values())
+    if total <= budget:
+        return plans
+
+    in_memory = sum(e.bytes for e in known.values() if not e.streamable)
+    if in_memory > budget:
+        raise MemoryError(
+            f"Tables that cannot be read in chunks need an estimated "
+            f"{in_memory} bytes, over the max_memory budget of {budget} bytes"
+        )
+    for table, estimate in known.items():
+        if estimate.streamable:
+            plans[table]["chunksize"] = estimate.chunk_rows(budget)
+            logger.warning(
+                f"Table '{table}' needs an estimated {estimate.bytes} bytes, "
+                f"over the max_memory budget of {budget} bytes; returning it "
+                f"in chunks of {plans[table]['chunksize']} rows"
+            )
+    return plans
+
+
+def _estimate_table(
+    table: str, provider: Provider[Any]
+) -> Optional[memory.MemoryEstimate]:
+    """Estimate the memory size of one table inside an ``estimate`` span."""
+    with tracing.span("estimate", table=table) as span:
+        estimate = provider.estimate_memory()
+        if estimate is not None:
+            span.attributes.update(bytes=estimate.bytes, rows=estimate.rows)
+        return estimate
+
+
+def _load_table(table: str, provider: Provider[Any], plan: Dict[str, Any]) -> Any:
+    """
+    Load one table inside a ``load`` tracing span, in chunks if `plan` has a
+    ``chunksize``, and record its memory use in `plan`.
+    """
+    with tracing.span("load", table=table, provider=type(provider).__name__) as span:
+        chunksize = plan.get("chunksize")
+        if chunksize:
+            value = tracing.iterate_in_context(provider.iter_chunks(chunksize))
+        else:
+            value = provider.load()
+        _record_memory(plan, value)
+        span.attributes.update(plan)
+        return value
+
+
+async def _aload_table(
+    table: str,
+    provider: Provider[Any],
+    executor: Optional[Executor],
+    plan: Dict[str, Any],
+) -> Any:
+    """Load one table asynchronously inside a ``load`` tracing span."""
+    with tracing.span("load", table=table, provider=type(provider).__name__) as span:
+        chunksize = plan.get("chunksize")
+        if chunksize:
+            value = tracing.iterate_in_context(provider.iter_chunks(chunksize))
+        else:
+            value = await provider.aload(executor)
+        _record_memory(plan, value)
+        span.attributes.update(plan)
+        return value
+
+
+def _record_memory(plan: Dict[str, Any], value: Any) -> None:
+    """
+    Add the actual memory use of a loaded table to its metadata, if a budget
+    or a trace consumer needs it (measuring object columns scans every value).
+    """
+    plan["chunked"] = bool(plan.get("chunksize"))
+    if "estimated_bytes" in plan or tracing.is_enabled():
+        plan["memory_bytes"] = memory.table_nbytes(value)
+        plan["peak_rss_bytes"] = memory.peak_rss()
+
+
+def _build_providers(
+    config: Dict[str, Any],
+    columns: Optional[List[str]],
+    filters: Optional[List[Filter]],
+    as_type: Optional[str] = None,
+) -> Dict[str, Provider[Any]]:
+    """
+    Build the providers of a dataset, applying a column/row selection and an
+    output container to each.
+
+    Args:
+        config (Dict[str, Any]): Configuration from :class:`ConfigManager`.
+        columns (List[str], optional): Columns to return from every table.
+        filters (List[Filter], optional): Row predicates for every table.
+        as_type (str, optional): Output container for every table.
+
+    Returns:
+        Dict[str, Provider]: Mapping of table name to Provider.
+    """
+    providers_config: Dict[str, Dict[str, Any]] = config["providers"]
+    if columns is not None or filters is not None:
+        selection = {"columns": columns, "filters": filters}
+        providers_config = {
+            table: {**provider, "params": {**provider["params"], **selection}}
+            for table, provider in providers_config.items()
+        }
+    if as_type is not None:
+        provider_type, output_params = ConfigManager.resolve_as_type(as_type)
+        providers_config = {
+            table: {
+                "type": provider_type,
+                "params": {
+                    **{k: v for k, v in provider["params"].items() if k != "output"},
+                    **output_params,
+                },
+            }
+            for table, provider in providers_config.items()
+        }
+    return ProviderFactory.build_providers(providers_config)
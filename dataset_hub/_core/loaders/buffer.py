@@ -1,11 +1,39 @@
+import mmap
+import os
 from dataclasses import dataclass
-from typing import Dict, Type, TypeVar
+from typing import Dict, Type, TypeVar, Union
+
+BytesLike = Union[bytes, bytearray, memoryview, mmap.mmap]
+"""Payload types a Buffer can hold without copying."""
 
 
 @dataclass
 class Buffer:
+    """Named binary payload produced by a :class:`SourceLoader`.
+
+    `data` is kept as given: ``bytes``, a ``memoryview`` (e.g. over a
+    ``bytearray``) or a read-only ``mmap`` of a file on disk. Use
+    :attr:`view` for zero-copy access regardless of the backing type.
+    """
+
+    __slots__ = ("name", "data")
+
     name: str
-    data: bytes
+    data: BytesLike
+
+    @property
+    def view(self) -> memoryview:
+        """Read-only memoryview over the payload (no copy)."""
+        return memoryview(self.data).toreadonly()
+
+    def __len__(self) -> int:
+        """Return the payload size in bytes."""
+        return memoryview(self.data).nbytes
+
+    def close(self) -> None:
+        """Release a file mapping backing the payload, if any."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
 
 
 BufferT = TypeVar("BufferT", bound=Buffer)
@@ -13,6 +41,8 @@ BufferT = TypeVar("BufferT", bound=Buffer)
 
 @dataclass
 class AudioBuffer(Buffer):
+    __slots__ = ("sample_rate", "channels", "duration", "format")
+
     sample_rate: int
     channels: int
     duration: float
@@ -21,6 +51,8 @@ class AudioBuffer(Buffer):
 
 @dataclass
 class ImageBuffer(Buffer):
+    __slots__ = ("width", "height", "channels", "format")
+
     width: int
     height: int
     channels: int
@@ -35,7 +67,7 @@ class ArchiveBuffer(Buffer):
     to distinguish archive buffers from generic buffers.
     """
 
-    pass
+    __slots__ = ()
 
 
 class BufferFactory:
@@ -57,12 +89,15 @@ class BufferFactory:
     }
 
     @classmethod
-    def build(cls, name: str, data: bytes) -> Buffer:
+    def build(cls, name: str, data: BytesLike) -> Buffer:
         """Create a Buffer (or subclass) for the given filename and bytes.
 
+        The payload is never copied: ``bytes`` and ``mmap`` objects are kept
+        as they are, and a ``bytearray`` is wrapped in a ``memoryview``.
+
         Args:
             name: Filename including extension (must be non-empty).
-            data: Raw bytes (must be non-empty).
+            data: Raw bytes, bytearray, memoryview or mmap (must be non-empty).
 
         Returns:
             Buffer: Instance of a Buffer subclass selected by extension.
@@ -72,12 +107,38 @@ class BufferFactory:
         """
         if not name or not isinstance(name, str):
             raise ValueError("buffer name must be a non-empty string")
-        if not data or not isinstance(data, (bytes, bytearray)):
+        if not isinstance(data, (bytes, bytearray, memoryview, mmap.mmap)) or not len(
+            data
+        ):
             raise ValueError("buffer data must be non-empty bytes")
+        if isinstance(data, bytearray):
+            data = memoryview(data)
 
         # Quick extension detection (use last suffix)
         ext = name.rsplit(".", 1)[-1].lower() if "." in name else ""
 
         buffer = cls._REGISTRY[ext]
 
-        return buffer(name=name, data=bytes(data))
+        return buffer(name=name, data=data)
+
+    @classmethod
+    def from_file(cls, path: Union[str, "os.PathLike[str]"]) -> Buffer:
+        """Create a Buffer backed by a read-only memory map of a file.
+
+        The file is not read into memory; pages are loaded on access. Call
+        :meth:`Buffer.close` to release the mapping early.
+
+        Args:
+            path: Path to a non-empty file; its name selects the Buffer class.
+
+        Returns:
+            Buffer: Instance of a Buffer subclass selected by extension.
+
+        Raises:
+            ValueError: If the file is empty.
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("buffer data must be non-empty bytes")
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.build(os.path.basename(path), data)
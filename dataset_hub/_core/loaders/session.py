@@ -0,0 +1,89 @@
+import threading
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from dataset_hub._core.settings.loader import load_settings
+
+_session: Optional[requests.Session] = None
+_session_key: Optional[Tuple[int, int]] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the library-wide HTTP session shared by all loaders.
+
+    The session keeps connections alive in a pool, so consecutive downloads
+    from the same host (e.g. raw.githubusercontent.com) reuse TCP/TLS
+    connections instead of repeating the handshakes. It is created lazily and
+    rebuilt when the ``http_pool_size`` or ``http_retries`` settings change.
+    Creation is guarded by a lock, so the function is safe to call from
+    multiple threads.
+
+    Returns:
+        requests.Session: Shared session with a pooled, retrying adapter.
+    """
+    global _session, _session_key
+
+    settings = load_settings()
+    key = (int(settings["http_pool_size"]), int(settings["http_retries"]))
+
+    with _session_lock:
+        if _session is None or _session_key != key:
+            # The previous session is not closed: other threads may still be
+            # streaming from it. Its pool is released once it is collected.
+            _session = _build_session(*key)
+            _session_key = key
+        return _session
+
+
+def get_timeout() -> float:
+    """
+    Return the timeout in seconds applied to every HTTP request.
+
+    Returns:
+        float: Value of the ``http_timeout`` setting.
+    """
+    return float(load_settings()["http_timeout"])
+
+
+def close_session() -> None:
+    """Close the shared session and release its pooled connections."""
+    global _session, _session_key
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_key = None
+
+
+def _build_session(pool_size: int, retries: int) -> requests.Session:
+    """
+    Build a session whose adapters pool connections and retry transient errors.
+
+    Args:
+        pool_size (int): Maximum number of kept-alive connections per host.
+        retries (int): Number of retries on connection errors and 429/5xx
+            responses for idempotent requests.
+
+    Returns:
+        requests.Session: Newly configured session.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 from .buffer import Buffer
@@ -14,3 +15,13 @@ class SourceLoader(ABC):
             Buffer: The loaded buffer data.
         """
         pass
+
+    async def aload(self) -> Buffer:
+        """Load data from source without blocking the running event loop.
+
+        The default implementation runs :meth:`load` in a worker thread.
+
+        Returns:
+            Buffer: The loaded buffer data.
+        """
+        return await asyncio.to_thread(self.load)
@@ -1,51 +1,521 @@
+import json
+import mmap
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import BinaryIO, Dict, Mapping, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
 
+from dataset_hub._core import tracing
+from dataset_hub._core.settings.loader import load_settings
+from dataset_hub._core.utils.logger import get_logger
+
 from .buffer import Buffer, BufferFactory
+from .session import get_session, get_timeout
 from .source_loader import SourceLoader
 
+logger = get_logger(__name__)
+
 
 class UrlLoader(SourceLoader):
-    """Loader for downloading data from HTTP/HTTPS URLs."""
+    """Loader for downloading data from HTTP/HTTPS URLs.
+
+    Responses are always streamed in fixed-size chunks, so a download never
+    holds more than one chunk in memory on top of its destination (a file for
+    `download`, a memory-mapped temporary file for `load`). Requests go
+    through the shared pooled session (see :func:`get_session`).
+    """
 
-    def __init__(self, url: str) -> None:
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, url: str, chunk_size: int = CHUNK_SIZE) -> None:
         """Initialize URL loader.
 
         Args:
             url: The URL to download from.
+            chunk_size: Size in bytes of the chunks read from the response.
 
         Raises:
             ValueError: If URL is empty or invalid.
         """
         if not url or not isinstance(url, str):
             raise ValueError("URL must be a non-empty string")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
         self.url = url
+        self.chunk_size = chunk_size
 
     def load(self) -> Buffer:
         """Download data from URL and return as a Buffer subclass.
 
+        The response is spooled to an anonymous temporary file, which is
+        memory-mapped read-only instead of being read back, so the payload is
+        never copied into the process heap (see :meth:`Buffer.close`).
+
         Returns:
             Buffer: The downloaded data wrapped by a Buffer subclass.
         """
+        # Extract filename from URL (we assume caller-provided URLs include a filename)
+        name = self._extract_filename(self.url)
+        if not name:
+            raise ValueError("URL must contain a filename")
+
+        with tracing.span("download", url=self.url) as span:
+            with tempfile.TemporaryFile() as f:
+                size = self._stream_response(self._get(), f)
+                if not size:
+                    raise ValueError(f"Empty response from {self.url}")
+                f.flush()
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            span.attributes["bytes"] = size
+
+        buffer = BufferFactory.build(name, data)
+        return buffer
+
+    def download(self, path: Path) -> Path:
+        """Download data from URL into a local file.
+
+        The body is written into '<path>.part', which is renamed to `path`
+        atomically once complete. Two strategies are used:
+
+        - Segmented: a fresh download starts with a plain GET. If its
+          headers announce at least ``segmented_download_threshold`` bytes
+          and ``Accept-Ranges: bytes``, the file is preallocated and
+          ``download_segments`` ranges are fetched concurrently, the first
+          one from the body of that GET (see :meth:`_download_segments`).
+          Smaller sources are streamed from the same response, so they cost
+          a single request. Any failure falls back to the sequential
+          strategy.
+        - Sequential, resumable: if an earlier attempt left a partial file,
+          only the missing bytes are requested with ``Range: bytes=N-``,
+          guarded by ``If-Range`` with the ETag or Last-Modified validator
+          saved by that attempt. When the server ignores the range or the
+          validator no longer matches, the file is fetched from scratch. On
+          failure the '.part' file is kept for the next attempt.
+
+        The ETag/Last-Modified validators of the finished file are kept in
+        '<path>.meta.json' for later conditional requests (see
+        :meth:`revalidate`).
+
+        Processes sharing a directory must serialize downloads of the same
+        `path` (see :meth:`CacheManager.fetch`).
+
+        Args:
+            path: Destination file path.
+
+        Returns:
+            Path: The destination path.
+
+        Raises:
+            requests.RequestException: If the request fails or the body is
+                shorter than announced.
+            ValueError: If the response body is empty.
+        """
+        with tracing.span("download", url=self.url) as span:
+            self._download(path, span)
+        return path
+
+    def _download(self, path: Path, span: tracing.Span) -> None:
+        """Body of :meth:`download`, run inside its ``download`` tracing span.
+
+        Args:
+            path: Destination file path.
+            span: Span receiving the ``strategy`` and ``bytes`` attributes.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = path.with_name(path.name + ".part")
+        meta_path = path.with_name(path.name + ".part.json")
+
+        resumed_from = part_path.stat().st_size if part_path.exists() else 0
+        if resumed_from:
+            self._download_sequential(part_path, meta_path)
+        else:
+            response = self._get({"Accept-Encoding": "identity"})
+            size = self._segmented_size(response)
+            if size is None:
+                self._write_validators(meta_path, response.headers)
+                self._save_response(response, part_path, meta_path, offset=0)
+            else:
+                headers = response.headers
+                try:
+                    self._download_segments(
+                        part_path, size, self._if_range(headers), response
+                    )
+                except requests.RequestException as e:
+                    logger.warning(f"Segmented download failed ({e}), retrying")
+                    part_path.unlink(missing_ok=True)
+                    self._download_sequential(part_path, meta_path)
+                else:
+                    self._write_validators(meta_path, headers)
+                    os.replace(part_path, path)
+                    os.replace(meta_path, self.meta_path(path))
+                    span.attributes.update(strategy="segmented", bytes=size)
+                    return
+
+        os.replace(part_path, path)
+        os.replace(meta_path, self.meta_path(path))
+        span.attributes.update(
+            strategy="sequential", bytes=path.stat().st_size, resumed_from=resumed_from
+        )
+
+    def revalidate(self, path: Path) -> bool:
+        """Refresh a downloaded file if it changed upstream.
+
+        Sends a conditional GET with ``If-None-Match`` / ``If-Modified-Since``
+        built from the validators saved by :meth:`download`. A 304 response
+        leaves the file untouched; a 200 response replaces it atomically.
+        Without saved validators the file is downloaded again. The request
+        is traced as a ``download`` span with the ``bytes`` received.
+
+        Args:
+            path: File previously written by :meth:`download`.
+
+        Returns:
+            bool: True if the file was replaced, False if it is up to date.
+
+        Raises:
+            requests.RequestException: If the request fails.
+            ValueError: If the response body is empty.
+        """
+        validators = self._read_validators(self.meta_path(path))
+        headers = {"Accept-Encoding": "identity"}
+        if validators.get("etag"):
+            headers["If-None-Match"] = str(validators["etag"])
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = str(validators["last_modified"])
+
+        with tracing.span("download", url=self.url, strategy="revalidate") as span:
+            response = self._get(headers, allowed_statuses=(304,))
+            if response.status_code == 304:
+                response.close()
+                span.attributes["bytes"] = 0
+                return False
+
+            part_path = path.with_name(path.name + ".part")
+            meta_path = path.with_name(path.name + ".part.json")
+            self._write_validators(meta_path, response.headers)
+            self._save_response(response, part_path, meta_path, offset=0)
+            os.replace(part_path, path)
+            os.replace(meta_path, self.meta_path(path))
+            span.attributes["bytes"] = path.stat().st_size
+        return True
+
+    @staticmethod
+    def meta_path(path: Path) -> Path:
+        """Return the sidecar file holding the HTTP validators of `path`."""
+        return path.with_name(path.name + ".meta.json")
+
+    def _download_sequential(self, part_path: Path, meta_path: Path) -> None:
+        """Stream the body into `part_path`, resuming it if possible.
+
+        Args:
+            part_path: Partial file, appended to when the server honors the
+                range request.
+            meta_path: Sidecar file holding the validator of `part_path`.
+
+        Raises:
+            requests.RequestException: If the request fails or the body is
+                shorter than announced.
+            ValueError: If the response body is empty.
+        """
+        headers = {"Accept-Encoding": "identity"}
+
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        validator = self._if_range(self._read_validators(meta_path)) if offset else None
+
+        resumed = False
+        if validator:
+            range_headers = {
+                **headers,
+                "Range": f"bytes={offset}-",
+                "If-Range": validator,
+            }
+            response = self._get(range_headers, allowed_statuses=(416,))
+            if response.status_code == 206 and self._range_start(response) == offset:
+                resumed = True
+            elif response.status_code != 200:
+                # 416 (nothing left to send) or a range we did not ask for:
+                # the partial file cannot be trusted, start over.
+                response.close()
+                response = self._get(headers)
+        else:
+            response = self._get(headers)
+
+        if not resumed:
+            offset = 0
+            self._write_validators(meta_path, response.headers)
+
+        self._save_response(response, part_path, meta_path, offset)
+
+    def _save_response(
+        self,
+        response: requests.Response,
+        part_path: Path,
+        meta_path: Path,
+        offset: int,
+    ) -> None:
+        """Write a response body into `part_path` and check its length.
+
+        Args:
+            response: Response opened with ``stream=True``.
+            part_path: Partial file; the body is appended when `offset` > 0.
+            meta_path: Sidecar validator file, removed with an empty body.
+            offset: Number of bytes already present in `part_path`.
+
+        Raises:
+            requests.RequestException: If the body is shorter than announced.
+            ValueError: If the response body is empty.
+        """
+        expected = self._content_length(response)
+        with open(part_path, "ab" if offset else "wb") as f:
+            written = self._stream_response(response, f)
+
+        if not offset + written:
+            part_path.unlink(missing_ok=True)
+            meta_path.unlink(missing_ok=True)
+            raise ValueError(f"Empty response from {self.url}")
+        if expected is not None and written != expected:
+            raise requests.RequestException(
+                f"Incomplete download from {self.url}: "
+                f"got {written} of {expected} bytes"
+            )
+
+    def _segmented_size(self, response: requests.Response) -> Optional[int]:
+        """Check from the headers of a full GET whether to download in segments.
+
+        Args:
+            response: Unread 200 response for the whole resource.
+
+        Returns:
+            int, optional: Resource size, or None if segments are disabled,
+            the resource is too small or of unknown size, or the server does
+            not accept byte ranges.
+        """
+        settings = load_settings()
+        segments = int(settings["download_segments"])
+        threshold = int(settings["segmented_download_threshold"])
+        if segments < 2 or response.status_code != 200:
+            return None
+
+        size = self._content_length(response)
+        if response.headers.get("Accept-Ranges") != "bytes" or size is None:
+            return None
+        if size < max(threshold, segments):
+            return None
+        return size
+
+    def _download_segments(
+        self,
+        part_path: Path,
+        size: int,
+        validator: Optional[str],
+        first: requests.Response,
+    ) -> None:
+        """Fetch byte ranges concurrently into a preallocated `part_path`.
+
+        The first range is read from the body of the initial full GET, which
+        is closed once it is written. Each other range request carries
+        ``If-Range``, so a resource that changes mid-download is detected
+        (the server answers 200) instead of mixing bytes of two versions.
+
+        Args:
+            part_path: File to preallocate and fill.
+            size: Total resource size in bytes.
+            validator: ETag or Last-Modified value from the initial response.
+            first: Unread initial response, consumed for the first range.
+
+        Raises:
+            requests.RequestException: If any range fails, is not honored, or
+                the assembled file does not have the expected size.
+        """
+        segments = int(load_settings()["download_segments"])
+        starts = [i * size // segments for i in range(segments)]
+        ends = [start - 1 for start in starts[1:]] + [size - 1]
+
         try:
-            response = requests.get(self.url, timeout=30)
-            response.raise_for_status()
+            with open(part_path, "wb") as f:
+                f.truncate(size)
+        except OSError:
+            first.close()
+            raise
+
+        with ThreadPoolExecutor(max_workers=segments) as pool:
+            responses = [first, *repeat(None, segments - 1)]
+            written = sum(
+                pool.map(
+                    self._download_segment,
+                    repeat(part_path),
+                    starts,
+                    ends,
+                    repeat(validator),
+                    responses,
+                )
+            )
+
+        if written != size or part_path.stat().st_size != size:
+            raise requests.RequestException(
+                f"Incomplete download from {self.url}: got {written} of {size} bytes"
+            )
+
+    def _download_segment(
+        self,
+        part_path: Path,
+        start: int,
+        end: int,
+        validator: Optional[str],
+        response: Optional[requests.Response] = None,
+    ) -> int:
+        """Fetch bytes `start`..`end` (inclusive) into `part_path` at `start`.
+
+        Args:
+            part_path: Preallocated destination file.
+            start: First byte position.
+            end: Last byte position.
+            validator: ``If-Range`` value.
+            response: Full response whose body starts at `start`; if given,
+                no request is sent and the rest of its body is discarded.
+
+        Returns:
+            int: Number of bytes written.
+
+        Raises:
+            requests.RequestException: If the range is not honored or short.
+        """
+        if response is None:
+            headers = {"Accept-Encoding": "identity", "Range": f"bytes={start}-{end}"}
+            if validator:
+                headers["If-Range"] = validator
+            response = self._get(headers)
+            if response.status_code != 206 or self._range_start(response) != start:
+                response.close()
+                raise requests.RequestException(
+                    f"Range {start}-{end} not honored by {self.url}"
+                )
+
+        with open(part_path, "r+b") as f:
+            f.seek(start)
+            written = self._stream_response(response, f, limit=end - start + 1)
+
+        if written != end - start + 1:
+            raise requests.RequestException(
+                f"Incomplete range {start}-{end} from {self.url}: got {written} bytes"
+            )
+        return written
+
+    def _stream_response(
+        self, response: requests.Response, f: BinaryIO, limit: Optional[int] = None
+    ) -> int:
+        """Stream a response body into a writable binary file.
+
+        Args:
+            response: Response opened with ``stream=True``.
+            f: Destination file object.
+            limit: Maximum number of bytes to write; the rest of the body is
+                discarded when the response is closed.
+
+        Returns:
+            int: Number of bytes written.
+
+        Raises:
+            requests.RequestException: If the connection fails mid-body.
+        """
+        written = 0
+        try:
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                if limit is not None:
+                    chunk = chunk[: limit - written]
+                f.write(chunk)
+                written += len(chunk)
+                if limit is not None and written >= limit:
+                    break
         except requests.RequestException as e:
             raise requests.RequestException(
                 f"Failed to download from {self.url}: {e}"
             ) from e
+        finally:
+            response.close()
 
-        if not response.content:
-            raise ValueError(f"Empty response from {self.url}")
+        return written
 
-        # Extract filename from URL (we assume caller-provided URLs include a filename)
-        name = self._extract_filename(self.url)
-        if not name:
-            raise ValueError("URL must contain a filename")
+    def _get(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        allowed_statuses: Tuple[int, ...] = (),
+    ) -> requests.Response:
+        """Open a streaming HTTP request and check its status.
 
-        buffer = BufferFactory.build(name, response.content)
-        return buffer
+        Args:
+            headers: Extra request headers.
+            allowed_statuses: Error statuses returned to the caller instead
+                of raising.
+
+        Returns:
+            requests.Response: Successful response with an unread body.
+
+        Raises:
+            requests.RequestException: If the request fails.
+        """
+        try:
+            response = get_session().get(
+                self.url, headers=headers, stream=True, timeout=get_timeout()
+            )
+            if response.status_code not in allowed_statuses:
+                response.raise_for_status()
+        except requests.RequestException as e:
+            raise requests.RequestException(
+                f"Failed to download from {self.url}: {e}"
+            ) from e
+
+        return response
+
+    @staticmethod
+    def _content_length(response: requests.Response) -> Optional[int]:
+        """Return the announced body size, if it can be checked after decoding."""
+        length = response.headers.get("Content-Length")
+        encoding = response.headers.get("Content-Encoding", "identity")
+        if length is None or encoding != "identity":
+            return None
+        return int(length)
+
+    @staticmethod
+    def _range_start(response: requests.Response) -> Optional[int]:
+        """Return the first byte position of a 206 response's Content-Range."""
+        match = re.match(r"bytes (\d+)-", response.headers.get("Content-Range", ""))
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def _read_validators(meta_path: Path) -> Dict[str, Optional[str]]:
+        """Return the ETag/Last-Modified validators saved in `meta_path`."""
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return {"etag": meta.get("etag"), "last_modified": meta.get("last_modified")}
+
+    @staticmethod
+    def _write_validators(meta_path: Path, headers: Mapping[str, str]) -> None:
+        """Save the ETag/Last-Modified validators of a response."""
+        meta = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        meta_path.write_text(json.dumps(meta))
+
+    @staticmethod
+    def _if_range(validators: Mapping[str, Optional[str]]) -> Optional[str]:
+        """Pick the ``If-Range`` value: a strong ETag, else Last-Modified.
+
+        Weak ETags are not allowed in ``If-Range``.
+        """
+        etag = validators.get("etag")
+        if etag and not etag.startswith("W/"):
+            return etag
+        return validators.get("last_modified")
 
     @staticmethod
     def _extract_filename(url: str) -> str:
@@ -0,0 +1,103 @@
+import sys
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import pandas as pd
+
+from dataset_hub._core.settings.loader import load_settings
+
+# Share of the max_memory budget that one chunk of a streamed table may use
+CHUNK_BUDGET_FRACTION = 0.25
+
+
+@dataclass
+class MemoryEstimate:
+    """
+    Predicted in-memory size of a table, computed before parsing it.
+
+    Attributes:
+        bytes (int): Estimated ``memory_usage(deep=True)`` of the loaded table.
+        rows (int, optional): Estimated number of rows, if known.
+        streamable (bool): Whether the provider can read the table in chunks
+            without materializing it first.
+    """
+
+    bytes: int
+    rows: Optional[int] = None
+    streamable: bool = False
+
+    def chunk_rows(self, budget: int) -> int:
+        """
+        Return a chunk size whose chunks fit in a share of `budget`.
+
+        Args:
+            budget (int): ``max_memory`` budget in bytes.
+
+        Returns:
+            int: Rows per chunk (at least 1).
+        """
+        if not self.rows:
+            return 1
+        row_bytes = max(self.bytes / self.rows, 1.0)
+        return max(int(budget * CHUNK_BUDGET_FRACTION / row_bytes), 1)
+
+
+def max_memory(budget: Optional[int] = None) -> Optional[int]:
+    """
+    Return the byte budget of a load.
+
+    Args:
+        budget (int, optional): Budget passed to the call; if None, the
+            ``max_memory`` setting is used.
+
+    Returns:
+        int, optional: Budget in bytes, or None if unlimited.
+
+    Raises:
+        ValueError: If the budget is not a positive integer or None.
+    """
+    if budget is None:
+        budget = load_settings().get("max_memory")
+    if budget is None:
+        return None
+    if isinstance(budget, bool) or not isinstance(budget, int) or budget <= 0:
+        raise ValueError("max_memory must be a positive integer or None")
+    return budget
+
+
+def table_nbytes(value: Any) -> Optional[int]:
+    """
+    Return the in-memory size of a loaded table.
+
+    Args:
+        value (Any): Loaded table.
+
+    Returns:
+        int, optional: ``memory_usage(deep=True)`` of a DataFrame or
+        ``nbytes`` of a ``pyarrow.Table``; None for other objects (e.g.
+        iterators).
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    # A pyarrow.Table can only exist if pyarrow was imported
+    pa = sys.modules.get("pyarrow")
+    if pa is not None and isinstance(value, pa.Table):
+        return int(value.nbytes)
+    return None
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Return the peak resident set size of the process so far.
+
+    Returns:
+        int, optional: Bytes, or None where ``resource`` is unavailable
+        (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes on Linux and in bytes on macOS
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
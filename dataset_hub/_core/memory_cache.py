@@ -0,0 +1,241 @@
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional, Tuple
+
+import pandas as pd
+
+from dataset_hub._core.data_bundle import DataBundle
+from dataset_hub._core.memory import table_nbytes
+from dataset_hub._core.settings.loader import load_settings
+
+# Settings that change the loaded data (or its container: max_memory may turn
+# tables into chunk iterators) and therefore belong to the cache key
+_KEY_SETTINGS = ("dtype_backend", "read_engine", "columnar_cache", "max_memory")
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of the in-memory dataset cache (see :func:`cache_info`).
+
+    Attributes:
+        hits (int): Loads served from memory.
+        misses (int): Cacheable loads that had to run the load pipeline.
+        maxsize (int): Byte budget (the ``memory_cache_size`` setting).
+        currsize (int): Bytes held by cached datasets.
+        entries (int): Number of cached datasets.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    entries: int
+
+
+class MemoryCache:
+    """
+    Least-recently-used cache of loaded datasets, bounded by a byte budget.
+
+    Sizes are measured with ``DataFrame.memory_usage(deep=True)`` (or
+    ``pyarrow.Table.nbytes``). When an insertion exceeds the budget, the least
+    recently used datasets are evicted; a dataset larger than the whole
+    budget is not cached.
+
+    The cache keeps its own copy of every table and hands out protected copies:
+    with pandas Copy-on-Write these are cheap shallow copies, otherwise deep
+    copies. Arrow tables are immutable and are shared. Lazy results
+    (chunk iterators, record batch readers) are never cached.
+    """
+
+    def __init__(self) -> None:
+        self._entries: "OrderedDict[Hashable, Tuple[DataBundle[Any], int]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._currsize = 0
+
+    @staticmethod
+    def max_size() -> int:
+        """
+        Return the byte budget from the ``memory_cache_size`` setting.
+
+        Returns:
+            int: Budget in bytes; 0 disables the cache.
+
+        Raises:
+            ValueError: If the setting is not a non-negative integer.
+        """
+        size = load_settings().get("memory_cache_size") or 0
+        if isinstance(size, bool) or not isinstance(size, int) or size < 0:
+            raise ValueError("memory_cache_size must be a non-negative integer")
+        return size
+
+    @staticmethod
+    def build_key(*parts: Any) -> Optional[Hashable]:
+        """
+        Build a cache key from load arguments and the relevant settings.
+
+        Args:
+            *parts: Arguments identifying the load (dataset name, task type,
+                columns, filters, ...). Lists and dicts are frozen.
+
+        Returns:
+            Hashable, optional: Cache key, or None if an argument is not
+            hashable (such loads are not cached).
+        """
+        settings = load_settings()
+        key: Hashable = _freeze(
+            (parts, tuple(settings.get(name) for name in _KEY_SETTINGS))
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Optional[Hashable]) -> Optional[DataBundle[Any]]:
+        """
+        Return a protected copy of a cached dataset.
+
+        Args:
+            key (Hashable, optional): Key from :meth:`build_key`.
+
+        Returns:
+            DataBundle, optional: The cached dataset, or None on a miss or
+            when the cache is disabled.
+        """
+        if key is None or not self.max_size():
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            bundle = entry[0]
+        return DataBundle(
+            {table: _protect(value) for table, value in bundle.items()},
+            copy.deepcopy(bundle.metadata),
+        )
+
+    def put(self, key: Optional[Hashable], bundle: DataBundle[Any]) -> None:
+        """
+        Store a copy of a loaded dataset, evicting least recently used ones.
+
+        Datasets with tables of unknown size (e.g. iterators) are skipped.
+
+        Args:
+            key (Hashable, optional): Key from :meth:`build_key`.
+            bundle (DataBundle): Loaded dataset.
+        """
+        max_size = self.max_size()
+        if key is None or not max_size:
+            self._evict(max_size)
+            return
+        sizes = [table_nbytes(value) for value in bundle.data.values()]
+        if any(size is None for size in sizes):
+            return
+        size = sum(size for size in sizes if size is not None)
+        if size > max_size:
+            return
+
+        stored = DataBundle(
+            {table: _protect(value) for table, value in bundle.items()},
+            copy.deepcopy(bundle.metadata),
+        )
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._currsize -= previous[1]
+            self._entries[key] = (stored, size)
+            self._currsize += size
+        self._evict(max_size)
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.max_size(),
+                currsize=self._currsize,
+                entries=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """Drop every cached dataset and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._currsize = 0
+
+    def _evict(self, max_size: int) -> None:
+        """Evict least recently used datasets until the budget is met."""
+        with self._lock:
+            while self._entries and self._currsize > max_size:
+                _, (_, size) = self._entries.popitem(last=False)
+                self._currsize -= size
+            if not max_size:
+                self._entries.clear()
+                self._currsize = 0
+
+
+MEMORY_CACHE = MemoryCache()
+
+
+def cache_info() -> CacheInfo:
+    """
+    Return statistics of the in-memory dataset cache.
+
+    The cache is enabled with the ``memory_cache_size`` option (see
+    :ref:`settings`).
+
+    Returns:
+        CacheInfo: ``(hits, misses, maxsize, currsize, entries)``; sizes in
+        bytes.
+
+    Example:
+
+        .. code-block:: python
+
+            import dataset_hub
+
+            dataset_hub.set_option("memory_cache_size", 512 * 1024**2)
+            dataset_hub.classification.get_titanic()
+            dataset_hub.classification.get_titanic()  # served from memory
+            dataset_hub.cache_info()
+    """
+    return MEMORY_CACHE.info()
+
+
+def cache_clear() -> None:
+    """Drop every dataset from the in-memory cache and reset its statistics."""
+    MEMORY_CACHE.clear()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert lists, tuples and dicts into hashable tuples, recursively."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def _protect(value: Any) -> Any:
+    """Return a copy of a table that cannot modify `value`."""
+    if isinstance(value, pd.DataFrame):
+        return value.copy(deep=not _copy_on_write())
+    return value
+
+
+def _copy_on_write() -> bool:
+    """Check whether pandas Copy-on-Write protects shallow copies."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
@@ -0,0 +1,459 @@
+import bisect
+import math
+import threading
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlparse
+
+from dataset_hub._core.settings.loader import load_settings
+from dataset_hub._core.utils.files import atomic_path
+from dataset_hub._core.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from dataset_hub._core.tracing import Span
+
+logger = get_logger(__name__)
+
+LabelValues = Tuple[str, ...]
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+
+class Counter:
+    """
+    Monotonic counter with labels.
+
+    Attributes:
+        name (str): Metric name.
+        help (str): Description.
+        labelnames (Tuple[str, ...]): Label names, in the order of the label
+            values passed to :meth:`inc`.
+    """
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str]) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: LabelValues, amount: float = 1) -> None:
+        """
+        Add `amount` to the counter of a label combination.
+
+        Args:
+            labels (Tuple[str, ...]): Label values.
+            amount (float): Non-negative increment.
+        """
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> List[Dict[str, Any]]:
+        """Return ``{"labels": ..., "value": ...}`` for every label combination."""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            {"labels": dict(zip(self.labelnames, labels)), "value": value}
+            for labels, value in items
+        ]
+
+    def reset(self) -> None:
+        """Drop all values."""
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram:
+    """
+    Histogram with fixed buckets and labels.
+
+    Observations are counted in the first bucket whose upper bound is not
+    lower than the value; exported bucket counts are cumulative, as in
+    Prometheus.
+
+    Attributes:
+        name (str): Metric name.
+        help (str): Description.
+        labelnames (Tuple[str, ...]): Label names.
+        buckets (Tuple[float, ...]): Sorted finite upper bounds; a ``+Inf``
+            bucket is implied.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: [per-bucket counts (last is +Inf), sum]
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: LabelValues, value: float) -> None:
+        """
+        Record one observation.
+
+        Args:
+            labels (Tuple[str, ...]): Label values.
+            value (float): Observed value, e.g. seconds.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(
+                labels, ([0] * (len(self.buckets) + 1), [0.0])
+            )
+            counts[index] += 1
+            total[0] += value
+
+    def samples(self) -> List[Dict[str, Any]]:
+        """
+        Return the cumulative buckets, sum and count of every label combination.
+
+        Returns:
+            List[Dict[str, Any]]: ``{"labels", "buckets", "sum", "count"}``
+            entries; ``buckets`` maps upper bounds (``math.inf`` last) to
+            cumulative counts.
+        """
+        with self._lock:
+            items = [
+                (labels, list(counts), total[0])
+                for labels, (counts, total) in sorted(self._values.items())
+            ]
+        samples = []
+        for labels, counts, total in items:
+            cumulative = 0
+            buckets: Dict[float, int] = {}
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                buckets[bound] = cumulative
+            samples.append(
+                {
+                    "labels": dict(zip(self.labelnames, labels)),
+                    "buckets": buckets,
+                    "sum": total,
+                    "count": cumulative,
+                }
+            )
+        return samples
+
+    def reset(self) -> None:
+        """Drop all observations."""
+        with self._lock:
+            self._values.clear()
+
+
+Metric = Union[Counter, Histogram]
+
+LOADS = Counter(
+    "dataset_hub_loads_total",
+    "Dataset loads by get_data/aget_data.",
+    ("dataset", "task_type", "status"),
+)
+LOAD_SECONDS = Histogram(
+    "dataset_hub_load_seconds",
+    "Duration of dataset loads.",
+    ("dataset", "task_type"),
+)
+MEMORY_CACHE_REQUESTS = Counter(
+    "dataset_hub_memory_cache_requests_total",
+    "Lookups of the in-memory dataset cache.",
+    ("result",),
+)
+SOURCE_CACHE_REQUESTS = Counter(
+    "dataset_hub_source_cache_requests_total",
+    "Lookups of the on-disk source cache.",
+    ("host", "result"),
+)
+DOWNLOADED_BYTES = Counter(
+    "dataset_hub_downloaded_bytes_total",
+    "Bytes of source files downloaded.",
+    ("host",),
+)
+LOCAL_BYTES = Counter(
+    "dataset_hub_local_bytes_total",
+    "Bytes of source files served from the on-disk cache.",
+    ("host",),
+)
+DOWNLOAD_SECONDS = Histogram(
+    "dataset_hub_download_seconds",
+    "Duration of source downloads.",
+    ("host",),
+)
+DECOMPRESS_SECONDS = Histogram(
+    "dataset_hub_decompress_seconds",
+    "Time spent decompressing archive members while parsing them.",
+    ("dataset",),
+)
+DECOMPRESSED_BYTES = Counter(
+    "dataset_hub_decompressed_bytes_total",
+    "Bytes read from archive members.",
+    ("dataset",),
+)
+PARSE_SECONDS = Histogram(
+    "dataset_hub_parse_seconds",
+    "Duration of parsing a source or columnar cache file.",
+    ("dataset", "format"),
+)
+PARSED_ROWS = Counter(
+    "dataset_hub_parsed_rows_total",
+    "Rows parsed from files.",
+    ("dataset", "format"),
+)
+FAILURES = Counter(
+    "dataset_hub_failures_total",
+    "Failed dataset loads, by the stage that raised and its source host.",
+    ("stage", "host"),
+)
+
+# Spans still open per trace, and the failed spans of those traces as
+# (error, (stage, host)) in the order they ended (innermost first). Entries
+# are dropped when the last open span of a trace ends.
+_OPEN_SPANS: Dict[str, Set[str]] = {}
+_FAILED_STAGES: Dict[str, List[Tuple[str, LabelValues]]] = {}
+_TRACES_LOCK = threading.Lock()
+
+METRICS: Tuple[Metric, ...] = (
+    LOADS,
+    LOAD_SECONDS,
+    MEMORY_CACHE_REQUESTS,
+    SOURCE_CACHE_REQUESTS,
+    DOWNLOADED_BYTES,
+    LOCAL_BYTES,
+    DOWNLOAD_SECONDS,
+    DECOMPRESS_SECONDS,
+    DECOMPRESSED_BYTES,
+    PARSE_SECONDS,
+    PARSED_ROWS,
+    FAILURES,
+)
+
+
+def open_span(span: "Span") -> None:
+    """
+    Register a span that has started, so failures are counted once it and
+    the other open spans of its trace have ended.
+
+    Args:
+        span (Span): Started span.
+    """
+    with _TRACES_LOCK:
+        _OPEN_SPANS.setdefault(span.trace_id, set()).add(span.span_id)
+
+
+def observe_span(span: "Span") -> None:
+    """
+    Update the metrics from a finished tracing span.
+
+    Called by :mod:`dataset_hub._core.tracing` for every span. When a
+    ``get_data`` span ends and the ``metrics_path`` option is set, the
+    metrics file is rewritten.
+
+    A failure is counted once per failed call, when the last open span of
+    its trace ends (the root span, or the outermost stage of a chunk read
+    after :func:`get_data` returned), and labelled with the innermost stage
+    that raised the same error. Errors a caller recovered from (e.g. an
+    unavailable disk cache) are not counted.
+
+    Args:
+        span (Span): Finished span.
+    """
+    attributes = span.attributes
+    host = _host(attributes.get("url"))
+    with _TRACES_LOCK:
+        failed = _FAILED_STAGES.setdefault(span.trace_id, [])
+        if span.error is not None:
+            failed.append((span.error, (span.name, host)))
+        open_spans = _OPEN_SPANS.get(span.trace_id, set())
+        open_spans.discard(span.span_id)
+        finished = not open_spans
+        if finished:
+            _OPEN_SPANS.pop(span.trace_id, None)
+            del _FAILED_STAGES[span.trace_id]
+    if finished and span.error is not None:
+        FAILURES.inc(next(labels for error, labels in failed if error == span.error))
+
+    if span.name == "get_data":
+        dataset = str(attributes.get("dataset", ""))
+        task_type = str(attributes.get("task_type", ""))
+        LOADS.inc((dataset, task_type, "error" if span.error else "ok"))
+        if span.error is None:
+            LOAD_SECONDS.observe((dataset, task_type), span.duration)
+        if "memory_cache_hit" in attributes:
+            hit = attributes["memory_cache_hit"]
+            MEMORY_CACHE_REQUESTS.inc(("hit" if hit else "miss",))
+        metrics_path = load_settings().get("metrics_path")
+        if metrics_path:
+            try:
+                write_metrics(metrics_path)
+            except OSError as e:
+                logger.warning(f"Could not write metrics file {metrics_path}: {e}")
+    elif span.error is not None:
+        return
+    elif span.name == "fetch":
+        hit = bool(attributes.get("cache_hit"))
+        SOURCE_CACHE_REQUESTS.inc((host, "hit" if hit else "miss"))
+        if hit:
+            LOCAL_BYTES.inc((host,), attributes.get("bytes", 0))
+    elif span.name == "download":
+        DOWNLOADED_BYTES.inc((host,), attributes.get("bytes", 0))
+        DOWNLOAD_SECONDS.observe((host,), span.duration)
+    elif span.name == "decompress":
+        dataset_label = (str(attributes.get("dataset") or ""),)
+        DECOMPRESS_SECONDS.observe(dataset_label, span.duration)
+        DECOMPRESSED_BYTES.inc(dataset_label, attributes.get("bytes", 0))
+    elif span.name == "parse":
+        labels = (str(attributes.get("dataset") or ""), str(attributes.get("format")))
+        PARSE_SECONDS.observe(labels, span.duration)
+        PARSED_ROWS.inc(labels, attributes.get("rows", 0))
+
+
+def metrics_snapshot() -> Dict[str, Any]:
+    """
+    Return the current values of the library metrics.
+
+    Metrics are collected in-process for every load: dataset loads and their
+    latency, memory and disk cache lookups, bytes downloaded vs. served from
+    the disk cache, download, decompression and parse latency, and failed
+    loads per stage and source host.
+
+    Returns:
+        Dict[str, Any]: Metric name to ``{"type", "help", "samples"}``.
+        Counter samples are ``{"labels", "value"}``; histogram samples are
+        ``{"labels", "buckets", "sum", "count"}`` with cumulative buckets.
+
+    Example:
+
+        .. code-block:: python
+
+            import dataset_hub
+
+            dataset_hub.classification.get_iris()
+            snapshot = dataset_hub.metrics_snapshot()
+            snapshot["dataset_hub_downloaded_bytes_total"]["samples"]
+    """
+    return {
+        metric.name: {
+            "type": metric.type,
+            "help": metric.help,
+            "samples": metric.samples(),
+        }
+        for metric in METRICS
+    }
+
+
+def format_prometheus() -> str:
+    """
+    Render the metrics in the Prometheus text exposition format.
+
+    Returns:
+        str: Exposition text, ending with a newline.
+    """
+    lines: List[str] = []
+    for metric in METRICS:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+        for sample in metric.samples():
+            labels = sample["labels"]
+            if isinstance(metric, Counter):
+                lines.append(
+                    f"{metric.name}{_labels(labels)} {_number(sample['value'])}"
+                )
+                continue
+            for bound, count in sample["buckets"].items():
+                le = "+Inf" if bound == math.inf else _number(bound)
+                lines.append(
+                    f"{metric.name}_bucket{_labels({**labels, 'le': le})} {count}"
+                )
+            lines.append(f"{metric.name}_sum{_labels(labels)} {_number(sample['sum'])}")
+            lines.append(f"{metric.name}_count{_labels(labels)} {sample['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(path: Union[str, Path]) -> None:
+    """
+    Write the metrics to a file in the Prometheus text format.
+
+    The file is replaced atomically, so it can be read at any time by e.g.
+    the node exporter textfile collector. Setting the ``metrics_path``
+    option writes it after every load.
+
+    Args:
+        path (str | Path): Destination file, e.g. ``dataset_hub.prom``.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    with atomic_path(Path(path)) as tmp_path:
+        tmp_path.write_text(format_prometheus(), encoding="utf-8")
+
+
+def reset_metrics() -> None:
+    """Reset every metric to its initial empty state."""
+    for metric in METRICS:
+        metric.reset()
+    with _TRACES_LOCK:
+        _OPEN_SPANS.clear()
+        _FAILED_STAGES.clear()
+
+
+def _host(url: Optional[Any]) -> str:
+    """Return the host name of a URL, or an empty string."""
+    if not url:
+        return ""
+    return urlparse(str(url)).hostname or ""
+
+
+def _labels(labels: Dict[str, Any]) -> str:
+    """Format labels as ``{name="value",...}`` with Prometheus escaping."""
+    if not labels:
+        return ""
+    pairs = []
+    for name, value in labels.items():
+        escaped = (
+            str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        )
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _number(value: float) -> str:
+    """Format a sample value, without a trailing ``.0`` for integers."""
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -0,0 +1,310 @@
+import importlib.util
+from typing import IO, Any, Callable, Dict, Optional, Tuple, Type, Union
+
+import pandas as pd
+from pandas.api.types import pandas_dtype
+
+# pandas dtypes that Arrow can produce directly while parsing; other declared
+# dtypes (e.g. "category" or nullable "Int8") are applied after conversion
+_ARROW_TYPES: Dict[str, str] = {
+    "int8": "int8",
+    "int16": "int16",
+    "int32": "int32",
+    "int64": "int64",
+    "uint8": "uint8",
+    "uint16": "uint16",
+    "uint32": "uint32",
+    "uint64": "uint64",
+    "float32": "float32",
+    "float64": "float64",
+    "bool": "bool_",
+    "string": "string",
+    "str": "string",
+}
+
+# read_csv options that do not change the parsed result
+_IGNORED_CSV_OPTIONS = ("low_memory", "memory_map", "engine")
+
+
+def is_available() -> bool:
+    """Check whether ``pyarrow`` is installed, without importing it."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def errors(*others: Type[BaseException]) -> Tuple[Type[BaseException], ...]:
+    """
+    Return `others` plus the base class of the exceptions raised by ``pyarrow``.
+
+    Some of them (e.g. ``ArrowTypeError``, ``ArrowIOError``) are not
+    ``ValueError``; callers falling back to pandas catch all of them.
+
+    Args:
+        *others (Type[BaseException]): Other exception classes to catch.
+
+    Returns:
+        Tuple[Type[BaseException], ...]: Exception classes for an ``except``
+        clause; ``pyarrow.lib.ArrowException`` is left out if ``pyarrow`` is
+        not installed.
+    """
+    if not is_available():
+        return others
+
+    import pyarrow as pa
+
+    return (*others, pa.lib.ArrowException)
+
+
+def types_mapper(backend: Optional[str]) -> Optional[Callable[[Any], Any]]:
+    """
+    Return the ``types_mapper`` for ``to_pandas`` matching a dtype backend.
+
+    Args:
+        backend (str, optional): ``"numpy_nullable"``, ``"pyarrow"`` or None.
+
+    Returns:
+        Callable, optional: Mapping of Arrow types to pandas dtypes, or None
+        for the default NumPy dtypes.
+    """
+    if backend == "pyarrow":
+        return pd.ArrowDtype
+    if backend != "numpy_nullable":
+        return None
+
+    import pyarrow as pa
+
+    nullable = {
+        pa.int8(): pd.Int8Dtype(),
+        pa.int16(): pd.Int16Dtype(),
+        pa.int32(): pd.Int32Dtype(),
+        pa.int64(): pd.Int64Dtype(),
+        pa.uint8(): pd.UInt8Dtype(),
+        pa.uint16(): pd.UInt16Dtype(),
+        pa.uint32(): pd.UInt32Dtype(),
+        pa.uint64(): pd.UInt64Dtype(),
+        pa.bool_(): pd.BooleanDtype(),
+        pa.float32(): pd.Float32Dtype(),
+        pa.float64(): pd.Float64Dtype(),
+        pa.string(): pd.StringDtype(),
+        pa.large_string(): pd.StringDtype(),
+    }
+    return nullable.get
+
+
+def read_csv_table(source: Union[str, IO[bytes]], **read_kwargs: Any) -> Any:
+    """
+    Parse a CSV file into a ``pyarrow.Table`` with the multi-threaded Arrow
+    reader, accepting the subset of ``pandas.read_csv`` options it can honor.
+
+    Supported options: ``sep``/``delimiter``, ``quotechar``, ``na_values``,
+    ``keep_default_na``, ``usecols`` (list of names), ``dtype`` (mapping),
+    ``skiprows`` (int), ``encoding`` and ``compression`` (``"infer"`` only).
+    Declared dtypes with a direct Arrow type are produced by the parser
+    itself, so e.g. a ``"string"`` column is never inferred as a time.
+
+    Args:
+        source (str | IO[bytes]): Local path or binary file object.
+        **read_kwargs: ``pandas.read_csv`` options.
+
+    Returns:
+        pyarrow.Table: Parsed table.
+
+    Raises:
+        ImportError: If ``pyarrow`` is not installed.
+        ValueError: If an option is not supported by the Arrow reader, or
+            the file cannot be parsed.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pcsv
+
+    options = {
+        key: value
+        for key, value in read_kwargs.items()
+        if key not in _IGNORED_CSV_OPTIONS and key != "dtype_backend"
+    }
+    delimiter = options.pop("sep", options.pop("delimiter", ","))
+    quote_char = options.pop("quotechar", '"')
+    na_values = options.pop("na_values", None) or []
+    keep_default_na = options.pop("keep_default_na", True)
+    usecols = options.pop("usecols", None)
+    dtype = options.pop("dtype", None) or {}
+    skip_rows = options.pop("skiprows", 0) or 0
+    encoding = options.pop("encoding", None) or "utf8"
+    compression = options.pop("compression", "infer")
+
+    if options:
+        raise ValueError(
+            f"The {sorted(options)} options are not supported by the Arrow CSV reader"
+        )
+    if not isinstance(delimiter, str) or len(delimiter) != 1:
+        raise ValueError("The Arrow CSV reader needs a single-character separator")
+    if usecols is not None and (
+        isinstance(usecols, str) or not all(isinstance(c, str) for c in usecols)
+    ):
+        raise ValueError("The Arrow CSV reader needs usecols as a list of names")
+    if not isinstance(dtype, dict):
+        raise ValueError("The Arrow CSV reader needs dtype as a mapping")
+    if not isinstance(skip_rows, int):
+        raise ValueError("The Arrow CSV reader needs skiprows as a row count")
+    if compression not in ("infer", None):
+        raise ValueError("The Arrow CSV reader only infers compression")
+
+    if isinstance(na_values, str):
+        na_values = [na_values]
+    null_values = list(na_values)
+    if keep_default_na:
+        null_values += pcsv.ConvertOptions().null_values
+
+    column_types = {}
+    for column, value in dtype.items():
+        try:
+            name = str(pandas_dtype(value))
+        except TypeError as e:
+            raise ValueError(f"Column '{column}': {e}") from e
+        if name in _ARROW_TYPES:
+            column_types[column] = getattr(pa, _ARROW_TYPES[name])()
+    return pcsv.read_csv(
+        source,
+        read_options=pcsv.ReadOptions(skip_rows=skip_rows, encoding=encoding),
+        parse_options=pcsv.ParseOptions(delimiter=delimiter, quote_char=quote_char),
+        convert_options=pcsv.ConvertOptions(
+            column_types=column_types,
+            null_values=null_values,
+            strings_can_be_null=True,
+            include_columns=list(usecols) if usecols is not None else None,
+        ),
+    )
+
+
+def cast_columns(table: Any, schema: Dict[str, str]) -> Any:
+    """
+    Cast the columns of a ``pyarrow.Table`` to declared pandas dtypes.
+
+    Numeric, boolean and string dtypes (including the nullable and Arrow-backed
+    ones) map to the corresponding Arrow type; ``"category"`` columns are
+    dictionary-encoded, which is how Arrow stores pandas categoricals.
+
+    Args:
+        table (pyarrow.Table): Parsed table.
+        schema (Dict[str, str]): Column name to pandas dtype string; columns
+            missing from `table` are skipped.
+
+    Returns:
+        pyarrow.Table: Table with the declared types.
+
+    Raises:
+        ValueError: If a column cannot be converted.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    for column, value in schema.items():
+        if column not in table.column_names:
+            continue
+        array = table.column(column)
+        dtype = pandas_dtype(value)
+        if isinstance(dtype, pd.CategoricalDtype):
+            if pa.types.is_dictionary(array.type):
+                continue
+            converted = pc.dictionary_encode(array)
+        else:
+            if isinstance(dtype, pd.ArrowDtype):
+                target = dtype.pyarrow_dtype
+            elif isinstance(dtype, pd.StringDtype):
+                target = pa.string()
+            else:
+                target = pa.from_numpy_dtype(getattr(dtype, "numpy_dtype", dtype))
+            if array.type == target:
+                continue
+            try:
+                converted = array.cast(target)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                raise ValueError(f"Column '{column}': {e}") from e
+        index = table.column_names.index(column)
+        table = table.set_column(index, column, converted)
+    return table
+
+
+def read_csv(source: Union[str, IO[bytes]], **read_kwargs: Any) -> pd.DataFrame:
+    """
+    Parse a CSV file into a DataFrame with the multi-threaded Arrow reader.
+
+    A drop-in engine for ``pandas.read_csv`` (see :func:`read_csv_table` for
+    the supported options). Columns without a declared dtype are inferred by
+    Arrow; ``dtype_backend`` is honored.
+
+    Args:
+        source (str | IO[bytes]): Local path or binary file object.
+        **read_kwargs: ``pandas.read_csv`` options.
+
+    Returns:
+        pd.DataFrame: Parsed DataFrame.
+
+    Raises:
+        ImportError: If ``pyarrow`` is not installed.
+        ValueError: If an option is not supported or the file cannot be parsed.
+    """
+    table = read_csv_table(source, **read_kwargs)
+    mapper = types_mapper(read_kwargs.get("dtype_backend"))
+    df: pd.DataFrame = table.to_pandas(types_mapper=mapper)
+    dtype = read_kwargs.get("dtype") or {}
+    casts = {
+        column: value
+        for column, value in dtype.items()
+        if column in df.columns and df[column].dtype != pandas_dtype(value)
+    }
+    return df.astype(casts) if casts else df
+
+
+def strptime(text: pd.Series, format_: str) -> Optional[pd.Series]:
+    """
+    Parse strings into datetimes with Arrow's vectorized ``strptime``.
+
+    Much faster than ``pandas.to_datetime`` for formats that are not ISO 8601,
+    which pandas parses element by element.
+
+    Args:
+        text (pd.Series): Strings to parse; missing values give ``NaT``.
+        format_ (str): Explicit ``strftime`` format.
+
+    Returns:
+        pd.Series, optional: ``datetime64[us]`` values with the index of
+        `text`, or None if ``pyarrow`` is not installed or cannot parse the
+        values with this format (the caller should fall back to pandas).
+    """
+    if not is_available():
+        return None
+
+    import pyarrow as pa
+
+    array = pa.array(text.astype("string"), type=pa.string(), from_pandas=True)
+    try:
+        parsed = strptime_array(array, format_)
+    except ValueError:
+        return None
+    values: pd.Series = pd.Series(parsed.to_pandas(), index=text.index)
+    return values
+
+
+def strptime_array(array: Any, format_: str) -> Any:
+    """
+    Parse an Arrow string array into ``timestamp[us]`` values.
+
+    Args:
+        array (pyarrow.Array | pyarrow.ChunkedArray): Strings to parse;
+            nulls give nulls.
+        format_ (str): Explicit ``strftime`` format.
+
+    Returns:
+        pyarrow.Array | pyarrow.ChunkedArray: Parsed timestamps.
+
+    Raises:
+        ValueError: If a value does not match the format, or Arrow does not
+            support the format.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    try:
+        return pc.strptime(array, format=format_, unit="us")
+    except pa.ArrowNotImplementedError as e:
+        raise ValueError(str(e)) from e
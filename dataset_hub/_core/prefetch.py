@@ -0,0 +1,196 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from dataset_hub._core import tracing
+from dataset_hub._core.config_manager import ConfigManager
+from dataset_hub._core.get_data import load_parts
+from dataset_hub._core.provider import ProviderFactory
+from dataset_hub._core.provider.provider import Provider
+from dataset_hub._core.utils.logger import get_logger
+from dataset_hub._core.utils.paths import list_available_datasets, list_task_types
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PrefetchResult:
+    """
+    Outcome of prefetching a single dataset.
+
+    Attributes:
+        dataset_name (str): Name of the dataset.
+        task_type (str): Task type of the dataset.
+        bytes (int): Total size of the cached source files.
+        fetch_seconds (float): Time spent downloading (or finding) the sources.
+        parse_seconds (float, optional): Time spent parsing, if requested.
+        error (str, optional): Error message if prefetching failed.
+    """
+
+    dataset_name: str
+    task_type: str
+    bytes: int = 0
+    fetch_seconds: float = 0.0
+    parse_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the dataset was prefetched successfully."""
+        return self.error is None
+
+
+def prefetch(
+    names: Optional[Union[str, Iterable[str]]] = None,
+    task_types: Optional[Union[str, Iterable[str]]] = None,
+    max_workers: Optional[int] = None,
+    parse: bool = False,
+) -> List[PrefetchResult]:
+    """
+    Download many datasets into the local cache concurrently.
+
+    Intended for warming the cache on new machines: all selected datasets are
+    fetched on a thread pool, as are the parts of a multi-part dataset, so
+    the whole run takes about as long as the slowest dataset. Failures do not
+    stop the run; they are reported in the returned results.
+
+    Args:
+        names (str | Iterable[str], optional): Dataset name(s) to prefetch.
+            Default is every dataset of the selected task types.
+        task_types (str | Iterable[str], optional): Task type(s) to select
+            datasets from (e.g. ``["classification"]``). Default is all task
+            types.
+        max_workers (int, optional): Number of concurrent downloads. Default
+            is one worker per dataset, up to 16.
+        parse (bool): Also parse each dataset once after downloading, which
+            fills the columnar cache if the ``columnar_cache`` setting is on.
+
+    Returns:
+        List[PrefetchResult]: One result per dataset with size, timings and
+        error message, in catalog order.
+
+    Raises:
+        ValueError: If a requested name is not found in the selected task types.
+
+    Example:
+
+        .. code-block:: python
+
+            import dataset_hub
+
+            results = dataset_hub.prefetch(task_types=["classification"])
+            failed = [r for r in results if not r.ok]
+    """
+    targets = _select_datasets(names, task_types)
+    if not targets:
+        return []
+
+    workers = max_workers or min(len(targets), 16)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        task_types_, names_ = zip(*targets)
+        results = list(pool.map(_prefetch_one, task_types_, names_, repeat(parse)))
+
+    for result in results:
+        if not result.ok:
+            logger.warning(
+                f"Prefetch of {result.task_type}/{result.dataset_name} "
+                f"failed: {result.error}"
+            )
+    return results
+
+
+def _select_datasets(
+    names: Optional[Union[str, Iterable[str]]],
+    task_types: Optional[Union[str, Iterable[str]]],
+) -> List[Tuple[str, str]]:
+    """
+    Resolve the (task_type, dataset_name) pairs to prefetch.
+
+    Args:
+        names (str | Iterable[str], optional): Requested dataset names; a
+            single name may be passed as a string.
+        task_types (str | Iterable[str], optional): Requested task types,
+            likewise.
+
+    Returns:
+        List[Tuple[str, str]]: Selected (task_type, dataset_name) pairs.
+
+    Raises:
+        ValueError: If a requested name is not available.
+    """
+    if isinstance(names, str):
+        names = [names]
+    if isinstance(task_types, str):
+        task_types = [task_types]
+    selected_types = list(task_types) if task_types else list_task_types()
+    catalog = [
+        (task_type, name)
+        for task_type in selected_types
+        for name in sorted(list_available_datasets(task_type))
+    ]
+    if names is None:
+        return catalog
+
+    wanted = set(names)
+    missing = wanted - {name for _, name in catalog}
+    if missing:
+        raise ValueError(
+            f"Unknown datasets for task types {selected_types}: {sorted(missing)}"
+        )
+    return [(task_type, name) for task_type, name in catalog if name in wanted]
+
+
+def _prefetch_one(task_type: str, dataset_name: str, parse: bool) -> PrefetchResult:
+    """
+    Fetch (and optionally parse) one dataset, capturing any error.
+
+    Args:
+        task_type (str): Task type of the dataset.
+        dataset_name (str): Name of the dataset.
+        parse (bool): Whether to parse the dataset after fetching.
+
+    Returns:
+        PrefetchResult: Size, timings and error of this dataset.
+    """
+    result = PrefetchResult(dataset_name=dataset_name, task_type=task_type)
+    try:
+        config = ConfigManager.load_config(dataset_name, task_type)
+        providers = ProviderFactory.build_providers(config["providers"])
+
+        start = time.perf_counter()
+        paths = _fetch_parts(providers)
+        result.fetch_seconds = time.perf_counter() - start
+        result.bytes = sum(path.stat().st_size for path in paths)
+
+        if parse:
+            start = time.perf_counter()
+            load_parts(providers)
+            result.parse_seconds = time.perf_counter() - start
+    except Exception as e:  # reported per dataset, the run goes on
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def _fetch_parts(providers: Dict[str, Provider[Any]]) -> List[Path]:
+    """
+    Fetch the sources of every part of a dataset, in parallel when there are
+    several (like :func:`load_parts`).
+
+    Args:
+        providers (Dict[str, Provider]): Mapping of table name to Provider.
+
+    Returns:
+        List[Path]: Cached source files, in the order of `providers`.
+    """
+    if len(providers) == 1:
+        return [path for provider in providers.values() for path in provider.fetch()]
+
+    with ThreadPoolExecutor(max_workers=len(providers)) as pool:
+        futures = [
+            pool.submit(tracing.run_in_context(provider.fetch))
+            for provider in providers.values()
+        ]
+        return [path for future in futures for path in future.result()]
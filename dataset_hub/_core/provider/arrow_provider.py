@@ -0,0 +1,432 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from dataset_hub._core import tracing
+from dataset_hub._core.cache_manager import CacheManager
+from dataset_hub._core.filters import filters_expression
+from dataset_hub._core.loaders.archive import ArchiveReader
+from dataset_hub._core.parsers import arrow
+from dataset_hub._core.utils.files import atomic_path
+from dataset_hub._core.utils.logger import get_logger
+
+from .dataframe_provider import DataFrameProvider, DataFrameProviderConfig
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ArrowProviderConfig(DataFrameProviderConfig):
+    """
+    Configuration schema for ArrowProvider.
+
+    Attributes:
+        output (str): ``"table"`` for a ``pyarrow.Table`` or ``"reader"`` for
+            a ``pyarrow.RecordBatchReader``.
+    """
+
+    output: str = "table"
+
+
+class ArrowProvider(DataFrameProvider):
+    """
+    Provider that returns a dataset as Arrow data instead of pandas.
+
+    It shares the source handling of :class:`DataFrameProvider` (download,
+    local and columnar caches, archives, ``columns``/``filters``/``schema``
+    options) but never converts to pandas: CSV sources are parsed by the
+    Arrow CSV reader and Parquet/Feather files are scanned with
+    ``pyarrow.dataset``. Text columns stay Arrow strings instead of Python
+    objects, and nothing is copied into NumPy arrays.
+
+    Differences from :class:`DataFrameProvider`:
+
+    - A declared ``index`` becomes the first column, since Arrow tables have
+      no index. ``category`` columns are dictionary-encoded.
+    - With the ``"reader"`` output, batches are streamed from the file when
+      the data comes from a persistent Parquet/Feather file (a Parquet or
+      Feather source or the columnar cache); other sources are parsed first.
+    - Formats without an Arrow reader (Excel, JSON) and CSV reader options
+      that Arrow cannot honor are parsed by pandas and then converted.
+
+    Requires ``pyarrow``.
+    """
+
+    ConfigClass = ArrowProviderConfig
+
+    OUTPUTS = ("table", "reader")
+
+    def load(self) -> Any:
+        """
+        Fetch and load the dataset as Arrow data.
+
+        Returns:
+            pyarrow.Table | pyarrow.RecordBatchReader: The dataset, depending
+            on the ``output`` option.
+
+        Raises:
+            ImportError: If ``pyarrow`` is not installed.
+            ValueError: If the file cannot be read or the format is unsupported.
+        """
+        return self._load(lazy=self.config["output"] == "reader")
+
+    def iter_chunks(self, chunksize: int) -> Iterator[Any]:
+        """
+        Load the dataset as an iterator of ``pyarrow.RecordBatch`` objects of
+        at most `chunksize` rows.
+
+        Args:
+            chunksize (int): Maximum number of rows per batch.
+
+        Returns:
+            Iterator[pyarrow.RecordBatch]: Iterator over the batches.
+
+        Raises:
+            ValueError: If `chunksize` is not a positive integer.
+        """
+        if isinstance(chunksize, bool) or not isinstance(chunksize, int):
+            raise ValueError("chunksize must be a positive integer")
+        if chunksize <= 0:
+            raise ValueError("chunksize must be a positive integer")
+        return self._iter_batches(chunksize)
+
+    def _iter_batches(self, chunksize: int) -> Iterator[Any]:
+        """
+        Generator behind :meth:`iter_chunks`.
+
+        Args:
+            chunksize (int): Maximum number of rows per batch.
+
+        Yields:
+            pyarrow.RecordBatch: Consecutive non-empty batches.
+        """
+        for batch in self._load(lazy=True, batch_size=chunksize):
+            for start in range(0, batch.num_rows, chunksize):
+                yield batch.slice(start, chunksize)
+
+    def _can_stream(self, format_: str) -> bool:
+        """
+        Check whether batches are streamed for a source format.
+
+        Only Parquet/Feather files are streamed; CSV sources are parsed whole
+        by the Arrow CSV reader before being split into batches.
+
+        Args:
+            format_ (str): Source format.
+
+        Returns:
+            bool: True for Parquet and Feather.
+        """
+        return format_ in CacheManager.COLUMNAR_FORMATS
+
+    def _transform_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate the ``output`` option on top of the DataFrameProvider options.
+
+        Args:
+            config (Dict[str, Any]): Normalized configuration.
+
+        Returns:
+            Dict[str, Any]: Validated configuration.
+
+        Raises:
+            ValueError: If an option is invalid.
+        """
+        config = super()._transform_config(config)
+        if config["output"] not in self.OUTPUTS:
+            raise ValueError(
+                f"Unsupported output '{config['output']}'. "
+                f"Supported outputs: {list(self.OUTPUTS)}"
+            )
+        return config
+
+    def _parser(self, format_: str, read_kwargs: Dict[str, Any]) -> Optional[str]:
+        """
+        Return the parser that fills the columnar cache for a source format.
+
+        CSV sources are parsed by the Arrow CSV reader (see
+        :meth:`_parse_table`), which infers other types than the pandas
+        engines, so their columnar copies are not shared with
+        :class:`DataFrameProvider`.
+
+        Args:
+            format_ (str): Format of the source file.
+            read_kwargs (Dict[str, Any]): Reader options used to parse it.
+
+        Returns:
+            str, optional: ``"arrow"`` for CSV, else the pandas engine name.
+        """
+        if format_.lower() == "csv" and "engine" not in read_kwargs:
+            return "arrow"
+        return super()._parser(format_, read_kwargs)
+
+    def _load(self, lazy: bool, batch_size: Optional[int] = None) -> Any:
+        """
+        Load the dataset as a table, or as a reader if `lazy` is set.
+
+        Args:
+            lazy (bool): Return a ``pyarrow.RecordBatchReader``, streaming
+                from persistent Parquet/Feather files.
+            batch_size (int, optional): Maximum rows per streamed batch.
+
+        Returns:
+            pyarrow.Table | pyarrow.RecordBatchReader: The dataset.
+        """
+        source = self._require_source()
+        read_kwargs = self.config.get("read_kwargs", {})
+        format_ = source["format"].lower()
+
+        with self._local_source(source) as (path, cached):
+            columnar_path = None
+            if cached:
+                columnar_path = self._build_columnar_path(path, source, read_kwargs)
+            if columnar_path and CacheManager.is_fresh(columnar_path, path):
+                return self._scan(columnar_path, False, lazy, batch_size)
+
+            archive = ArchiveReader.is_archive(path)
+            if format_ in CacheManager.COLUMNAR_FORMATS and not archive:
+                if lazy and cached:
+                    return self._scan(path, True, True, batch_size)
+                # A temporary download is removed on exit, so read it now
+                table = self._scan(path, True, False, None)
+            elif columnar_path:
+                # The columnar copy must hold the full table, so parse it all
+                parsed = self._read_table(path, source, read_kwargs)
+                self._write_columnar_table(parsed, columnar_path)
+                table = self._package_table(parsed)
+            else:
+                pushdown = self._pushdown_kwargs(format_, read_kwargs)
+                table = self._package_table(self._read_table(path, source, pushdown))
+
+        return table.to_reader(max_chunksize=batch_size) if lazy else table
+
+    def _scan(
+        self, path: Path, raw: bool, lazy: bool, batch_size: Optional[int]
+    ) -> Any:
+        """
+        Read a Parquet/Feather file, pruning columns and row groups.
+
+        Args:
+            path (Path): Parquet or Feather file.
+            raw (bool): Whether the file is the source itself rather than a
+                columnar cache.
+            lazy (bool): Stream batches through a reader instead of reading
+                the whole table.
+            batch_size (int, optional): Maximum rows per streamed batch.
+
+        Returns:
+            pyarrow.Table | pyarrow.RecordBatchReader: The selected data.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        filters = self._pushdown_filters(raw)
+        filtered = len(filters) == len(self.config["filters"])
+        dataset = ds.dataset(str(path), format=path.suffix.lstrip("."))
+        scanner = dataset.scanner(
+            columns=self._needed_columns(raw),
+            filter=filters_expression(filters) if filters else None,
+            **({"batch_size": batch_size} if batch_size else {}),
+        )
+
+        def finish(table: Any) -> Any:
+            if raw:
+                table = self._prepare_table(table)
+            return self._select_table(table, filtered)
+
+        if not lazy:
+            with tracing.span(
+                "parse",
+                dataset=self.config.get("name"),
+                format=path.suffix.lstrip("."),
+                path=path.name,
+            ):
+                table = scanner.to_table()
+            with tracing.span("package") as span:
+                table = finish(table)
+                span.attributes.update(rows=table.num_rows, columns=table.num_columns)
+            return table
+
+        schema = finish(scanner.projected_schema.empty_table()).schema
+        batches = (
+            batch
+            for scanned in scanner.to_batches()
+            for batch in finish(pa.Table.from_batches([scanned]))
+            .cast(schema)
+            .to_batches()
+        )
+        return pa.RecordBatchReader.from_batches(schema, batches)
+
+    def _read_table(
+        self, path: Path, source: Dict[str, Any], read_kwargs: Dict[str, Any]
+    ) -> Any:
+        """
+        Parse a local source file into a ``pyarrow.Table``.
+
+        CSV files (including archive members) are parsed by the Arrow CSV
+        reader; other formats, and reader options it cannot honor, go through
+        the pandas reader of :class:`DataFrameProvider`.
+
+        Args:
+            path (Path): Local path of the source file.
+            source (Dict[str, Any]): Source configuration.
+            read_kwargs (Dict[str, Any]): Reader options.
+
+        Returns:
+            pyarrow.Table: Table with the declared schema and index column.
+        """
+        with tracing.span(
+            "parse",
+            dataset=self.config.get("name"),
+            format=source["format"],
+            path=path.name,
+        ) as span:
+            table = self._parse_table(path, source, read_kwargs)
+            span.attributes.update(rows=table.num_rows, columns=table.num_columns)
+        return table
+
+    def _parse_table(
+        self, path: Path, source: Dict[str, Any], read_kwargs: Dict[str, Any]
+    ) -> Any:
+        """
+        Body of :meth:`_read_table`, run inside its ``parse`` tracing span.
+
+        Args:
+            path (Path): Local path of the source file.
+            source (Dict[str, Any]): Source configuration.
+            read_kwargs (Dict[str, Any]): Reader options.
+
+        Returns:
+            pyarrow.Table: Table with the declared schema and index column.
+        """
+        import pyarrow as pa
+
+        format_ = source["format"].lower()
+        if format_ == "csv" and "engine" not in read_kwargs:
+            typed_kwargs = self._typed_kwargs(format_, read_kwargs)
+            try:
+                if "compression" in read_kwargs or not ArchiveReader.is_archive(path):
+                    table = arrow.read_csv_table(str(path), **typed_kwargs)
+                else:
+                    member = source.get("member")
+                    with ArchiveReader.open_member(path, member, format_) as f:
+                        with tracing.timed_reader(
+                            f, dataset=self.config.get("name"), archive=path.name
+                        ) as stream:
+                            table = arrow.read_csv_table(stream, **typed_kwargs)
+            except arrow.errors(KeyError, NotImplementedError, ValueError) as e:
+                logger.debug(f"Arrow CSV reader failed ({e}), using pandas")
+            else:
+                return self._prepare_table(table)
+
+        df = self._read_source(path, source, read_kwargs)
+        return arrow.cast_columns(
+            pa.Table.from_pandas(df, preserve_index=False), self.config["schema"]
+        )
+
+    def _prepare_table(self, table: Any) -> Any:
+        """
+        Apply the declared schema and build the index column of a parsed table.
+
+        Args:
+            table (pyarrow.Table): Table parsed from the source.
+
+        Returns:
+            pyarrow.Table: Table with declared types; a declared index is the
+            first column, replacing its source columns.
+
+        Raises:
+            ValueError: If an index column is missing or a value does not
+                match the index format.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        table = arrow.cast_columns(table, self.config["schema"])
+        index = self.config["index"]
+        if index is None:
+            return table
+
+        missing = [c for c in index["columns"] if c not in table.column_names]
+        if missing:
+            raise ValueError(f"Index columns not found in the dataset: {missing}")
+        parts = [table.column(c).cast(pa.string()) for c in index["columns"]]
+        text = pc.binary_join_element_wise(*parts, " ") if len(parts) > 1 else parts[0]
+        try:
+            values = arrow.strptime_array(text, index["format"])
+        except ValueError as e:
+            raise ValueError(f"Could not build index '{index['name']}': {e}") from e
+
+        table = table.drop_columns(index["columns"])
+        return table.add_column(0, index["name"], values)
+
+    def _select_table(self, table: Any, filtered: bool = False) -> Any:
+        """
+        Apply the row filters and column selection to a table.
+
+        Args:
+            table (pyarrow.Table): Prepared table.
+            filtered (bool): Whether the filters were already applied.
+
+        Returns:
+            pyarrow.Table: Selected rows and columns.
+        """
+        filters = self.config["filters"]
+        if filters and not filtered:
+            for column, _, _ in filters:
+                if column not in table.column_names:
+                    raise ValueError(
+                        f"Filter column '{column}' not found in the dataset"
+                    )
+            table = table.filter(filters_expression(filters))
+        columns = self.config["columns"]
+        if columns is None:
+            return table
+        missing = [c for c in columns if c not in table.column_names]
+        if missing:
+            raise ValueError(f"Columns not found in the dataset: {missing}")
+        index = self.config["index"]
+        if index is not None:
+            columns = [index["name"], *(c for c in columns if c != index["name"])]
+        return table.select(columns)
+
+    def _package_table(self, table: Any) -> Any:
+        """
+        Apply :meth:`_select_table` inside a ``package`` tracing span.
+
+        Args:
+            table (pyarrow.Table): Prepared table.
+
+        Returns:
+            pyarrow.Table: Selected rows and columns.
+        """
+        with tracing.span("package") as span:
+            table = self._select_table(table)
+            span.attributes.update(rows=table.num_rows, columns=table.num_columns)
+        return table
+
+    @staticmethod
+    def _write_columnar_table(table: Any, path: Path) -> None:
+        """
+        Atomically store a parsed table in the columnar cache.
+
+        The file has the same layout as one written by
+        :class:`DataFrameProvider`; both providers share the cache for
+        sources that they parse with the same parser (see :meth:`_parser`).
+
+        Args:
+            table (pyarrow.Table): Prepared, unselected table.
+            path (Path): Destination; its suffix selects Parquet or Feather.
+        """
+        import pyarrow.feather as feather
+        import pyarrow.parquet as pq
+
+        writers: Dict[str, Any] = {
+            ".parquet": pq.write_table,
+            ".feather": feather.write_feather,
+        }
+        try:
+            with atomic_path(path) as tmp_path:
+                writers[path.suffix](table, str(tmp_path))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write columnar cache {path.name}: {e}")
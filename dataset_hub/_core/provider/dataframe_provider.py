@@ -1,13 +1,56 @@
+import asyncio
+import io
+import itertools
+import tempfile
+from concurrent.futures import Executor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict
+from functools import partial
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
+import requests
+from pandas.api.types import pandas_dtype
+
+from dataset_hub._core import tracing
+from dataset_hub._core.cache_manager import CacheManager
+from dataset_hub._core.filters import (
+    Filter,
+    apply_filters,
+    filter_columns,
+    filters_expression,
+    validate_filters,
+)
+from dataset_hub._core.loaders.archive import ArchiveReader
+from dataset_hub._core.loaders.url_loader import UrlLoader
+from dataset_hub._core.memory import MemoryEstimate
+from dataset_hub._core.parsers import arrow
+from dataset_hub._core.settings.loader import load_settings
+from dataset_hub._core.utils.files import atomic_path
+from dataset_hub._core.utils.logger import get_logger
 
 from .provider import (
     Provider,
     ProviderConfig,
 )
 
+logger = get_logger(__name__)
+
+# Resolution of the datetime index column built from the source columns
+INDEX_UNIT = "us"
+
 
 @dataclass
 class SourceConfig:
@@ -18,11 +61,14 @@ class SourceConfig:
         type (str): Source type (e.g., 'url', 'file').
         url (str): URL or file path to the dataset.
         format (str): The format of the file (e.g., 'csv', 'parquet').
+        member (str, optional): For archive sources (zip, tar, gz), name or
+            glob pattern of the member to read.
     """
 
     type: str
     url: str
     format: str
+    member: Optional[str] = None
 
 
 @dataclass
@@ -35,10 +81,33 @@ class DataFrameProviderConfig(ProviderConfig):
             type, url, and format.
         read_kwargs (Dict[str, Any]): Optional keyword arguments forwarded
             directly to the corresponding pandas reader.
+        name (str, optional): Dataset name, used as the local cache key.
+            Without a name the source is always read directly.
+        columns (List[str], optional): Columns to return, in this order.
+            Other columns are not parsed where the format allows it.
+        filters (List[Filter], optional): Row predicates
+            ``(column, op, value)`` that every returned row must match.
+        schema (Dict[str, Any]): Declared dtype per column (from the
+            ``columns`` block of the dataset YAML), e.g. ``{"Voltage":
+            "float32", "Sex": "category"}``. Entries may also be mappings with
+            a ``dtype`` key.
+        index (Dict[str, Any], optional): Datetime index built at load time,
+            with keys ``columns`` (column or columns joined by spaces),
+            ``format`` (explicit ``strftime`` format) and optional ``name``
+            (default ``"datetime"``). The source columns are dropped.
+        engine (str, optional): Parser engine, e.g. ``"pyarrow"`` for the
+            multi-threaded Arrow CSV reader, or ``"auto"`` to use it when
+            available. Overrides the ``read_engine`` setting.
     """
 
     source: Dict[str, Any]
     read_kwargs: Dict[str, Any] = field(default_factory=dict)
+    name: Optional[str] = None
+    columns: Optional[List[str]] = None
+    filters: Optional[List[Any]] = None
+    schema: Dict[str, Any] = field(default_factory=dict)
+    index: Optional[Dict[str, Any]] = None
+    engine: Optional[str] = None
 
 
 class DataFrameProvider(Provider[pd.DataFrame]):
@@ -51,18 +120,86 @@ class DataFrameProvider(Provider[pd.DataFrame]):
         {"data": pandas.DataFrame}
 
     Supported formats depend on the implementation of `read_dataframe`.
+
+    When the ``save_local`` setting is enabled, the source file is downloaded
+    once into ``data_path`` (see :class:`CacheManager`) and later loads read
+    the local copy instead of the network. With the ``columnar_cache`` setting
+    the parsed DataFrame is additionally stored as Parquet/Feather next to the
+    cached source, so warm loads skip text parsing entirely.
+
+    The optional ``columns`` and ``filters`` config keys are pushed down to
+    the reader: ``usecols`` for CSV/Excel, column and row-group pruning for
+    Parquet/Feather sources and columnar caches. Row filters on text formats
+    are applied right after parsing.
+
+    Column dtypes declared in ``schema`` are passed to the parser (``dtype``)
+    where the format supports it, so inference is skipped for those columns,
+    and enforced on every other path. The ``dtype_backend`` setting selects
+    nullable or Arrow-backed dtypes for the remaining columns.
+
+    An ``index`` config builds a ``DatetimeIndex`` from one or more text
+    columns with an explicit format, so parsing is vectorized instead of
+    guessing the format per element. The parsed timestamps are stored in the
+    columnar cache, so warm loads skip the conversion. Until the very end the
+    index is an ordinary column: ``columns`` and ``filters`` may refer to it.
+
+    The parser engine is taken from the ``engine`` config key or the
+    ``read_engine`` setting. ``"auto"`` picks the multi-threaded ``pyarrow``
+    engine where the format supports it and ``pyarrow`` is installed. If the
+    chosen engine rejects the reader options or the file, the source is
+    parsed again with the pandas default engine.
+
+    With the ``revalidate`` setting, a load revalidates the cached source
+    once: the path resolved by :meth:`fetch`, :meth:`estimate_memory` or the
+    download step of :meth:`aload` is reused by the next load instead of
+    asking the server again.
     """
 
     ConfigClass = DataFrameProviderConfig
 
+    # Cached source resolved ahead of the next load (see _cached_source)
+    _fetched_path: Optional[Path] = None
+
     # Registry of formats and corresponding pandas reader functions
     _READER_REGISTRY: Dict[str, Callable[..., pd.DataFrame]] = {
         "csv": pd.read_csv,
         "parquet": pd.read_parquet,
         "excel": pd.read_excel,
         "json": pd.read_json,
+        "feather": pd.read_feather,
     }
 
+    # Reader option used to prune columns while parsing, per format
+    _COLUMNS_KWARG_REGISTRY: Dict[str, str] = {
+        "csv": "usecols",
+        "excel": "usecols",
+        "parquet": "columns",
+        "feather": "columns",
+    }
+
+    # Registry of formats and their alternative parser engines
+    _ENGINE_REGISTRY: Dict[str, Dict[str, Callable[..., Any]]] = {
+        "csv": {
+            "c": partial(pd.read_csv, engine="c"),
+            "python": partial(pd.read_csv, engine="python"),
+            "pyarrow": arrow.read_csv,
+        },
+    }
+
+    # Formats whose pandas reader accepts a per-column ``dtype`` option
+    _DTYPE_FORMATS = ("csv", "excel", "json")
+
+    DTYPE_BACKENDS = ("numpy_nullable", "pyarrow")
+
+    # Formats whose pandas reader can return an iterator of chunks
+    _CHUNKED_READER_REGISTRY: Dict[str, Callable[..., Any]] = {
+        "csv": pd.read_csv,
+    }
+
+    # Sample sizes used by estimate_memory()
+    SAMPLE_BYTES = 1024 * 1024
+    SAMPLE_ROWS = 10_000
+
     def load(self) -> pd.DataFrame:
         """
         Fetch and load the dataset specified in the configuration.
@@ -73,7 +210,274 @@ class DataFrameProvider(Provider[pd.DataFrame]):
         Raises:
             ValueError: If the file cannot be read or the format is unsupported.
         """
-        source = self.config["source"]
+        source = self._require_source()
+        read_kwargs = self.config.get("read_kwargs", {})
+
+        with self._local_source(source) as (path, cached):
+            columnar_path = None
+            if cached:
+                columnar_path = self._build_columnar_path(path, source, read_kwargs)
+            if columnar_path and CacheManager.is_fresh(columnar_path, path):
+                columnar_format = columnar_path.suffix.lstrip(".")
+                with tracing.span(
+                    "parse",
+                    dataset=self.config.get("name"),
+                    format=columnar_format,
+                    path=columnar_path.name,
+                ) as span:
+                    df = self.read_dataframe(
+                        str(columnar_path),
+                        columnar_format,
+                        self._typed_kwargs(
+                            columnar_format,
+                            self._pushdown_kwargs(columnar_format, {}, raw=False),
+                        ),
+                    )
+                    span.attributes.update(rows=len(df), columns=len(df.columns))
+                return self._package(self._apply_schema(df))
+
+            if columnar_path:
+                # The columnar copy must hold the full table, so parse it all
+                df = self._read_source(path, source, read_kwargs)
+            else:
+                pushdown = self._pushdown_kwargs(source["format"], read_kwargs)
+                df = self._read_source(path, source, pushdown)
+
+        if columnar_path:
+            self._write_columnar(df, columnar_path)
+
+        return self._package(df)
+
+    def iter_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Load the dataset as an iterator of DataFrames of at most `chunksize` rows.
+
+        Memory use stays bounded by the chunk size instead of the table size:
+
+        - With a fresh Parquet/Feather copy in the columnar cache, row batches
+          are read from it directly (memory-mapped for Feather).
+        - CSV sources, including members of archives, are read with the
+          chunked pandas reader. Column dtypes are taken from the first chunk
+          and applied to every chunk; integer and boolean columns use the
+          nullable ``Int64``/``boolean`` dtypes, so a chunk with missing
+          values does not change the dtype.
+        - Other formats cannot be parsed incrementally by pandas; they are
+          loaded at once and yielded in slices.
+
+        The source is downloaded (or taken from the cache) when iteration
+        starts, and a temporary download is removed once the iterator is
+        exhausted or closed.
+
+        Args:
+            chunksize (int): Maximum number of rows per chunk.
+
+        Returns:
+            Iterator[pd.DataFrame]: Iterator over the chunks.
+
+        Raises:
+            ValueError: If `chunksize` is not a positive integer or the source
+                configuration is invalid. During iteration, if a chunk cannot
+                be converted to the dtypes of the first chunk.
+        """
+        if isinstance(chunksize, bool) or not isinstance(chunksize, int):
+            raise ValueError("chunksize must be a positive integer")
+        if chunksize <= 0:
+            raise ValueError("chunksize must be a positive integer")
+        source = self._require_source()
+        read_kwargs = self.config.get("read_kwargs", {})
+        return self._iter_chunks(source, read_kwargs, chunksize)
+
+    async def aload(self, executor: Optional[Executor] = None) -> pd.DataFrame:
+        """
+        Load the dataset without blocking the running event loop.
+
+        The download runs in a worker thread of its own, then parsing runs in
+        `executor`. Passing a small dedicated executor bounds the CPU spent on
+        parsing while any number of downloads overlap.
+
+        Args:
+            executor (Executor, optional): Executor for parsing. Default is the
+                event loop's default thread pool.
+
+        Returns:
+            pd.DataFrame: The loaded pandas DataFrame.
+        """
+        if self.config.get("name") and CacheManager.is_enabled():
+            try:
+                await asyncio.to_thread(self.fetch)
+            except requests.RequestException:
+                raise
+            except OSError as e:
+                logger.warning(f"Local cache unavailable ({e}), using a temp file")
+        return await super().aload(executor)
+
+    def estimate_memory(self) -> Optional[MemoryEstimate]:
+        """
+        Estimate the ``memory_usage(deep=True)`` of the loaded table without
+        parsing the whole source.
+
+        The source is fetched into the local cache first. CSV sources are
+        estimated from their (uncompressed) size and the memory per input
+        byte of a parsed sample of ``SAMPLE_BYTES``; Parquet/Feather files
+        (and the columnar cache) from their row count and a parsed sample of
+        ``SAMPLE_ROWS`` rows. Column selection is taken into account, row
+        filters are not, so the estimate is an upper bound for filtered
+        loads.
+
+        Returns:
+            MemoryEstimate, optional: The estimate, or None if the source is
+            not cached (unnamed dataset or ``save_local`` disabled), the
+            format cannot be sampled (Excel, JSON, pandas-side
+            ``compression``), or sampling fails.
+        """
+        if not self.config.get("name") or not CacheManager.is_enabled():
+            return None
+        source = self._require_source()
+        read_kwargs = self.config.get("read_kwargs", {})
+        try:
+            path = self._cached_source(source)
+        except requests.RequestException:
+            raise
+        except OSError as e:
+            logger.warning(f"Local cache unavailable ({e}), size not estimated")
+            return None
+
+        format_ = source["format"].lower()
+        try:
+            columnar_path = self._build_columnar_path(path, source, read_kwargs)
+            if columnar_path and CacheManager.is_fresh(columnar_path, path):
+                return self._estimate_columnar(columnar_path, raw=False)
+            archive = ArchiveReader.is_archive(path)
+            if format_ in CacheManager.COLUMNAR_FORMATS and not archive:
+                return self._estimate_columnar(path)
+            if format_ != "csv" or "compression" in read_kwargs:
+                return None
+            pushdown = self._pushdown_kwargs(format_, read_kwargs)
+            return self._estimate_text(path, source, pushdown, archive)
+        except (ImportError, OSError, ValueError) as e:
+            logger.debug(f"Could not estimate the size of {path.name}: {e}")
+            return None
+
+    def _estimate_text(
+        self,
+        path: Path,
+        source: Dict[str, Any],
+        read_kwargs: Dict[str, Any],
+        archive: bool,
+    ) -> Optional[MemoryEstimate]:
+        """
+        Estimate the loaded size of a text source by parsing its first bytes.
+
+        Args:
+            path (Path): Local path of the source file.
+            source (Dict[str, Any]): Source configuration.
+            read_kwargs (Dict[str, Any]): Reader options, with pushdown.
+            archive (bool): Whether `path` is an archive.
+
+        Returns:
+            MemoryEstimate, optional: The estimate, or None for an empty file.
+        """
+        format_ = source["format"].lower()
+        member = source.get("member")
+        if archive:
+            total = ArchiveReader.member_size(path, member, format_)
+            with ArchiveReader.open_member(path, member, format_) as f:
+                sample = f.read(self.SAMPLE_BYTES)
+        else:
+            total = path.stat().st_size
+            with open(path, "rb") as f:
+                sample = f.read(self.SAMPLE_BYTES)
+        if len(sample) < total:
+            # Parse complete lines only
+            sample = sample[: sample.rfind(b"\n") + 1]
+        if not sample:
+            return None
+
+        df = self.read_dataframe(
+            io.BytesIO(sample), format_, self._typed_kwargs(format_, read_kwargs)
+        )
+        df = self._build_index_column(self._apply_schema(df))
+        scale = max(total, len(sample)) / len(sample)
+        return MemoryEstimate(
+            bytes=int(int(df.memory_usage(deep=True).sum()) * scale),
+            rows=int(len(df) * scale),
+            streamable=self._can_stream(format_),
+        )
+
+    def _estimate_columnar(self, path: Path, raw: bool = True) -> MemoryEstimate:
+        """
+        Estimate the loaded size of a Parquet/Feather file from its row count
+        and a parsed sample of its first rows.
+
+        Args:
+            path (Path): Parquet or Feather file.
+            raw (bool): Whether the file is the source itself rather than a
+                columnar cache.
+
+        Returns:
+            MemoryEstimate: The estimate.
+        """
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(str(path), format=path.suffix.lstrip("."))
+        rows = dataset.count_rows()
+        sample = dataset.head(self.SAMPLE_ROWS, columns=self._needed_columns(raw))
+        df = self._apply_schema(
+            sample.to_pandas(types_mapper=arrow.types_mapper(self.dtype_backend()))
+        )
+        if raw:
+            df = self._build_index_column(df)
+        row_bytes = int(df.memory_usage(deep=True).sum()) / max(len(df), 1)
+        return MemoryEstimate(bytes=int(row_bytes * rows), rows=rows, streamable=True)
+
+    def _can_stream(self, format_: str) -> bool:
+        """
+        Check whether :meth:`iter_chunks` reads a source format incrementally.
+
+        Args:
+            format_ (str): Source format.
+
+        Returns:
+            bool: False if the whole table is parsed before being chunked.
+        """
+        return (
+            format_ in self._CHUNKED_READER_REGISTRY
+            or format_ in CacheManager.COLUMNAR_FORMATS
+        )
+
+    def fetch(self) -> List[Path]:
+        """
+        Download the source into the local cache without parsing it.
+
+        The next load of this provider reads the fetched file without
+        revalidating it again.
+
+        Returns:
+            List[Path]: Single-element list with the cached source path.
+
+        Raises:
+            ValueError: If the config has no dataset name or the ``save_local``
+                setting is disabled (there is no cache to fill).
+        """
+        name = self.config.get("name")
+        if not name:
+            raise ValueError("Only named datasets can be fetched into the cache")
+        if not CacheManager.is_enabled():
+            raise ValueError("Fetching requires the 'save_local' setting")
+        return [self._cached_source(self.config["source"])]
+
+    def _require_source(self) -> Dict[str, Any]:
+        """
+        Return the source configuration after checking the required keys.
+
+        Returns:
+            Dict[str, Any]: Source configuration.
+
+        Raises:
+            ValueError: If the source type is unsupported or 'url'/'format'
+                are missing.
+        """
+        source: Dict[str, Any] = self.config["source"]
         source_type = source.get("type")
 
         if source_type != "url":
@@ -87,31 +491,677 @@ class DataFrameProvider(Provider[pd.DataFrame]):
         if not format_:
             raise ValueError("Source must contain 'format' key")
 
-        df = self.read_dataframe(
-            url,
-            format_,
-            self.config.get("read_kwargs", {}),
+        return source
+
+    def _iter_chunks(
+        self, source: Dict[str, Any], read_kwargs: Dict[str, Any], chunksize: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Generator behind :meth:`iter_chunks`.
+
+        Args:
+            source (Dict[str, Any]): Validated source configuration.
+            read_kwargs (Dict[str, Any]): Reader options.
+            chunksize (int): Maximum number of rows per chunk.
+
+        Yields:
+            pd.DataFrame: Consecutive chunks of the table.
+        """
+        with self._local_source(source) as (path, cached):
+            columnar_path = None
+            if cached:
+                columnar_path = self._build_columnar_path(path, source, read_kwargs)
+            if columnar_path and CacheManager.is_fresh(columnar_path, path):
+                yield from self._iter_columnar(columnar_path, chunksize, raw=False)
+                return
+
+            format_ = source["format"].lower()
+            archive = ArchiveReader.is_archive(path)
+            if format_ in CacheManager.COLUMNAR_FORMATS and not archive:
+                yield from self._iter_columnar(path, chunksize)
+                return
+
+            pushdown = self._pushdown_kwargs(format_, read_kwargs)
+            if format_ not in self._CHUNKED_READER_REGISTRY:
+                df = self._select(self._read_source(path, source, pushdown))
+                for start in range(0, len(df), chunksize):
+                    yield df.iloc[start : start + chunksize]
+                return
+
+            reader = self._CHUNKED_READER_REGISTRY[format_]
+            chunk_kwargs = {
+                **self._typed_kwargs(format_, pushdown),
+                "chunksize": chunksize,
+            }
+            if "compression" in read_kwargs or not archive:
+                with reader(str(path), **chunk_kwargs) as chunks:
+                    yield from self._select_chunks(_with_stable_dtypes(chunks))
+                return
+            member = source.get("member")
+            with ArchiveReader.open_member(path, member, format_) as f:
+                with reader(f, **chunk_kwargs) as chunks:
+                    yield from self._select_chunks(_with_stable_dtypes(chunks))
+
+    def _iter_columnar(
+        self, path: Path, chunksize: int, raw: bool = True
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a Parquet/Feather file in row batches.
+
+        Only the needed columns are read, and filters are evaluated by Arrow,
+        which skips Parquet row groups whose statistics rule them out.
+
+        Args:
+            path (Path): Parquet or Feather file.
+            chunksize (int): Maximum number of rows per batch.
+            raw (bool): Whether the file is the source itself rather than a
+                columnar cache (which already holds the built index column).
+
+        Yields:
+            pd.DataFrame: Consecutive non-empty batches of the table.
+        """
+        import pyarrow.dataset as ds
+
+        filters = self._pushdown_filters(raw)
+        dataset = ds.dataset(str(path), format=path.suffix.lstrip("."))
+        batches = dataset.to_batches(
+            columns=self._needed_columns(raw),
+            filter=filters_expression(filters) if filters else None,
+            batch_size=chunksize,
         )
+        mapper = arrow.types_mapper(self.dtype_backend())
+        filtered = len(filters) == len(self.config["filters"])
+        for batch in batches:
+            if batch.num_rows:
+                df = self._apply_schema(batch.to_pandas(types_mapper=mapper))
+                if raw:
+                    df = self._build_index_column(df)
+                selected = self._select(df, filtered=filtered)
+                if len(selected):
+                    yield selected
+
+    def _transform_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate the ``columns``, ``filters``, ``schema`` and ``index`` options.
+
+        Args:
+            config (Dict[str, Any]): Normalized configuration.
+
+        Returns:
+            Dict[str, Any]: Configuration with filters as tuples and the
+            schema and index normalized.
+
+        Raises:
+            ValueError: If the columns are not a list of names, or a filter,
+                the schema or the index is malformed.
+        """
+        columns = config.get("columns")
+        if columns is not None and (
+            isinstance(columns, str) or not all(isinstance(c, str) for c in columns)
+        ):
+            raise ValueError("columns must be a list of column names")
+        if columns is not None and "usecols" in config["read_kwargs"]:
+            raise ValueError("Use either 'columns' or 'usecols' in read_kwargs")
+        config["filters"] = validate_filters(config.get("filters"))
+        config["schema"] = self._parse_schema(config.get("schema") or {})
+        config["index"] = self._parse_index(config.get("index"))
+        engine = config.get("engine")
+        if engine is not None and engine != "auto":
+            format_ = str(config["source"].get("format", "")).lower()
+            engines = self._ENGINE_REGISTRY.get(format_, {})
+            if engine not in engines:
+                raise ValueError(
+                    f"Engine '{engine}' is not supported for format '{format_}'. "
+                    f"Supported engines: {['auto', *engines]}"
+                )
+        return config
+
+    @staticmethod
+    def _parse_schema(schema: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Normalize a column schema to a mapping of column name to dtype.
+
+        Args:
+            schema (Dict[str, Any]): Column name to dtype string, or to a
+                mapping with a ``dtype`` key (other keys, e.g. a description,
+                are ignored).
+
+        Returns:
+            Dict[str, str]: Column name to pandas dtype string.
 
+        Raises:
+            ValueError: If an entry has no dtype or names an unknown dtype.
+        """
+        if not isinstance(schema, dict):
+            raise ValueError("columns schema must be a mapping of column to dtype")
+        dtypes: Dict[str, str] = {}
+        for column, spec in schema.items():
+            dtype = spec.get("dtype") if isinstance(spec, dict) else spec
+            if not isinstance(dtype, str):
+                raise ValueError(f"Column '{column}' must declare a dtype string")
+            try:
+                pandas_dtype(dtype)
+            except TypeError as e:
+                raise ValueError(f"Column '{column}': {e}") from e
+            dtypes[str(column)] = dtype
+        return dtypes
+
+    @staticmethod
+    def _parse_index(index: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Normalize a datetime index declaration.
+
+        Args:
+            index (Dict[str, Any], optional): Mapping with ``columns`` (a
+                column name or list of names), ``format`` and optional
+                ``name``.
+
+        Returns:
+            Dict[str, Any], optional: Index with ``columns`` as a list and
+            ``name`` filled in, or None if no index is declared.
+
+        Raises:
+            ValueError: If a key is missing or has the wrong type.
+        """
+        if index is None:
+            return None
+        if not isinstance(index, dict):
+            raise ValueError("index must be a mapping with 'columns' and 'format'")
+        columns = index.get("columns")
+        if isinstance(columns, str):
+            columns = [columns]
+        if (
+            not isinstance(columns, list)
+            or not columns
+            or not all(isinstance(c, str) for c in columns)
+        ):
+            raise ValueError("index 'columns' must be a column name or list of names")
+        format_ = index.get("format")
+        if not isinstance(format_, str) or not format_:
+            raise ValueError("index must declare an explicit datetime 'format'")
+        name = index.get("name", "datetime")
+        if not isinstance(name, str):
+            raise ValueError("index 'name' must be a string")
+        return {"columns": columns, "format": format_, "name": name}
+
+    def engine(self, format_: str) -> Optional[str]:
+        """
+        Return the parser engine to use for a format.
+
+        Args:
+            format_ (str): Format of the file being read.
+
+        Returns:
+            str, optional: Engine name, or None for the pandas default (also
+            when the ``read_engine`` setting names an engine that the format
+            does not support, or ``"auto"`` finds no faster engine).
+        """
+        engine = self._requested_engine()
+        engines = self._ENGINE_REGISTRY.get(format_.lower(), {})
+        if engine == "auto":
+            return "pyarrow" if "pyarrow" in engines and arrow.is_available() else None
+        return str(engine) if engine in engines else None
+
+    def _parser(self, format_: str, read_kwargs: Dict[str, Any]) -> Optional[str]:
+        """
+        Return the parser that fills the columnar cache for a source format.
+
+        Recorded in the columnar cache key, since parsers infer different
+        types (e.g. dates) from the same source.
+
+        Args:
+            format_ (str): Format of the source file.
+            read_kwargs (Dict[str, Any]): Reader options used to parse it.
+
+        Returns:
+            str, optional: Engine name, or None for the pandas default.
+        """
+        return self.engine(format_)
+
+    def _requested_engine(self) -> Optional[str]:
+        """Return the engine from the config, else the ``read_engine`` setting."""
+        engine = self.config.get("engine") or load_settings().get("read_engine")
+        return str(engine) if engine else None
+
+    @classmethod
+    def dtype_backend(cls) -> Optional[str]:
+        """
+        Return the configured dtype backend.
+
+        Returns:
+            str, optional: ``"numpy_nullable"``, ``"pyarrow"`` or None when the
+            ``dtype_backend`` setting is disabled (NumPy dtypes).
+
+        Raises:
+            ValueError: If the setting holds an unsupported backend.
+        """
+        backend = load_settings().get("dtype_backend")
+        if not backend:
+            return None
+        if backend not in cls.DTYPE_BACKENDS:
+            raise ValueError(
+                f"Unsupported dtype_backend '{backend}'. "
+                f"Supported backends: {list(cls.DTYPE_BACKENDS)}"
+            )
+        return str(backend)
+
+    def _typed_kwargs(
+        self, format_: str, read_kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Add the declared column dtypes and the dtype backend to reader options.
+
+        Options set explicitly in `read_kwargs` take precedence.
+
+        Args:
+            format_ (str): Format of the file being read.
+            read_kwargs (Dict[str, Any]): Reader options.
+
+        Returns:
+            Dict[str, Any]: Reader options with typing applied.
+        """
+        typed = dict(read_kwargs)
+        schema = self.config["schema"]
+        dtype = read_kwargs.get("dtype")
+        if schema and format_.lower() in self._DTYPE_FORMATS:
+            if dtype is None or isinstance(dtype, dict):
+                typed["dtype"] = {**schema, **(dtype or {})}
+        backend = self.dtype_backend()
+        if backend:
+            typed.setdefault("dtype_backend", backend)
+        return typed
+
+    def _apply_schema(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast columns whose dtype differs from the declared schema.
+
+        Args:
+            df (pd.DataFrame): Parsed table.
+
+        Returns:
+            pd.DataFrame: Table with the declared dtypes.
+        """
+        casts = {
+            column: dtype
+            for column, dtype in self.config["schema"].items()
+            if column in df.columns and df[column].dtype != pandas_dtype(dtype)
+        }
+        return df.astype(casts) if casts else df
+
+    def _build_index_column(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parse the declared index columns into a single datetime column.
+
+        The source columns are joined with spaces and parsed in one vectorized
+        call with the declared format (Arrow's ``strptime`` when ``pyarrow``
+        is installed). Missing parts give ``NaT``. The values have
+        ``INDEX_UNIT`` resolution with either parser. The new column is
+        placed first and the source columns are dropped; it becomes
+        the index in :meth:`_select`.
+
+        Args:
+            df (pd.DataFrame): Parsed table with the source columns.
+
+        Returns:
+            pd.DataFrame: Table with the datetime column (`df` itself if no
+            index is declared).
+
+        Raises:
+            ValueError: If a source column is missing or a value does not
+                match the format.
+        """
+        index = self.config["index"]
+        if index is None:
+            return df
+        missing = [column for column in index["columns"] if column not in df.columns]
+        if missing:
+            raise ValueError(f"Index columns not found in the dataset: {missing}")
+
+        first, *rest = (df[column].astype("string") for column in index["columns"])
+        text = first
+        for part in rest:
+            text = text + " " + part
+        values = arrow.strptime(text, index["format"])
+        if values is None:
+            try:
+                values = pd.to_datetime(text, format=index["format"])
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Could not build index '{index['name']}': {e}") from e
+        # Same unit as Arrow's strptime and the columnar cache, whichever
+        # parser and pandas version built the values
+        values = values.dt.as_unit(INDEX_UNIT)
+
+        df = df.drop(columns=index["columns"])
+        df.insert(0, index["name"], values)
         return df
 
+    def _needed_columns(self, raw: bool = True) -> Optional[List[str]]:
+        """
+        Return the columns to read: the requested ones plus filtered ones.
+
+        A declared index is always read: from its source columns in a `raw`
+        source, as the built column in a columnar cache.
+
+        Args:
+            raw (bool): Whether the file read is the source itself.
+
+        Returns:
+            List[str], optional: Column names, or None to read all columns.
+        """
+        columns = self.config["columns"]
+        if columns is None:
+            return None
+        needed = [*columns, *filter_columns(self.config["filters"])]
+        index = self.config["index"]
+        if index is not None:
+            needed = [column for column in needed if column != index["name"]]
+            needed += index["columns"] if raw else [index["name"]]
+        return list(dict.fromkeys(needed))
+
+    def _pushdown_filters(self, raw: bool = True) -> List[Filter]:
+        """
+        Return the filters a reader can evaluate.
+
+        Filters on a declared index need the built column, which a `raw`
+        source does not have yet; they are applied after parsing instead.
+
+        Args:
+            raw (bool): Whether the file read is the source itself.
+
+        Returns:
+            List[Filter]: Filters safe to push down to the reader.
+        """
+        filters: List[Filter] = self.config["filters"]
+        index = self.config["index"]
+        if not raw or index is None:
+            return filters
+        return [filter_ for filter_ in filters if filter_[0] != index["name"]]
+
+    def _pushdown_kwargs(
+        self, format_: str, read_kwargs: Dict[str, Any], raw: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Add column (and Parquet row-group) pruning to the reader options.
+
+        Args:
+            format_ (str): Format of the file being read.
+            read_kwargs (Dict[str, Any]): Configured reader options.
+            raw (bool): Whether the file read is the source itself.
+
+        Returns:
+            Dict[str, Any]: Reader options with pruning applied.
+        """
+        format_ = format_.lower()
+        pushdown = dict(read_kwargs)
+        needed = self._needed_columns(raw)
+        if needed is not None and format_ in self._COLUMNS_KWARG_REGISTRY:
+            pushdown[self._COLUMNS_KWARG_REGISTRY[format_]] = needed
+        filters = self._pushdown_filters(raw)
+        if filters and format_ == "parquet":
+            pushdown["filters"] = filters_expression(filters)
+        return pushdown
+
+    def _select(self, df: pd.DataFrame, filtered: bool = False) -> pd.DataFrame:
+        """
+        Apply the row filters and column selection to a parsed table, then
+        set the declared index.
+
+        Args:
+            df (pd.DataFrame): Parsed table (possibly already pruned).
+            filtered (bool): Whether the filters were already applied by the
+                reader.
+
+        Returns:
+            pd.DataFrame: Selected rows and columns.
+        """
+        if not filtered:
+            df = apply_filters(df, self.config["filters"])
+        columns = self.config["columns"]
+        index = self.config["index"]
+        if columns is not None:
+            missing = [column for column in columns if column not in df.columns]
+            if missing:
+                raise ValueError(f"Columns not found in the dataset: {missing}")
+            if index is not None:
+                columns = [index["name"], *(c for c in columns if c != index["name"])]
+            df = df[columns]
+        if index is not None:
+            df = df.set_index(index["name"])
+        return df
+
+    def _package(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply :meth:`_select` to a whole table inside a ``package`` tracing span.
+
+        Args:
+            df (pd.DataFrame): Parsed table.
+
+        Returns:
+            pd.DataFrame: Selected rows and columns.
+        """
+        with tracing.span("package") as span:
+            df = self._select(df)
+            span.attributes.update(rows=len(df), columns=len(df.columns))
+        return df
+
+    def _select_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Build the index column and apply :meth:`_select` to every chunk,
+        dropping chunks left empty.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Parsed chunks.
+
+        Yields:
+            pd.DataFrame: Selected chunks.
+        """
+        for chunk in chunks:
+            selected = self._select(self._build_index_column(chunk))
+            if len(selected):
+                yield selected
+
+    @contextmanager
+    def _local_source(self, source: Dict[str, Any]) -> Iterator[Tuple[Path, bool]]:
+        """
+        Provide a local file with the source content for the duration of a read.
+
+        With ``save_local`` enabled the file comes from the on-disk cache.
+        Otherwise (or if the cache cannot be written, e.g. a read-only
+        ``data_path``) the source is downloaded into a temporary directory
+        that is removed afterwards. Either way the download goes through the
+        shared pooled HTTP session of :class:`UrlLoader`.
+
+        Args:
+            source (Dict[str, Any]): Source configuration with 'url' and 'format'.
+
+        Yields:
+            Tuple[Path, bool]: Local path of the source and whether it is a
+            persistent cached copy.
+        """
+        name = self.config.get("name") or "dataset"
+        if self.config.get("name") and CacheManager.is_enabled():
+            try:
+                cached_path = self._cached_source(source)
+                # The next load fetches (and revalidates) again
+                self._fetched_path = None
+            except requests.RequestException:
+                # Subclass of OSError, but a temp file would fail the same way
+                raise
+            except OSError as e:
+                logger.warning(f"Local cache unavailable ({e}), using a temp file")
+            else:
+                yield cached_path, True
+                return
+
+        with tempfile.TemporaryDirectory(prefix="dataset_hub_") as tmp_dir:
+            path = Path(tmp_dir) / CacheManager.source_filename(name, source)
+            yield UrlLoader(source["url"]).download(path), False
+
+    def _cached_source(self, source: Dict[str, Any]) -> Path:
+        """
+        Return the cached copy of the source for the current load.
+
+        The first call fetches it through :meth:`CacheManager.fetch`, which
+        downloads or revalidates it; later calls before the load reads it
+        reuse that path, so one load costs at most one request.
+
+        Args:
+            source (Dict[str, Any]): Source configuration with 'url' and 'format'.
+
+        Returns:
+            Path: Path to the cached source file.
+
+        Raises:
+            OSError: If the cache directory cannot be created or written.
+        """
+        path = self._fetched_path
+        if path is None or not path.exists():
+            path = CacheManager.fetch(self.config["name"], source)
+            self._fetched_path = path
+        return path
+
+    def _read_source(
+        self, path: Path, source: Dict[str, Any], read_kwargs: Dict[str, Any]
+    ) -> pd.DataFrame:
+        """
+        Parse a local source file, streaming the table out of archives.
+
+        For zip/tar/gz sources the member selected by the optional 'member'
+        key of the source (see :meth:`ArchiveReader.select_member`) is
+        decompressed while the reader consumes it, so memory use does not
+        grow with the uncompressed size. An explicit ``compression`` reader
+        option leaves decompression to pandas instead.
+
+        The engine selected by :meth:`engine` is used unless `read_kwargs`
+        sets one; if it fails, the file is parsed again with the default.
+        Parsing is traced as a ``parse`` span, and reading an archive member
+        as a ``decompress`` span.
+
+        Args:
+            path (Path): Local path of the source file.
+            source (Dict[str, Any]): Source configuration.
+            read_kwargs (Dict[str, Any]): Reader options.
+
+        Returns:
+            pd.DataFrame: Parsed DataFrame.
+        """
+        format_ = source["format"]
+        typed_kwargs = self._typed_kwargs(format_, read_kwargs)
+
+        def read(engine: Optional[str] = None) -> pd.DataFrame:
+            if "compression" in read_kwargs or not ArchiveReader.is_archive(path):
+                return self.read_dataframe(str(path), format_, typed_kwargs, engine)
+            member = source.get("member")
+            with ArchiveReader.open_member(path, member, format_) as f:
+                with tracing.timed_reader(
+                    f, dataset=self.config.get("name"), archive=path.name
+                ) as stream:
+                    return self.read_dataframe(stream, format_, typed_kwargs, engine)
+
+        with tracing.span(
+            "parse", dataset=self.config.get("name"), format=format_, path=path.name
+        ) as span:
+            engine = None if "engine" in read_kwargs else self.engine(format_)
+            if engine is None:
+                df = read()
+            else:
+                try:
+                    df = read(engine)
+                except arrow.errors(
+                    ImportError, KeyError, NotImplementedError, ValueError
+                ) as e:
+                    message = (
+                        f"Engine '{engine}' failed ({e}), using the default engine"
+                    )
+                    if self._requested_engine() == "auto":
+                        logger.debug(message)
+                    else:
+                        logger.warning(message)
+                    engine = None
+                    df = read()
+            df = self._build_index_column(self._apply_schema(df))
+            span.attributes.update(
+                engine=engine or "default", rows=len(df), columns=len(df.columns)
+            )
+        return df
+
+    def _build_columnar_path(
+        self, source_path: Path, source: Dict[str, Any], read_kwargs: Dict[str, Any]
+    ) -> Optional[Path]:
+        """
+        Return the columnar cache path for a cached source, if enabled.
+
+        Args:
+            source_path (Path): Local path of the cached source file.
+            source (Dict[str, Any]): Source configuration.
+            read_kwargs (Dict[str, Any]): Reader options used to parse the source.
+
+        Returns:
+            Path, optional: Columnar cache path, or None if the ``columnar_cache``
+            setting is disabled or the source already is in that format.
+        """
+        columnar_format = CacheManager.columnar_format()
+        if not columnar_format or source["format"].lower() == columnar_format:
+            return None
+        read_config = {
+            "source": source,
+            "read_kwargs": read_kwargs,
+            "schema": self.config["schema"],
+            "dtype_backend": self.dtype_backend(),
+            "index": self.config["index"],
+            "engine": self._parser(source["format"], read_kwargs),
+        }
+        return CacheManager.build_columnar_path(
+            source_path, read_config, columnar_format
+        )
+
+    @staticmethod
+    def _write_columnar(df: pd.DataFrame, path: Path) -> None:
+        """
+        Atomically store a parsed DataFrame in the columnar cache.
+
+        Failures (e.g. ``pyarrow`` not installed or a column that Arrow cannot
+        represent) are logged and ignored: the cache is an optimization only.
+
+        Args:
+            df (pd.DataFrame): Parsed DataFrame.
+            path (Path): Destination; its suffix selects Parquet or Feather.
+        """
+        writers: Dict[str, Callable[[Path], Any]] = {
+            ".parquet": df.to_parquet,
+            ".feather": df.to_feather,
+        }
+        try:
+            with atomic_path(path) as tmp_path:
+                writers[path.suffix](tmp_path)
+        except (ImportError, OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write columnar cache {path.name}: {e}")
+
     def read_dataframe(
-        self, path_or_url: str, format: str, read_kwargs: Dict[str, Any]
+        self,
+        path_or_url: Union[str, IO[bytes]],
+        format: str,
+        read_kwargs: Dict[str, Any],
+        engine: Optional[str] = None,
     ) -> pd.DataFrame:
         """
         Universal function to read a DataFrame from various file formats.
 
         Args:
-            path_or_url (str): Local file path or URL to the data.
-            format (str): Data format ('csv', 'parquet', 'excel', 'json').
+            path_or_url (str | IO[bytes]): Local file path, URL or binary
+                file object with the data.
+            format (str): Data format ('csv', 'parquet', 'excel', 'json',
+                'feather').
             read_kwargs (dict, optional): Additional parameters to pass to
                 the corresponding pandas reader function.
+            engine (str, optional): Parser engine from ``_ENGINE_REGISTRY``.
+                Default is the reader of ``_READER_REGISTRY``.
 
         Returns:
             pd.DataFrame: Loaded DataFrame.
 
         Raises:
-            ValueError: If the specified format is not supported.
+            ValueError: If the specified format or engine is not supported.
         """
         if read_kwargs is None:
             read_kwargs = {}
@@ -124,4 +1174,65 @@ class DataFrameProvider(Provider[pd.DataFrame]):
             )
 
         reader = self._READER_REGISTRY[format]
+        if engine is not None:
+            engines = self._ENGINE_REGISTRY.get(format, {})
+            if engine not in engines:
+                raise ValueError(
+                    f"Engine '{engine}' is not supported for format '{format}'. "
+                    f"Supported engines: {list(engines)}"
+                )
+            reader = engines[engine]
         return reader(path_or_url, **read_kwargs)
+
+
+def _with_stable_dtypes(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """
+    Cast every chunk to the dtypes inferred for the first one.
+
+    pandas infers dtypes per chunk, so an integer column becomes float64 in a
+    chunk with missing values, and an all-missing text column becomes float64.
+    Integer and boolean columns are widened to the nullable ``Int<N>`` and
+    ``boolean`` dtypes of the same width so they can hold missing values in
+    later chunks. Categorical columns keep per-chunk categories.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): Chunks from a chunked pandas reader.
+
+    Yields:
+        pd.DataFrame: The same chunks with consistent dtypes.
+
+    Raises:
+        ValueError: If a chunk cannot be converted to the inferred dtypes
+            (e.g. fractional values in a column inferred as integer).
+    """
+    iterator = iter(chunks)
+    first = next(iterator, None)
+    if first is None:
+        return
+
+    schema: Dict[Any, Any] = {}
+    for column, dtype in first.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Categories differ between chunks; the first chunk's would drop
+            # unseen values
+            schema[column] = "category"
+        elif pd.api.types.is_extension_array_dtype(dtype):
+            # Nullable and Arrow-backed dtypes already hold missing values
+            schema[column] = dtype
+        elif pd.api.types.is_bool_dtype(dtype):
+            schema[column] = "boolean"
+        elif pd.api.types.is_unsigned_integer_dtype(dtype):
+            schema[column] = f"UInt{dtype.itemsize * 8}"
+        elif pd.api.types.is_integer_dtype(dtype):
+            schema[column] = f"Int{dtype.itemsize * 8}"
+        else:
+            schema[column] = dtype
+
+    for chunk in itertools.chain([first], iterator):
+        try:
+            yield chunk.astype(schema)
+        except (TypeError, ValueError) as e:
+            raise ValueError(
+                f"Chunk dtypes differ from the first chunk ({e}). "
+                f"Pass explicit 'dtype' in read_kwargs."
+            ) from e
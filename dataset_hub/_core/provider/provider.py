@@ -1,8 +1,13 @@
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from dataclasses import asdict, dataclass
-from typing import Any, Dict, Generic, Type
+from pathlib import Path
+from typing import Any, Dict, Generic, Iterator, List, Optional, Type
 
+from dataset_hub._core import tracing
 from dataset_hub._core.data_bundle import UserDataT
+from dataset_hub._core.memory import MemoryEstimate
 
 
 @dataclass
@@ -86,6 +91,63 @@ class Provider(ABC, Generic[UserDataT]):
         """
         ...
 
+    async def aload(self, executor: Optional[Executor] = None) -> UserDataT:
+        """
+        Load the dataset without blocking the running event loop.
+
+        The default implementation runs :meth:`load` in `executor`, within
+        the tracing context of the caller.
+
+        Args:
+            executor (Executor, optional): Executor for the blocking load.
+                Default is the event loop's default thread pool.
+
+        Returns:
+            Any: The loaded dataset object, as returned by :meth:`load`.
+        """
+        loop = asyncio.get_running_loop()
+        load = tracing.run_in_context(self.load)
+        return await loop.run_in_executor(executor, load)
+
+    def iter_chunks(self, chunksize: int) -> Iterator[UserDataT]:
+        """
+        Load the dataset as an iterator of chunks of at most `chunksize` rows.
+
+        The default implementation yields the whole :meth:`load` result as a
+        single chunk; providers that can read incrementally override it.
+
+        Args:
+            chunksize (int): Maximum number of rows per chunk.
+
+        Returns:
+            Iterator[Any]: Iterator over the chunks.
+        """
+        yield self.load()
+
+    def estimate_memory(self) -> Optional[MemoryEstimate]:
+        """
+        Estimate the in-memory size of the loaded dataset before loading it.
+
+        Used to honor the ``max_memory`` setting (see :ref:`get_data`).
+        Providers that cannot tell return None.
+
+        Returns:
+            MemoryEstimate, optional: The estimate, or None if unknown.
+        """
+        return None
+
+    def fetch(self) -> List[Path]:
+        """
+        Download the provider's sources into the local cache without parsing them.
+
+        Used to warm the cache ahead of time (see :func:`dataset_hub.prefetch`).
+        Providers without downloadable sources return an empty list.
+
+        Returns:
+            List[Path]: Local paths of the cached source files.
+        """
+        return []
+
     def _normalize_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate and normalize the raw configuration using the provider's ConfigClass.
@@ -1,5 +1,6 @@
 from typing import Any, Dict, Type
 
+from .arrow_provider import ArrowProvider
 from .dataframe_provider import DataFrameProvider
 from .provider import Provider
 
@@ -12,7 +13,10 @@ class ProviderFactory:
     """
 
     # Registry mapping type string -> Provider class
-    _REGISTRY: Dict[str, Type[Provider[Any]]] = {"dataframe": DataFrameProvider}
+    _REGISTRY: Dict[str, Type[Provider[Any]]] = {
+        "dataframe": DataFrameProvider,
+        "arrow": ArrowProvider,
+    }
 
     @classmethod
     def build_provider(cls, provider_config: Dict[str, Any]) -> Provider[Any]:
@@ -42,3 +46,28 @@ class ProviderFactory:
             raise ValueError(f"No provider registered for type '{provider_type}'")
 
         return provider_cls(provider_params)
+
+    @classmethod
+    def build_providers(
+        cls, providers_config: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Provider[Any]]:
+        """
+        Build one Provider per table of a multi-part dataset.
+
+        Args:
+            providers_config (Dict[str, Dict[str, Any]]): Mapping of table name
+                to provider configuration (see :meth:`build_provider`).
+
+        Returns:
+            Dict[str, Provider]: Mapping of table name to Provider instance.
+
+        Raises:
+            ValueError: If no providers are configured or a type is not
+                registered.
+        """
+        if not providers_config:
+            raise ValueError("Config must include at least one provider")
+        return {
+            table: cls.build_provider(provider_config)
+            for table, provider_config in providers_config.items()
+        }
@@ -1 +1,21 @@
-DEFAULT_SETTINGS = {"verbose": True, "data_path": "/data", "save_local": True}
+import os
+
+DEFAULT_SETTINGS = {
+    "verbose": True,
+    "data_path": os.path.join(os.path.expanduser("~"), ".dataset_hub", "data"),
+    "save_local": True,
+    "columnar_cache": None,
+    "dtype_backend": None,
+    "read_engine": None,
+    "memory_cache_size": 0,
+    "max_memory": None,
+    "http_pool_size": 10,
+    "http_retries": 3,
+    "http_timeout": 30,
+    "download_segments": 4,
+    "segmented_download_threshold": 64 * 1024 * 1024,
+    "revalidate": False,
+    "stale_while_revalidate": False,
+    "trace_path": None,
+    "metrics_path": None,
+}
@@ -1,6 +1,6 @@
-from typing import Any
+from typing import Any, Dict
 
-RUNTIME_SETTINGS = {}
+RUNTIME_SETTINGS: Dict[str, Any] = {}
 
 
 def set_option(
@@ -11,6 +11,63 @@ def set_option(
     Updates a runtime setting that affects DatasetHub behavior for the
     current Python session.
 
+    Available options:
+
+    - ``verbose`` (bool): log a link to the dataset documentation after \
+        loading. Default ``True``.
+    - ``data_path`` (str): directory where downloaded datasets are cached. \
+        Default ``~/.dataset_hub/data``.
+    - ``save_local`` (bool): keep downloaded source files in ``data_path`` \
+        and reuse them on later loads. Default ``True``.
+    - ``columnar_cache`` (str, optional): after the first parse, also store \
+        the parsed table as ``"parquet"`` or ``"feather"`` next to the cached \
+        source and serve later loads from it (requires ``pyarrow``). \
+        Default ``None`` (disabled).
+    - ``dtype_backend`` (str, optional): ``"numpy_nullable"`` or \
+        ``"pyarrow"`` to parse columns without a declared dtype into nullable \
+        or Arrow-backed dtypes (``"pyarrow"`` requires ``pyarrow``). \
+        Default ``None`` (NumPy dtypes).
+    - ``read_engine`` (str, optional): parser engine for formats that \
+        support it, e.g. ``"pyarrow"`` for the multi-threaded CSV reader, or \
+        ``"auto"`` to use it when ``pyarrow`` is installed. A dataset config \
+        may set its own ``engine``. Default ``None`` (pandas default engine).
+    - ``memory_cache_size`` (int): byte budget of the in-process cache of \
+        loaded datasets; repeated loads with the same arguments return \
+        protected copies from memory, evicting the least recently used \
+        datasets beyond the budget (see ``cache_info()``/``cache_clear()``). \
+        Default ``0`` (disabled).
+    - ``max_memory`` (int, optional): byte budget for the tables of one \
+        load. Sizes are estimated before parsing; if they exceed the budget, \
+        tables that can be read incrementally are returned as iterators of \
+        chunks instead, and a ``MemoryError`` is raised before loading if \
+        the others alone do not fit. Default ``None`` (unlimited).
+    - ``http_pool_size`` (int): number of kept-alive connections per host in \
+        the shared HTTP session. Default ``10``.
+    - ``http_retries`` (int): retries on connection errors and 429/5xx \
+        responses. Default ``3``.
+    - ``http_timeout`` (float): timeout in seconds of each HTTP request. \
+        Default ``30``.
+    - ``download_segments`` (int): number of byte ranges fetched in \
+        parallel for large downloads; ``1`` disables segmented downloads. \
+        Default ``4``.
+    - ``segmented_download_threshold`` (int): minimum size in bytes of a \
+        source downloaded in segments. Default ``64 MiB``.
+    - ``revalidate`` (bool): on every load of a cached dataset, ask the \
+        source whether it changed (``If-None-Match`` / \
+        ``If-Modified-Since``) and download it again only if it did. \
+        Default ``False``.
+    - ``stale_while_revalidate`` (bool): with ``revalidate``, return the \
+        cached copy immediately and revalidate it in a background thread. \
+        Default ``False``.
+    - ``trace_path`` (str, optional): file to which every timed stage of a \
+        load (config, fetch, download, decompress, parse, package) is \
+        appended as one JSON line (see ``add_trace_callback()``). \
+        Default ``None`` (disabled).
+    - ``metrics_path`` (str, optional): file rewritten after every load \
+        with the library metrics in the Prometheus text format, e.g. for \
+        the node exporter textfile collector (see ``metrics_snapshot()``). \
+        Default ``None`` (disabled).
+
     Args:
         key (str): Name of the option to set.
         value (Any): New value assigned to the option.
@@ -0,0 +1,329 @@
+import contextvars
+import io
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, cast
+
+from dataset_hub._core import metrics
+from dataset_hub._core.settings.loader import load_settings
+from dataset_hub._core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TraceCallback = Callable[["Span"], None]
+
+_CALLBACKS: List[TraceCallback] = []
+_LOCK = threading.Lock()
+
+# Span open in the current thread or task; worker threads receive it through
+# contextvars.copy_context()
+_CURRENT: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "dataset_hub_span", default=None
+)
+
+
+@dataclass
+class Span:
+    """
+    One timed stage of a dataset load.
+
+    Stages emitted by the library:
+
+    - ``get_data``: a whole :func:`get_data` / :func:`aget_data` call.
+    - ``config``: resolving the dataset configuration.
+    - ``load``: loading one table of the dataset.
+    - ``fetch``: providing a cached copy of a source (``cache_hit`` tells
+      whether a download was needed).
+    - ``download``: an HTTP transfer (``bytes`` received).
+    - ``decompress``: reading an archive member; its duration is the time
+      spent decompressing while the parser consumed the member.
+    - ``parse``: parsing a file into a table (``rows``, ``columns``).
+    - ``package``: applying filters, column selection and the index.
+    - ``estimate``: predicting the memory size of a table (``max_memory``).
+
+    Attributes:
+        name (str): Stage name.
+        trace_id (str): Identifier shared by all spans of one top-level call.
+        span_id (str): Identifier of this span.
+        parent_id (str, optional): Identifier of the enclosing span.
+        start (float): Start time as a Unix timestamp.
+        duration (float): Duration in seconds.
+        attributes (Dict[str, Any]): Stage details, e.g. ``dataset``,
+            ``url``, ``bytes``, ``rows``.
+        error (str, optional): Exception raised inside the stage.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start: float = 0.0
+    duration: float = 0.0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the span as a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+def add_trace_callback(callback: TraceCallback) -> None:
+    """
+    Register a function called with every finished :class:`Span`.
+
+    Callbacks run synchronously in the thread that finished the span, so
+    they should be fast. Exceptions they raise are logged and ignored.
+
+    Args:
+        callback (Callable[[Span], None]): Function receiving the spans.
+
+    Example:
+
+        .. code-block:: python
+
+            import dataset_hub
+
+            def report(span):
+                print(span.name, f"{span.duration:.3f}s", span.attributes)
+
+            dataset_hub.add_trace_callback(report)
+            dataset_hub.timeseries.get_household_power()
+    """
+    with _LOCK:
+        _CALLBACKS.append(callback)
+
+
+def remove_trace_callback(callback: TraceCallback) -> None:
+    """
+    Unregister a callback added with :func:`add_trace_callback`.
+
+    Args:
+        callback (Callable[[Span], None]): Registered function.
+
+    Raises:
+        ValueError: If the callback is not registered.
+    """
+    with _LOCK:
+        _CALLBACKS.remove(callback)
+
+
+def is_enabled() -> bool:
+    """Check whether spans are consumed by a callback or the ``trace_path`` file."""
+    return bool(_CALLBACKS) or bool(load_settings().get("trace_path"))
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Time a stage and emit it as a :class:`Span` when it ends.
+
+    Attributes can be added to the yielded span while the stage runs. Every
+    span updates the library metrics (see :func:`metrics_snapshot`); it is
+    passed on only to registered consumers.
+
+    Args:
+        name (str): Stage name.
+        **attributes: Initial span attributes.
+
+    Yields:
+        Span: The open span.
+    """
+    parent = _CURRENT.get()
+    current = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+        span_id=uuid.uuid4().hex[:16],
+        parent_id=parent.span_id if parent else None,
+        start=time.time(),
+        attributes=attributes,
+    )
+    metrics.open_span(current)
+    token = _CURRENT.set(current)
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.duration = time.perf_counter() - started
+        _CURRENT.reset(token)
+        _emit(current)
+
+
+def emit(name: str, start: float, duration: float, **attributes: Any) -> None:
+    """
+    Emit a span measured by the caller, as a child of the current span.
+
+    Used for stages that do not run as one contiguous block (e.g.
+    decompression interleaved with parsing). Like :func:`span`, it always
+    updates the library metrics.
+
+    Args:
+        name (str): Stage name.
+        start (float): Start time as a Unix timestamp.
+        duration (float): Duration in seconds.
+        **attributes: Span attributes.
+    """
+    parent = _CURRENT.get()
+    _emit(
+        Span(
+            name=name,
+            trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            start=start,
+            duration=duration,
+            attributes=attributes,
+        )
+    )
+
+
+def run_in_context(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Bind `func` to the current context, so spans it opens in another thread
+    are children of the current span.
+
+    Args:
+        func (Callable): Function to run later, e.g. in an executor.
+
+    Returns:
+        Callable: Function running `func` in a copy of the current context.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        return context.run(func, *args, **kwargs)
+
+    return run
+
+
+def iterate_in_context(iterator: Iterator[Any]) -> Iterator[Any]:
+    """
+    Bind a lazy iterator to the current context, so spans opened while it is
+    consumed later (e.g. the chunks of :func:`get_data`) join the current
+    trace as children of the current span.
+
+    Args:
+        iterator (Iterator): Iterator doing work on every ``next()``.
+
+    Returns:
+        Iterator: Iterator yielding the same items.
+    """
+    context = contextvars.copy_context()
+
+    def generate() -> Iterator[Any]:
+        try:
+            while True:
+                try:
+                    item = context.run(next, iterator)
+                except StopIteration:
+                    return
+                yield item
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                context.run(close)
+
+    return generate()
+
+
+class TimedReader(io.RawIOBase):
+    """
+    Binary reader measuring the time and bytes read from a wrapped stream.
+
+    Used to attribute decompression time of archive members, which happens
+    inside the parser's reads.
+
+    Attributes:
+        seconds (float): Time spent in reads of the wrapped stream.
+        bytes (int): Bytes returned by the wrapped stream.
+        start (float, optional): Unix time of the first read.
+    """
+
+    def __init__(self, raw: IO[bytes]) -> None:
+        super().__init__()
+        self._raw = raw
+        self.seconds = 0.0
+        self.bytes = 0
+        self.start: Optional[float] = None
+
+    @property
+    def name(self) -> Any:
+        """Name of the wrapped stream (e.g. the archive member), if any."""
+        return getattr(self._raw, "name", None)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if self.start is None:
+            self.start = time.time()
+        started = time.perf_counter()
+        data = self._raw.read(len(buffer))
+        self.seconds += time.perf_counter() - started
+        size = len(data)
+        buffer[:size] = data
+        self.bytes += size
+        return size
+
+
+@contextmanager
+def timed_reader(
+    raw: IO[bytes], name: str = "decompress", **attributes: Any
+) -> Iterator[IO[bytes]]:
+    """
+    Wrap a stream in a :class:`TimedReader` and emit its read time as a span.
+
+    Args:
+        raw (IO[bytes]): Stream to measure.
+        name (str): Stage name of the emitted span.
+        **attributes: Span attributes.
+
+    Yields:
+        IO[bytes]: Stream to read from.
+    """
+    reader = TimedReader(raw)
+    try:
+        yield cast(IO[bytes], reader)
+    finally:
+        emit(
+            name,
+            reader.start or time.time(),
+            reader.seconds,
+            bytes=reader.bytes,
+            **attributes,
+        )
+
+
+def _emit(finished: Span) -> None:
+    """
+    Pass a finished span to the metrics, then to the callbacks and the
+    ``trace_path`` exporter if any is configured.
+    """
+    metrics.observe_span(finished)
+    with _LOCK:
+        callbacks = list(_CALLBACKS)
+    for callback in callbacks:
+        try:
+            callback(finished)
+        except Exception as e:
+            logger.warning(f"Trace callback {callback!r} failed: {e}")
+
+    trace_path = load_settings().get("trace_path")
+    if trace_path:
+        _export_json_line(finished, trace_path)
+
+
+def _export_json_line(finished: Span, trace_path: str) -> None:
+    """Append a span as one JSON line to `trace_path`."""
+    line = json.dumps(finished.to_dict(), default=str)
+    try:
+        with _LOCK, open(trace_path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError as e:
+        logger.warning(f"Could not write trace file {trace_path}: {e}")
@@ -0,0 +1,83 @@
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+
+@contextmanager
+def atomic_path(path: Path) -> Iterator[Path]:
+    """
+    Yield a temporary sibling of `path` that atomically replaces it on success.
+
+    The caller writes the complete file to the yielded path. When the block
+    exits without an error the temporary file is moved over `path` with
+    :func:`os.replace`, so concurrent readers either see the previous file or
+    the complete new one, never a partially written file. On error the
+    temporary file is removed and `path` is left untouched.
+
+    Args:
+        path (Path): Final destination of the file.
+
+    Yields:
+        Path: Temporary path in the same directory as `path`.
+
+    Example::
+
+        with atomic_path(Path("/tmp/data.csv")) as tmp:
+            tmp.write_bytes(b"a,b\\n1,2\\n")
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive inter-process lock on `path` for the duration of a block.
+
+    The lock file is created if needed and left in place afterwards. Blocks
+    until the lock is acquired.
+
+    Args:
+        path (Path): Lock file path (e.g. '<cached file>.lock').
+
+    Yields:
+        None
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        if sys.platform == "win32":
+            import msvcrt
+
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -1,5 +1,6 @@
 import logging
 from functools import wraps
+from inspect import signature
 from logging import Logger
 from typing import Any, Callable, Optional
 
@@ -59,12 +60,11 @@ def log_dataset_doc_doc_link() -> (
     def decorator(
         func: Callable[..., DataBundle[Any]],
     ) -> Callable[..., DataBundle[Any]]:
+        # Computed once here rather than on every call
+        sig = signature(func)
 
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> DataBundle[Any]:
-            from inspect import signature  # get arg values
-
-            sig = signature(func)
             bound = sig.bind(*args, **kwargs)
             bound.apply_defaults()
             dataset_name = bound.arguments["dataset_name"]
@@ -73,23 +73,38 @@ def log_dataset_doc_doc_link() -> (
 
             result = func(*args, **kwargs)
 
-            if verbose is None:
-                settings = load_settings()
-                verbose = settings["verbose"]
-            if verbose:
-                # Build logger name to match the module where get_data is actually
-                # called via the decorator in public dataset getters
-                # (e.g. dataset_hub.classification.get_iris()). This ensures logs
-                # appear in the correct namespace and are consistent with library
-                # structure.
-                logger_name = f"dataset_hub.{task_type}.datasets"
-                logger = get_logger(logger_name)
-                logger.info(
-                    f"Dataset info & details: https://getdataset.github.io/dataset-hub/datasets/{task_type}/{dataset_name}.html"
-                )
+            log_dataset_doc_link(dataset_name, task_type, verbose)
 
             return result
 
         return wrapper
 
     return decorator
+
+
+def log_dataset_doc_link(
+    dataset_name: str, task_type: str, verbose: Optional[bool]
+) -> None:
+    """
+    Log a link to the dataset documentation if `verbose` is enabled.
+
+    Args:
+        dataset_name (str): Name of the dataset.
+        task_type (str): Task type of the dataset.
+        verbose (bool, optional): Whether to log. If None, the global
+            ``verbose`` setting is used.
+    """
+    if verbose is None:
+        settings = load_settings()
+        verbose = settings["verbose"]
+    if verbose:
+        # Build logger name to match the module where get_data is actually
+        # called via the decorator in public dataset getters
+        # (e.g. dataset_hub.classification.get_iris()). This ensures logs
+        # appear in the correct namespace and are consistent with library
+        # structure.
+        logger_name = f"dataset_hub.{task_type}.datasets"
+        logger = get_logger(logger_name)
+        logger.info(
+            f"Dataset info & details: https://getdataset.github.io/dataset-hub/datasets/{task_type}/{dataset_name}.html"
+        )
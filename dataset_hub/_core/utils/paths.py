@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from dataset_hub._core import catalog
 from dataset_hub._core.settings.loader import load_settings
 
 
@@ -33,5 +34,14 @@ def list_available_datasets(task_type: str) -> list[str]:
     Returns:
         List[str]: A list of dataset names (without file extensions).
     """
-    task_configs_path = Path(__file__).parent.parent.parent / task_type / "_configs"
-    return [p.stem for p in task_configs_path.glob("*.yaml")]
+    return catalog.list_datasets(task_type)
+
+
+def list_task_types() -> list[str]:
+    """
+    List all task types that ship dataset configs.
+
+    Returns:
+        List[str]: Task type names (e.g. 'classification'), sorted.
+    """
+    return catalog.list_task_types()
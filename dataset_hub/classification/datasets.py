@@ -1,14 +1,53 @@
-from typing import Optional
+from typing import Iterator, List, Optional, Union, overload
 
 import pandas as pd
 
 from dataset_hub._core.data_bundle import DataBundle
+from dataset_hub._core.filters import Filter
 from dataset_hub._core.get_data import get_data as _get_data
 
 task_type = "classification"
 
 
-def get_titanic(verbose: Optional[bool] = None) -> pd.DataFrame:
+@overload
+def get_titanic(
+    verbose: Optional[bool] = None,
+    chunksize: None = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    max_memory: None = None,
+) -> pd.DataFrame: ...
+
+
+@overload
+def get_titanic(
+    verbose: Optional[bool] = None,
+    *,
+    chunksize: int,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    max_memory: Optional[int] = None,
+) -> Iterator[pd.DataFrame]: ...
+
+
+@overload
+def get_titanic(
+    verbose: Optional[bool] = None,
+    chunksize: None = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    *,
+    max_memory: int,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]: ...
+
+
+def get_titanic(
+    verbose: Optional[bool] = None,
+    chunksize: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    max_memory: Optional[int] = None,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Load and return the Titanic dataset (classification).
 
@@ -22,7 +61,7 @@ def get_titanic(verbose: Optional[bool] = None) -> pd.DataFrame:
 
     - ``pclass`` (int): passenger class (1 = 1st, 2 = 2nd, 3 = 3rd)
     - ``name`` (str): full name of the passenger
-    - ``sex`` (str): passenger gender
+    - ``sex`` (category): passenger gender
     - ``age`` (float): passenger age in years, may contain missing values
     - ``fare`` (float): ticket fare, may contain missing values
     - ``sibsp`` (int): number of siblings/spouses aboard
@@ -34,9 +73,27 @@ def get_titanic(verbose: Optional[bool] = None) -> pd.DataFrame:
             If True, the function prints a link to the dataset documentation in \
             the log output after loading. (e.g., on this page)
             Default is None, which uses the global :ref:`settings`.
+        chunksize (int, optional):
+            If given, return an iterator of DataFrames with at most \
+                `chunksize` rows each instead of the full table, so memory \
+                use does not grow with the dataset size.
+        columns (List[str], optional):
+            Columns to return. Other columns are never parsed where the \
+                source format allows it.
+        filters (List[Tuple[str, str, Any]], optional):
+            Row predicates ``(column, op, value)``, e.g. \
+                ``[("pclass", "==", 1)]``; only matching rows are returned.
+        max_memory (int, optional):
+            Memory budget in bytes for this call, overriding the \
+                ``max_memory`` option. If the table is estimated to exceed \
+                it, an iterator of DataFrames is returned instead. Pass the \
+                budget here rather than only setting the option so that type \
+                checkers expect that iterator.
 
     Returns:
         pandas.DataFrame: The Titanic dataset with all features including the target.
+        If `chunksize` is given, or the table exceeds `max_memory`, an \
+            iterator of such DataFrames.
         
     Quick Start:
 
@@ -47,13 +104,57 @@ def get_titanic(verbose: Optional[bool] = None) -> pd.DataFrame:
         df = get_titanic()
 
     """
-    dataset: DataBundle[pd.DataFrame] = _get_data(
-        dataset_name="titanic", task_type=task_type, verbose=verbose
+    dataset: DataBundle[Union[pd.DataFrame, Iterator[pd.DataFrame]]] = _get_data(
+        dataset_name="titanic",
+        task_type=task_type,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        filters=filters,
+        max_memory=max_memory,
     )
     return dataset["data"]
 
 
-def get_iris(verbose: Optional[bool] = None) -> pd.DataFrame:
+@overload
+def get_iris(
+    verbose: Optional[bool] = None,
+    chunksize: None = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    max_memory: None = None,
+) -> pd.DataFrame: ...
+
+
+@overload
+def get_iris(
+    verbose: Optional[bool] = None,
+    *,
+    chunksize: int,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    max_memory: Optional[int] = None,
+) -> Iterator[pd.DataFrame]: ...
+
+
+@overload
+def get_iris(
+    verbose: Optional[bool] = None,
+    chunksize: None = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    *,
+    max_memory: int,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]: ...
+
+
+def get_iris(
+    verbose: Optional[bool] = None,
+    chunksize: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    max_memory: Optional[int] = None,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Load and return the Iris dataset (classification).
 
@@ -68,7 +169,7 @@ def get_iris(verbose: Optional[bool] = None) -> pd.DataFrame:
     - ``sepal_width`` (float): width of the sepal in cm
     - ``petal_length`` (float): length of the petal in cm
     - ``petal_width`` (float): width of the petal in cm
-    - ``species`` 🚩 (str): **target variable**, species name (setosa, \
+    - ``species`` 🚩 (category): **target variable**, species name (setosa, \
         versicolor, virginica)
 
     Args:
@@ -76,9 +177,27 @@ def get_iris(verbose: Optional[bool] = None) -> pd.DataFrame:
             If True, the function prints a link to the dataset documentation \
                 in the log output after loading. (e.g., on this page)
             Default is None, which uses the global :ref:`settings`.
+        chunksize (int, optional):
+            If given, return an iterator of DataFrames with at most \
+                `chunksize` rows each instead of the full table, so memory \
+                use does not grow with the dataset size.
+        columns (List[str], optional):
+            Columns to return. Other columns are never parsed where the \
+                source format allows it.
+        filters (List[Tuple[str, str, Any]], optional):
+            Row predicates ``(column, op, value)``, e.g. \
+                ``[("species", "!=", "setosa")]``; only matching rows are returned.
+        max_memory (int, optional):
+            Memory budget in bytes for this call, overriding the \
+                ``max_memory`` option. If the table is estimated to exceed \
+                it, an iterator of DataFrames is returned instead. Pass the \
+                budget here rather than only setting the option so that type \
+                checkers expect that iterator.
 
     Returns:
         pandas.DataFrame: The Iris dataset with all features including the target.
+        If `chunksize` is given, or the table exceeds `max_memory`, an \
+            iterator of such DataFrames.
 
     Quick Start:
 
@@ -89,7 +208,13 @@ def get_iris(verbose: Optional[bool] = None) -> pd.DataFrame:
         df = get_iris()
 
     """
-    dataset: DataBundle[pd.DataFrame] = _get_data(
-        dataset_name="iris", task_type=task_type, verbose=verbose
+    dataset: DataBundle[Union[pd.DataFrame, Iterator[pd.DataFrame]]] = _get_data(
+        dataset_name="iris",
+        task_type=task_type,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        filters=filters,
+        max_memory=max_memory,
     )
     return dataset["data"]
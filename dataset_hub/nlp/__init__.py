@@ -1,3 +1,22 @@
-from .datasets import get_imdb
-
-__all__ = ["get_imdb"]
\ No newline at end of file
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .datasets import get_imdb
+
+__all__ = ["get_imdb"]
+
+
+def __getattr__(name: str) -> Any:
+    # Getters are imported on first access, so importing the task package
+    # does not import pandas
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import datasets
+
+    value = getattr(datasets, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
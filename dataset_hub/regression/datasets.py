@@ -1,14 +1,53 @@
-from typing import Optional
+from typing import Iterator, List, Optional, Union, overload
 
 import pandas as pd
 
 from dataset_hub._core.data_bundle import DataBundle
+from dataset_hub._core.filters import Filter
 from dataset_hub._core.get_data import get_data as _get_data
 
 task_type = "regression"
 
 
-def get_housing(verbose: Optional[bool] = None) -> pd.DataFrame:
+@overload
+def get_housing(
+    verbose: Optional[bool] = None,
+    chunksize: None = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    max_memory: None = None,
+) -> pd.DataFrame: ...
+
+
+@overload
+def get_housing(
+    verbose: Optional[bool] = None,
+    *,
+    chunksize: int,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    max_memory: Optional[int] = None,
+) -> Iterator[pd.DataFrame]: ...
+
+
+@overload
+def get_housing(
+    verbose: Optional[bool] = None,
+    chunksize: None = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    *,
+    max_memory: int,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]: ...
+
+
+def get_housing(
+    verbose: Optional[bool] = None,
+    chunksize: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    max_memory: Optional[int] = None,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Load and return the California Housing dataset (regression).
 
@@ -38,7 +77,7 @@ def get_housing(verbose: Optional[bool] = None) -> pd.DataFrame:
     - ``households`` (int): total number of households within a block
     - ``median_income`` (float): median income for households in tens of thousands \
         of USD
-    - ``ocean_proximity`` (str): location of the house with respect to ocean/sea
+    - ``ocean_proximity`` (category): location of the house with respect to ocean/sea
     - ``median_house_value`` 🚩 (float): median house value in USD
 
     Args:
@@ -46,10 +85,28 @@ def get_housing(verbose: Optional[bool] = None) -> pd.DataFrame:
             If True, the function prints a link to the dataset documentation \
                 in the log output after loading. (e.g., on this page)
             Default is None, which uses the global :ref:`settings`.
+        chunksize (int, optional):
+            If given, return an iterator of DataFrames with at most \
+                `chunksize` rows each instead of the full table, so memory \
+                use does not grow with the dataset size.
+        columns (List[str], optional):
+            Columns to return. Other columns are never parsed where the \
+                source format allows it.
+        filters (List[Tuple[str, str, Any]], optional):
+            Row predicates ``(column, op, value)``, e.g. \
+                ``[("median_income", ">", 5.0)]``; only matching rows are returned.
+        max_memory (int, optional):
+            Memory budget in bytes for this call, overriding the \
+                ``max_memory`` option. If the table is estimated to exceed \
+                it, an iterator of DataFrames is returned instead. Pass the \
+                budget here rather than only setting the option so that type \
+                checkers expect that iterator.
 
     Returns:
         pandas.DataFrame: The California Housing dataset with all features \
             including the target.
+        If `chunksize` is given, or the table exceeds `max_memory`, an \
+            iterator of such DataFrames.
 
     Quick Start:
 
@@ -61,7 +118,13 @@ def get_housing(verbose: Optional[bool] = None) -> pd.DataFrame:
 
     """
 
-    dataset: DataBundle[pd.DataFrame] = _get_data(
-        dataset_name="california_housing", task_type=task_type, verbose=verbose
+    dataset: DataBundle[Union[pd.DataFrame, Iterator[pd.DataFrame]]] = _get_data(
+        dataset_name="california_housing",
+        task_type=task_type,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        filters=filters,
+        max_memory=max_memory,
     )
     return dataset["data"]
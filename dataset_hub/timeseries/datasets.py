@@ -1,14 +1,53 @@
-from typing import Optional
+from typing import Iterator, List, Optional, Union, overload
 
 import pandas as pd
 
 from dataset_hub._core.data_bundle import DataBundle
+from dataset_hub._core.filters import Filter
 from dataset_hub._core.get_data import get_data as _get_data
 
 task_type = "timeseries"
 
 
-def get_household_power(verbose: Optional[bool] = None) -> pd.DataFrame:
+@overload
+def get_household_power(
+    verbose: Optional[bool] = None,
+    chunksize: None = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    max_memory: None = None,
+) -> pd.DataFrame: ...
+
+
+@overload
+def get_household_power(
+    verbose: Optional[bool] = None,
+    *,
+    chunksize: int,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    max_memory: Optional[int] = None,
+) -> Iterator[pd.DataFrame]: ...
+
+
+@overload
+def get_household_power(
+    verbose: Optional[bool] = None,
+    chunksize: None = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    *,
+    max_memory: int,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]: ...
+
+
+def get_household_power(
+    verbose: Optional[bool] = None,
+    chunksize: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+    max_memory: Optional[int] = None,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Load and return the Individual Household Electric Power Consumption dataset.
 
@@ -25,10 +64,13 @@ def get_household_power(verbose: Optional[bool] = None) -> pd.DataFrame:
         Repository:  
     `Individual Household Electric Power Consumption <https://archive.ics.uci.edu/dataset/235/individual+household+electric+power+consumption>`_
 
+    Index:
+
+    - ``datetime`` (datetime64): Date and time of measurement, parsed from the \
+        original ``Date`` (dd/mm/yyyy) and ``Time`` (hh:mm:ss) columns
+
     Columns:
 
-    - ``Date`` (str): Date of measurement in format dd/mm/yyyy
-    - ``Time`` (str): Time of measurement in format hh:mm:ss
     - ``Global_active_power`` (float): Household global minute-averaged active \
         power (kilowatt)
     - ``Global_reactive_power`` (float): Household global minute-averaged reactive \
@@ -54,9 +96,30 @@ def get_household_power(verbose: Optional[bool] = None) -> pd.DataFrame:
             If True, the function prints a link to the dataset documentation \
                 in the log output after loading. (e.g., on this page)
             Default is None, which uses the global :ref:`settings`.
+        chunksize (int, optional):
+            If given, return an iterator of DataFrames with at most \
+                `chunksize` rows each instead of the full table, so memory \
+                use does not grow with the dataset size.
+        columns (List[str], optional):
+            Columns to return. Other columns are never parsed where the \
+                source format allows it.
+        filters (List[Tuple[str, str, Any]], optional):
+            Row predicates ``(column, op, value)``, e.g. \
+                ``[("Voltage", ">=", 240.0)]``; only matching rows are returned. \
+                The ``datetime`` index can be filtered too, e.g. \
+                ``[("datetime", ">=", pd.Timestamp("2008-01-01"))]``.
+        max_memory (int, optional):
+            Memory budget in bytes for this call, overriding the \
+                ``max_memory`` option. If the table is estimated to exceed \
+                it, an iterator of DataFrames is returned instead. Pass the \
+                budget here rather than only setting the option so that type \
+                checkers expect that iterator.
 
     Returns:
-        pandas.DataFrame: The household power consumption dataset with all features.
+        pandas.DataFrame: The household power consumption dataset with all features, \
+            indexed by a ``DatetimeIndex``.
+        If `chunksize` is given, or the table exceeds `max_memory`, an \
+            iterator of such DataFrames.
 
     Quick Start:
 
@@ -65,10 +128,21 @@ def get_household_power(verbose: Optional[bool] = None) -> pd.DataFrame:
         from dataset_hub.timeseries import get_household_power
 
         df = get_household_power()
+        daily = df["Global_active_power"].resample("D").mean()
+
+        # Constant memory: process the table in chunks of 100k rows
+        for chunk in get_household_power(chunksize=100_000):
+            ...
 
     """  # noqa
 
-    dataset: DataBundle[pd.DataFrame] = _get_data(
-        dataset_name="household_power", task_type=task_type, verbose=verbose
+    dataset: DataBundle[Union[pd.DataFrame, Iterator[pd.DataFrame]]] = _get_data(
+        dataset_name="household_power",
+        task_type=task_type,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        filters=filters,
+        max_memory=max_memory,
     )
     return dataset["data"]
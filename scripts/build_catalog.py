@@ -0,0 +1,48 @@
+"""
+Compile the bundled dataset YAML configs into ``catalog.json``.
+
+``ConfigManager`` and the dataset listings read the compiled catalog shipped
+as package data instead of the YAML files, so it must be rebuilt whenever a
+config under ``dataset_hub/<task_type>/_configs/`` changes. The core tests
+fail while the catalog is out of date.
+
+Usage
+-----
+Run this script from the project root:
+
+    python scripts/build_catalog.py          # rewrite the catalog
+    python scripts/build_catalog.py --check  # only verify it is up to date
+"""
+
+import argparse
+import json
+import sys
+
+from dataset_hub._core.catalog import CATALOG_PATH, build_catalog, write_catalog
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compile the dataset catalog.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only verify that the catalog matches the YAML configs",
+    )
+    args = parser.parse_args()
+
+    if not args.check:
+        write_catalog()
+        print(f"Wrote {CATALOG_PATH}")
+        return 0
+
+    current = None
+    if CATALOG_PATH.exists():
+        current = json.loads(CATALOG_PATH.read_text(encoding="utf-8"))
+    if current != build_catalog():
+        print(f"{CATALOG_PATH} is out of date", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
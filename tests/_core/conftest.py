@@ -0,0 +1,21 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from dataset_hub._core.memory_cache import cache_clear
+from dataset_hub._core.metrics import reset_metrics
+from dataset_hub._core.settings.user_settings import RUNTIME_SETTINGS
+
+
+@pytest.fixture(autouse=True)
+def isolated_settings(tmp_path: Path) -> Iterator[None]:
+    """Run each test with fresh runtime settings and a temporary data_path."""
+    saved = dict(RUNTIME_SETTINGS)
+    RUNTIME_SETTINGS.clear()
+    RUNTIME_SETTINGS["data_path"] = str(tmp_path / "data")
+    cache_clear()
+    reset_metrics()
+    yield
+    RUNTIME_SETTINGS.clear()
+    RUNTIME_SETTINGS.update(saved)
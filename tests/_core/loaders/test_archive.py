@@ -0,0 +1,122 @@
+"""Unit tests for ArchiveReader."""
+
+import gzip
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from dataset_hub._core.loaders.archive import ArchiveReader
+
+MEMBERS = {
+    "data/train.csv": b"a,b\n1,2\n",
+    "data/README.txt": b"readme\n",
+}
+
+
+def _zip(path: Path, members: Dict[str, bytes]) -> Path:
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("data/", b"")
+        for name, body in members.items():
+            archive.writestr(name, body)
+    return path
+
+
+def _tar(path: Path, members: Dict[str, bytes]) -> Path:
+    with tarfile.open(path, "w:gz") as tar:
+        for name, body in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(body)
+            tar.addfile(info, io.BytesIO(body))
+    return path
+
+
+class TestArchiveReaderDetection:
+    """Tests for archive type detection."""
+
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            ("data.zip", "zip"),
+            ("data.TAR.GZ", "tar"),
+            ("data.tgz", "tar"),
+            ("data.tar", "tar"),
+            ("data.csv.gz", "gzip"),
+            ("data.7z", None),
+            ("data.csv", None),
+        ],
+    )
+    def test_archive_type(self, filename: str, expected: str) -> None:
+        """Archive type is detected from the file name suffix."""
+        assert ArchiveReader.archive_type(filename) == expected
+
+
+class TestArchiveReaderMembers:
+    """Tests for listing, selecting and opening archive members."""
+
+    def test_list_members_skips_directories(self, tmp_path: Path) -> None:
+        """Only regular files are listed."""
+        path = _zip(tmp_path / "data.zip", MEMBERS)
+        assert ArchiveReader.list_members(path) == list(MEMBERS)
+
+    def test_list_members_gzip(self, tmp_path: Path) -> None:
+        """A gzip file has one member named without the '.gz' suffix."""
+        path = tmp_path / "data.csv.gz"
+        path.write_bytes(gzip.compress(b"a\n1\n"))
+        assert ArchiveReader.list_members(path) == ["data.csv"]
+
+    def test_select_member_by_format(self) -> None:
+        """Without 'member' the single file of the source format is used."""
+        members = ["notes.md", "table.csv"]
+        assert ArchiveReader.select_member(members, format_="csv") == "table.csv"
+
+    def test_select_member_by_pattern(self) -> None:
+        """'member' may be a glob pattern."""
+        members = list(MEMBERS)
+        assert ArchiveReader.select_member(members, "*/train.*") == "data/train.csv"
+
+    def test_select_member_ambiguous_raises(self) -> None:
+        """Several matching members require an explicit 'member'."""
+        with pytest.raises(ValueError, match="Set 'member'"):
+            ArchiveReader.select_member(list(MEMBERS), format_="csv")
+
+    def test_select_member_missing_raises(self) -> None:
+        """An unknown 'member' is reported with the available names."""
+        with pytest.raises(ValueError, match="member 'test.csv', found 0"):
+            ArchiveReader.select_member(list(MEMBERS), "test.csv")
+
+    @pytest.mark.parametrize("builder, filename", [(_zip, "d.zip"), (_tar, "d.tgz")])
+    def test_open_member_streams_content(
+        self, tmp_path: Path, builder: object, filename: str
+    ) -> None:
+        """The selected member is readable in chunks."""
+        path = builder(tmp_path / filename, MEMBERS)  # type: ignore[operator]
+
+        with ArchiveReader.open_member(path, "data/train.csv") as f:
+            chunks = iter(lambda: f.read(3), b"")
+            assert b"".join(chunks) == MEMBERS["data/train.csv"]
+
+    def test_open_member_unsupported_archive(self, tmp_path: Path) -> None:
+        """7z archives are rejected with a clear error."""
+        path = tmp_path / "data.7z"
+        path.write_bytes(b"7z")
+        with pytest.raises(ValueError, match="Unsupported archive 'data.7z'"):
+            with ArchiveReader.open_member(path):
+                pass
+
+    @pytest.mark.parametrize("builder, filename", [(_zip, "d.zip"), (_tar, "d.tgz")])
+    def test_member_size(self, tmp_path: Path, builder: object, filename: str) -> None:
+        """The uncompressed member size is read from the archive metadata."""
+        path = builder(tmp_path / filename, MEMBERS)  # type: ignore[operator]
+
+        size = ArchiveReader.member_size(path, "data/train.csv")
+        assert size == len(MEMBERS["data/train.csv"])
+
+    def test_member_size_gzip(self, tmp_path: Path) -> None:
+        """The size of a gzip file comes from its trailer."""
+        path = tmp_path / "data.csv.gz"
+        path.write_bytes(gzip.compress(b"a\n1\n" * 100))
+        assert ArchiveReader.member_size(path) == 400
@@ -1,5 +1,8 @@
 """Unit tests for Buffer classes and BufferFactory."""
 
+import mmap
+from pathlib import Path
+
 import pytest
 
 from dataset_hub._core.loaders.buffer import (
@@ -45,6 +48,23 @@ class TestBufferClasses:
         assert buffer.duration == 180.5
         assert buffer.format == "mp3"
 
+    def test_buffers_use_slots(self) -> None:
+        """Buffer classes define __slots__ and have no instance __dict__."""
+        buffer = ArchiveBuffer(name="archive.zip", data=b"zip_content")
+        assert not hasattr(buffer, "__dict__")
+        with pytest.raises(AttributeError):
+            buffer.extra = 1  # type: ignore[attr-defined]
+
+    def test_buffer_view_is_zero_copy(self) -> None:
+        """view exposes a read-only memoryview sharing the payload."""
+        payload = bytearray(b"content")
+        buffer = Buffer(name="file.txt", data=memoryview(payload))
+        view = buffer.view
+        assert view.readonly
+        payload[0:1] = b"C"
+        assert view.tobytes() == b"Content"
+        assert len(buffer) == 7
+
     def test_image_buffer_creation(self) -> None:
         """ImageBuffer creates with all required image fields."""
         buffer = ImageBuffer(
@@ -139,10 +159,47 @@ class TestBufferFactory:
             BufferFactory.build("file.csv", "string_content")  # type: ignore
 
     def test_build_bytearray_data(self) -> None:
-        """Factory accepts bytearray as data and converts to bytes."""
-        buffer = BufferFactory.build("file.csv", bytearray(b"content"))  # type: ignore
+        """Factory wraps a bytearray in a memoryview without copying it."""
+        payload = bytearray(b"content")
+        buffer = BufferFactory.build("file.csv", payload)
         assert buffer.data == b"content"
-        assert isinstance(buffer.data, bytes)
+        assert isinstance(buffer.data, memoryview)
+        payload[0:1] = b"C"
+        assert buffer.data == b"Content"
+
+    def test_build_bytes_data_not_copied(self) -> None:
+        """Factory keeps the given bytes object as is."""
+        payload = b"content"
+        buffer = BufferFactory.build("file.csv", payload)
+        assert buffer.data is payload
+
+    def test_build_empty_memoryview(self) -> None:
+        """Factory raises ValueError for an empty memoryview."""
+        with pytest.raises(ValueError, match="buffer data must be non-empty bytes"):
+            BufferFactory.build("file.csv", memoryview(b""))
+
+    def test_from_file_maps_file(self, tmp_path: Path) -> None:
+        """from_file returns a read-only mmap-backed buffer of the file."""
+        path = tmp_path / "data.csv"
+        path.write_bytes(b"a,b\n1,2\n")
+
+        buffer = BufferFactory.from_file(path)
+
+        assert type(buffer) is Buffer
+        assert buffer.name == "data.csv"
+        assert isinstance(buffer.data, mmap.mmap)
+        assert buffer.view == b"a,b\n1,2\n"
+        assert buffer.view.readonly
+        assert len(buffer) == 8
+        buffer.close()
+        assert buffer.data.closed
+
+    def test_from_file_empty_file(self, tmp_path: Path) -> None:
+        """from_file raises ValueError for an empty file."""
+        path = tmp_path / "data.csv"
+        path.write_bytes(b"")
+        with pytest.raises(ValueError, match="buffer data must be non-empty bytes"):
+            BufferFactory.from_file(path)
 
     def test_build_case_insensitive_extension(self) -> None:
         """Factory extension matching is case-insensitive."""
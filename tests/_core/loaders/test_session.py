@@ -0,0 +1,71 @@
+"""Unit tests for the shared pooled HTTP session."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from dataset_hub import set_option
+from dataset_hub._core.loaders.session import close_session, get_session, get_timeout
+from dataset_hub._core.loaders.url_loader import UrlLoader
+from dataset_hub._core.provider.dataframe_provider import DataFrameProvider
+from tests.utils.http_server import LocalHTTPServer
+
+
+class TestSession:
+    """Tests for get_session() and its settings."""
+
+    def setup_method(self) -> None:
+        close_session()
+
+    def test_session_is_shared(self) -> None:
+        """Repeated calls return the same session object."""
+        assert get_session() is get_session()
+
+    def test_session_is_shared_across_threads(self) -> None:
+        """Concurrent first calls still create a single session."""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            sessions = list(pool.map(lambda _: get_session(), range(32)))
+        assert len({id(s) for s in sessions}) == 1
+
+    def test_session_rebuilt_on_pool_settings_change(self) -> None:
+        """Changing http_pool_size or http_retries builds a new session."""
+        first = get_session()
+        set_option("http_pool_size", 2)
+        second = get_session()
+        assert second is not first
+
+        adapter = second.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 2  # type: ignore[attr-defined]
+
+    def test_retries_setting_applied(self) -> None:
+        """http_retries configures the adapter retry policy."""
+        set_option("http_retries", 5)
+        adapter = get_session().get_adapter("https://example.com")
+        assert adapter.max_retries.total == 5  # type: ignore[attr-defined]
+
+    def test_timeout_setting(self) -> None:
+        """http_timeout controls the request timeout."""
+        assert get_timeout() == 30.0
+        set_option("http_timeout", 5)
+        assert get_timeout() == 5.0
+
+    def test_connection_reused_across_downloads(self, tmp_path: Path) -> None:
+        """Several downloads from one host share a single TCP connection."""
+        files = {f"/part{i}.csv": f"a,b\n{i},{i}\n".encode() for i in range(3)}
+        with LocalHTTPServer(files) as server:
+            for i, path in enumerate(files):
+                UrlLoader(server.url(path)).download(tmp_path / f"{i}.csv")
+            UrlLoader(server.url("/part0.csv")).load()
+
+        assert len(server.requests) == 4
+        assert server.connections == 1
+
+    def test_provider_loads_share_connection(self) -> None:
+        """DataFrameProvider fetches go through the pooled session too."""
+        set_option("save_local", False)
+        files = {"/iris.csv": b"a,b\n1,2\n", "/titanic.csv": b"c\n3\n"}
+        with LocalHTTPServer(files) as server:
+            for path in files:
+                source = {"type": "url", "url": server.url(path), "format": "csv"}
+                DataFrameProvider({"name": path[1:-4], "source": source}).load()
+
+        assert server.connections == 1
@@ -1,12 +1,16 @@
 """Unit tests for data loaders (SourceLoader and UrlLoader)."""
 
+from pathlib import Path
+from typing import Iterator
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
+from dataset_hub import set_option
 from dataset_hub._core.loaders.buffer import Buffer
 from dataset_hub._core.loaders.url_loader import UrlLoader
+from tests.utils.http_server import LocalHTTPServer
 
 
 class TestUrlLoader:
@@ -32,12 +36,12 @@ class TestUrlLoader:
         with pytest.raises(ValueError, match="URL must be a non-empty string"):
             UrlLoader(123)
 
-    @patch("dataset_hub._core.loaders.url_loader.requests.get")
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
     def test_url_loader_load_success(self, mock_get: Mock) -> None:
         """UrlLoader successfully loads data from URL."""
         test_data = b"test_content"
         mock_response = Mock()
-        mock_response.content = test_data
+        mock_response.iter_content.return_value = [test_data]
         mock_get.return_value = mock_response
 
         loader = UrlLoader("https://example.com/data.csv")
@@ -45,18 +49,20 @@ class TestUrlLoader:
 
         # CSV files map to base Buffer type
         assert type(buffer) is Buffer
-        assert buffer.data == test_data
+        assert buffer.view == test_data
         assert buffer.name == "data.csv"
-        mock_get.assert_called_once_with("https://example.com/data.csv", timeout=30)
+        mock_get.assert_called_once_with(
+            "https://example.com/data.csv", headers=None, stream=True, timeout=30
+        )
 
-    @patch("dataset_hub._core.loaders.url_loader.requests.get")
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
     def test_url_loader_load_extracts_filename(self, mock_get: Mock) -> None:
         """UrlLoader extracts filename from URL correctly."""
         from dataset_hub._core.loaders.buffer import ArchiveBuffer
 
         test_data = b"content"
         mock_response = Mock()
-        mock_response.content = test_data
+        mock_response.iter_content.return_value = [test_data]
         mock_get.return_value = mock_response
 
         loader = UrlLoader("https://example.com/path/to/myfile.zip")
@@ -65,18 +71,18 @@ class TestUrlLoader:
         assert buffer.name == "myfile.zip"
         assert isinstance(buffer, ArchiveBuffer)
 
-    @patch("dataset_hub._core.loaders.url_loader.requests.get")
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
     def test_url_loader_load_empty_response(self, mock_get: Mock) -> None:
         """UrlLoader raises ValueError on empty response."""
         mock_response = Mock()
-        mock_response.content = b""
+        mock_response.iter_content.return_value = []
         mock_get.return_value = mock_response
 
         loader = UrlLoader("https://example.com/data.csv")
         with pytest.raises(ValueError, match="Empty response"):
             loader.load()
 
-    @patch("dataset_hub._core.loaders.url_loader.requests.get")
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
     def test_url_loader_load_http_error(self, mock_get: Mock) -> None:
         """UrlLoader handles HTTP errors properly."""
         mock_get.side_effect = requests.RequestException("Connection failed")
@@ -85,7 +91,7 @@ class TestUrlLoader:
         with pytest.raises(requests.RequestException, match="Failed to download"):
             loader.load()
 
-    @patch("dataset_hub._core.loaders.url_loader.requests.get")
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
     def test_url_loader_load_timeout(self, mock_get: Mock) -> None:
         """UrlLoader respects timeout setting."""
         mock_get.side_effect = requests.Timeout("Request timed out")
@@ -94,38 +100,38 @@ class TestUrlLoader:
         with pytest.raises(requests.RequestException, match="Failed to download"):
             loader.load()
 
-    @patch("dataset_hub._core.loaders.url_loader.requests.get")
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
     def test_url_loader_load_no_filename(self, mock_get: Mock) -> None:
         """UrlLoader raises ValueError when URL has no filename."""
         test_data = b"content"
         mock_response = Mock()
-        mock_response.content = test_data
+        mock_response.iter_content.return_value = [test_data]
         mock_get.return_value = mock_response
 
         loader = UrlLoader("https://example.com/")
         with pytest.raises(ValueError, match="URL must contain a filename"):
             loader.load()
 
-    @patch("dataset_hub._core.loaders.url_loader.requests.get")
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
     def test_url_loader_load_unsupported_extension(self, mock_get: Mock) -> None:
         """UrlLoader raises KeyError for unsupported file extension."""
         test_data = b"json_content"
         mock_response = Mock()
-        mock_response.content = test_data
+        mock_response.iter_content.return_value = [test_data]
         mock_get.return_value = mock_response
 
         loader = UrlLoader("https://example.com/data.json")
         with pytest.raises(KeyError):
             loader.load()
 
-    @patch("dataset_hub._core.loaders.url_loader.requests.get")
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
     def test_url_loader_load_archive_buffer(self, mock_get: Mock) -> None:
         """UrlLoader returns ArchiveBuffer for .zip files."""
         from dataset_hub._core.loaders.buffer import ArchiveBuffer
 
         test_data = b"zip_content"
         mock_response = Mock()
-        mock_response.content = test_data
+        mock_response.iter_content.return_value = [test_data]
         mock_get.return_value = mock_response
 
         loader = UrlLoader("https://example.com/archive.zip")
@@ -133,7 +139,59 @@ class TestUrlLoader:
 
         assert isinstance(buffer, ArchiveBuffer)
         assert buffer.name == "archive.zip"
-        assert buffer.data == test_data
+        assert buffer.view == test_data
+
+    def test_url_loader_init_invalid_chunk_size(self) -> None:
+        """UrlLoader raises ValueError for non-positive chunk_size."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            UrlLoader("https://example.com/data.csv", chunk_size=0)
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_url_loader_load_joins_chunks(self, mock_get: Mock) -> None:
+        """UrlLoader.load() assembles streamed chunks into one buffer."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [b"a,b\n", b"1,2\n", b"3,4\n"]
+        mock_get.return_value = mock_response
+
+        loader = UrlLoader("https://example.com/data.csv", chunk_size=4)
+        buffer = loader.load()
+
+        assert buffer.view == b"a,b\n1,2\n3,4\n"
+        mock_response.iter_content.assert_called_once_with(chunk_size=4)
+        mock_response.close.assert_called_once()
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_url_loader_download_streams_to_file(
+        self, mock_get: Mock, tmp_path: Path
+    ) -> None:
+        """UrlLoader.download() writes all chunks to the destination file."""
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.iter_content.return_value = [b"x" * 10, b"y" * 5]
+        mock_get.return_value = mock_response
+
+        dest = tmp_path / "data.csv"
+        assert UrlLoader("https://example.com/data.csv").download(dest) == dest
+        assert dest.read_bytes() == b"x" * 10 + b"y" * 5
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_url_loader_download_interrupted(
+        self, mock_get: Mock, tmp_path: Path
+    ) -> None:
+        """An interrupted stream leaves no partial file at the destination."""
+
+        def broken_stream(chunk_size: int) -> Iterator[bytes]:
+            yield b"partial"
+            raise requests.ConnectionError("connection reset")
+
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.iter_content.side_effect = broken_stream
+        mock_get.return_value = mock_response
+
+        dest = tmp_path / "data.csv"
+        with pytest.raises(requests.RequestException, match="Failed to download"):
+            UrlLoader("https://example.com/data.csv").download(dest)
+        assert not dest.exists()
+        assert (tmp_path / "data.csv.part").read_bytes() == b"partial"
 
     def test_extract_filename_with_extension(self) -> None:
         """Extract filename correctly from URL with file extension."""
@@ -168,3 +226,164 @@ class TestUrlLoader:
         assert buffer.name == "test.csv"
         assert buffer.data == b"content"
         assert isinstance(buffer.data, bytes)
+
+
+class TestUrlLoaderResume:
+    """Tests for resumable downloads against a local HTTP server."""
+
+    BODY = bytes(range(256)) * 40
+
+    def _interrupted(self, server: LocalHTTPServer, dest: Path) -> None:
+        server.fail_after["/big.bin"] = 4000
+        with pytest.raises(requests.RequestException):
+            UrlLoader(server.url("/big.bin"), chunk_size=1000).download(dest)
+        assert (dest.parent / "big.bin.part").stat().st_size == 4000
+
+    def test_resume_requests_missing_bytes(self, tmp_path: Path) -> None:
+        """A retry after an interruption fetches only the remaining range."""
+        dest = tmp_path / "big.bin"
+        with LocalHTTPServer({"/big.bin": self.BODY}) as server:
+            self._interrupted(server, dest)
+            UrlLoader(server.url("/big.bin")).download(dest)
+
+        assert dest.read_bytes() == self.BODY
+        assert server.requests[-1]["Range"] == "bytes=4000-"
+        assert server.requests[-1]["If-Range"].startswith('"')
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "big.bin",
+            "big.bin.meta.json",
+        ]
+
+    def test_resume_falls_back_when_ranges_ignored(self, tmp_path: Path) -> None:
+        """A server answering 200 to a range request restarts from scratch."""
+        dest = tmp_path / "big.bin"
+        with LocalHTTPServer({"/big.bin": self.BODY}, ranges=False) as server:
+            self._interrupted(server, dest)
+            UrlLoader(server.url("/big.bin")).download(dest)
+
+        assert dest.read_bytes() == self.BODY
+
+    def test_resume_falls_back_when_validator_changed(self, tmp_path: Path) -> None:
+        """If the upstream file changed, If-Range makes the server send it whole."""
+        dest = tmp_path / "big.bin"
+        new_body = self.BODY[::-1]
+        with LocalHTTPServer({"/big.bin": self.BODY}) as server:
+            self._interrupted(server, dest)
+            server.files["/big.bin"] = new_body
+            UrlLoader(server.url("/big.bin")).download(dest)
+
+        assert dest.read_bytes() == new_body
+
+    def test_resume_restarts_on_unsatisfiable_range(self, tmp_path: Path) -> None:
+        """A '.part' already holding every byte (416) is downloaded again."""
+        dest = tmp_path / "big.bin"
+        with LocalHTTPServer({"/big.bin": self.BODY}) as server:
+            self._interrupted(server, dest)
+            (tmp_path / "big.bin.part").write_bytes(self.BODY)
+            UrlLoader(server.url("/big.bin")).download(dest)
+
+        assert dest.read_bytes() == self.BODY
+        assert [r["method"] for r in server.requests].count("GET") == 3
+
+
+class TestUrlLoaderSegmented:
+    """Tests for parallel ranged downloads against a local HTTP server."""
+
+    BODY = bytes(range(256)) * 40
+
+    def setup_method(self) -> None:
+        set_option("download_segments", 4)
+        set_option("segmented_download_threshold", 1024)
+
+    def _gets(self, server: LocalHTTPServer) -> list:
+        return [r for r in server.requests if r["method"] == "GET"]
+
+    def test_segmented_download(self, tmp_path: Path) -> None:
+        """Large files are fetched as concurrent byte ranges."""
+        dest = tmp_path / "big.bin"
+        with LocalHTTPServer({"/big.bin": self.BODY}) as server:
+            UrlLoader(server.url("/big.bin")).download(dest)
+
+        assert dest.read_bytes() == self.BODY
+        assert all(r["method"] == "GET" for r in server.requests)
+        first, *rest = self._gets(server)
+        assert first.get("Range") is None
+        ranges = sorted(r["Range"] for r in rest)
+        assert ranges == [
+            "bytes=2560-5119",
+            "bytes=5120-7679",
+            "bytes=7680-10239",
+        ]
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "big.bin",
+            "big.bin.meta.json",
+        ]
+
+    def test_small_files_use_single_stream(self, tmp_path: Path) -> None:
+        """Files below the threshold are fetched with one plain GET."""
+        set_option("segmented_download_threshold", len(self.BODY) + 1)
+        dest = tmp_path / "big.bin"
+        with LocalHTTPServer({"/big.bin": self.BODY}) as server:
+            UrlLoader(server.url("/big.bin")).download(dest)
+
+        assert dest.read_bytes() == self.BODY
+        assert [(r["method"], r.get("Range")) for r in server.requests] == [
+            ("GET", None)
+        ]
+
+    def test_no_range_support_uses_single_stream(self, tmp_path: Path) -> None:
+        """Servers that do not advertise byte ranges get a single GET."""
+        dest = tmp_path / "big.bin"
+        with LocalHTTPServer({"/big.bin": self.BODY}, ranges=False) as server:
+            UrlLoader(server.url("/big.bin")).download(dest)
+
+        assert dest.read_bytes() == self.BODY
+        assert len(self._gets(server)) == 1
+
+    def test_failed_segment_falls_back(self, tmp_path: Path) -> None:
+        """A broken segment discards the sparse file and downloads sequentially."""
+        dest = tmp_path / "big.bin"
+        with LocalHTTPServer({"/big.bin": self.BODY}) as server:
+            server.fail_after["/big.bin"] = 100
+            UrlLoader(server.url("/big.bin"), chunk_size=64).download(dest)
+
+        assert dest.read_bytes() == self.BODY
+        assert self._gets(server)[-1].get("Range") is None
+
+
+class TestUrlLoaderRevalidate:
+    """Tests for conditional requests on downloaded files."""
+
+    def test_download_saves_validators(self, tmp_path: Path) -> None:
+        """download() keeps the ETag next to the file."""
+        dest = tmp_path / "data.csv"
+        with LocalHTTPServer({"/data.csv": b"a\n1\n"}) as server:
+            UrlLoader(server.url("/data.csv")).download(dest)
+
+        meta = UrlLoader.meta_path(dest).read_text()
+        assert '"etag": "\\"' in meta
+
+    def test_revalidate_not_modified(self, tmp_path: Path) -> None:
+        """A 304 answer leaves the file untouched."""
+        dest = tmp_path / "data.csv"
+        with LocalHTTPServer({"/data.csv": b"a\n1\n"}) as server:
+            loader = UrlLoader(server.url("/data.csv"))
+            loader.download(dest)
+            mtime = dest.stat().st_mtime_ns
+            assert loader.revalidate(dest) is False
+
+        assert dest.stat().st_mtime_ns == mtime
+        assert "If-None-Match" in server.requests[-1]
+
+    def test_revalidate_modified(self, tmp_path: Path) -> None:
+        """A 200 answer replaces the file and its validators."""
+        dest = tmp_path / "data.csv"
+        with LocalHTTPServer({"/data.csv": b"a\n1\n"}) as server:
+            loader = UrlLoader(server.url("/data.csv"))
+            loader.download(dest)
+            old_meta = UrlLoader.meta_path(dest).read_text()
+            server.files["/data.csv"] = b"a\n2\n"
+            assert loader.revalidate(dest) is True
+
+        assert dest.read_bytes() == b"a\n2\n"
+        assert UrlLoader.meta_path(dest).read_text() != old_meta
@@ -0,0 +1,66 @@
+"""Unit tests for the Arrow CSV engine and datetime parsing."""
+
+import io
+
+import pandas as pd
+import pytest
+
+from dataset_hub._core.parsers import arrow
+
+pytest.importorskip("pyarrow")
+
+CSV = b"Date;Time;v;c\n16/12/2006;17:24:00;1.5;a\n16/12/2006;17:25:00;?;b\n"
+DTYPE = {"Date": "string", "Time": "string", "v": "float32", "c": "category"}
+
+
+class TestArrowReadCsv:
+    """Tests for arrow.read_csv()."""
+
+    def test_matches_pandas(self) -> None:
+        """The Arrow engine returns the same frame as the C engine."""
+        kwargs = {"sep": ";", "na_values": ["?"], "dtype": DTYPE}
+
+        df = arrow.read_csv(io.BytesIO(CSV), **kwargs)
+
+        expected = pd.read_csv(io.BytesIO(CSV), **kwargs)
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_declared_string_not_inferred_as_time(self) -> None:
+        """A column declared as string keeps its text instead of time values."""
+        df = arrow.read_csv(io.BytesIO(CSV), sep=";", dtype={"Time": "string"})
+
+        assert df["Time"].tolist() == ["17:24:00", "17:25:00"]
+
+    def test_usecols(self) -> None:
+        """usecols limits the parsed columns."""
+        df = arrow.read_csv(io.BytesIO(CSV), sep=";", usecols=["v"])
+
+        assert list(df.columns) == ["v"]
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"skipfooter": 1}, {"sep": ";;"}, {"usecols": [0]}]
+    )
+    def test_unsupported_options_raise(self, kwargs: dict) -> None:
+        """Options the Arrow reader cannot honor raise ValueError."""
+        with pytest.raises(ValueError, match="Arrow CSV reader"):
+            arrow.read_csv(io.BytesIO(CSV), **kwargs)
+
+
+class TestArrowStrptime:
+    """Tests for arrow.strptime()."""
+
+    def test_parses_with_format(self) -> None:
+        """Values are parsed with the explicit format; NA gives NaT."""
+        text = pd.Series(["16/12/2006 17:24:00", None], dtype="string")
+
+        values = arrow.strptime(text, "%d/%m/%Y %H:%M:%S")
+
+        assert values is not None
+        assert values[0] == pd.Timestamp("2006-12-16 17:24")
+        assert pd.isna(values[1])
+
+    def test_mismatch_returns_none(self) -> None:
+        """Values that do not match leave the parsing to pandas."""
+        text = pd.Series(["2006-12-16"], dtype="string")
+
+        assert arrow.strptime(text, "%d/%m/%Y") is None
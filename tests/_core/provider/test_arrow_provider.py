@@ -0,0 +1,199 @@
+"""Unit tests for ArrowProvider."""
+
+import io
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from dataset_hub import set_option
+from dataset_hub._core.provider.arrow_provider import ArrowProvider
+from dataset_hub._core.provider.dataframe_provider import DataFrameProvider
+from dataset_hub._core.settings.loader import load_settings
+
+pa = pytest.importorskip("pyarrow")
+
+SOURCE = {"type": "url", "url": "https://example.com/power.csv", "format": "csv"}
+CSV = (
+    b"Date;Time;v;kind\n16/12/2006;17:24:00;1.5;a\n"
+    b"16/12/2006;17:25:00;?;b\n17/12/2006;00:00:00;3.5;a\n"
+)
+CONFIG: Dict[str, Any] = {
+    "name": "power",
+    "source": SOURCE,
+    "read_kwargs": {"sep": ";", "na_values": ["?"]},
+    "schema": {"Date": "string", "Time": "string", "v": "float32", "kind": "category"},
+    "index": {"columns": ["Date", "Time"], "format": "%d/%m/%Y %H:%M:%S"},
+}
+
+
+def _response(content: bytes) -> Mock:
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.iter_content.return_value = [content]
+    return response
+
+
+def _parquet_bytes(df: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False)
+    return buffer.getvalue()
+
+
+class TestArrowProvider:
+    """Tests for loading datasets as Arrow data."""
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_load_returns_typed_table(self, mock_get: Mock) -> None:
+        """CSV is parsed into a table with the declared Arrow types."""
+        mock_get.return_value = _response(CSV)
+
+        table = ArrowProvider(CONFIG).load()
+
+        assert isinstance(table, pa.Table)
+        assert table.column_names == ["datetime", "v", "kind"]
+        assert table.schema.field("datetime").type == pa.timestamp("us")
+        assert table.schema.field("v").type == pa.float32()
+        assert pa.types.is_dictionary(table.schema.field("kind").type)
+        assert table.column("v").to_pylist() == [1.5, None, 3.5]
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_matches_dataframe_provider(self, mock_get: Mock) -> None:
+        """The table holds the same data as the DataFrameProvider frame."""
+        mock_get.return_value = _response(CSV)
+
+        table = ArrowProvider(CONFIG).load()
+        df = DataFrameProvider(CONFIG).load()
+
+        converted = table.to_pandas().set_index("datetime")
+        pd.testing.assert_frame_equal(converted, df, check_index_type=False)
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_reader_output(self, mock_get: Mock) -> None:
+        """The reader output yields the same rows as the table output."""
+        mock_get.return_value = _response(CSV)
+
+        reader = ArrowProvider({**CONFIG, "output": "reader"}).load()
+
+        assert isinstance(reader, pa.RecordBatchReader)
+        assert reader.read_all().equals(ArrowProvider(CONFIG).load())
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_columns_and_filters(self, mock_get: Mock) -> None:
+        """Selections keep the index column and filter rows in Arrow."""
+        mock_get.return_value = _response(CSV)
+        provider = ArrowProvider(
+            {**CONFIG, "columns": ["v"], "filters": [("kind", "==", "a")]}
+        )
+
+        table = provider.load()
+
+        assert table.column_names == ["datetime", "v"]
+        assert table.column("v").to_pylist() == [1.5, 3.5]
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            [("v", "!=", 1.5)],
+            [("v", "not in", [3.5])],
+            [("v", "<", 3.0)],
+            [("kind", "==", "b"), ("v", "!=", 0.0)],
+        ],
+    )
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_filters_match_dataframe_provider(
+        self, mock_get: Mock, filters: list
+    ) -> None:
+        """Filters select the same rows as pandas when values are missing."""
+        mock_get.return_value = _response(CSV)
+        config = {**CONFIG, "filters": filters}
+
+        table = ArrowProvider(config).load()
+        df = DataFrameProvider(config).load()
+
+        converted = table.to_pandas().set_index("datetime")
+        pd.testing.assert_frame_equal(converted, df, check_index_type=False)
+
+    @pytest.mark.parametrize("output", ["table", "reader"])
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_columnar_cache(self, mock_get: Mock, output: str) -> None:
+        """Warm loads scan the columnar cache written by the Arrow reader."""
+        set_option("columnar_cache", "parquet")
+        mock_get.return_value = _response(CSV)
+        config = {**CONFIG, "output": output, "filters": [("v", ">", 2.0)]}
+
+        cold = ArrowProvider(config).load()
+        warm = ArrowProvider(config).load()
+        shared = DataFrameProvider(CONFIG).load()
+
+        if output == "reader":
+            cold, warm = cold.read_all(), warm.read_all()
+        assert cold.column("v").to_pylist() == [3.5]
+        assert warm.column("v").to_pylist() == [3.5]
+        assert shared["v"].tolist()[::2] == [1.5, 3.5]
+        # pandas loads keep their own copy (see test_columnar_cache_per_parser)
+        assert len(list(Path(load_settings()["data_path"]).rglob("*.parquet"))) == 2
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_columnar_cache_per_parser(self, mock_get: Mock) -> None:
+        """A pandas load does not read the columnar copy parsed by Arrow."""
+        set_option("columnar_cache", "parquet")
+        mock_get.return_value = _response(b"day,at,v\n2006-12-16,17:24:00,1.5\n")
+        config = {"name": "dates", "source": SOURCE}
+        expected = DataFrameProvider({**config, "name": "cold"}).load()
+
+        ArrowProvider(config).load()
+        df = DataFrameProvider(config).load()
+
+        pd.testing.assert_series_equal(df.dtypes, expected.dtypes)
+        assert df["day"].tolist() == ["2006-12-16"]
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_parquet_source_streams(self, mock_get: Mock) -> None:
+        """Parquet sources are scanned with pruned columns and filters."""
+        data = pd.DataFrame({"a": range(10), "b": list("abcdefghij")})
+        mock_get.return_value = _response(_parquet_bytes(data))
+        source = {**SOURCE, "url": "https://example.com/t.parquet", "format": "parquet"}
+        provider = ArrowProvider(
+            {
+                "name": "t",
+                "source": source,
+                "output": "reader",
+                "columns": ["b"],
+                "filters": [("a", ">=", 7)],
+            }
+        )
+
+        table = provider.load().read_all()
+
+        assert table.column_names == ["b"]
+        assert table.column("b").to_pylist() == ["h", "i", "j"]
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_iter_chunks(self, mock_get: Mock) -> None:
+        """Chunks are record batches of at most chunksize rows."""
+        mock_get.return_value = _response(CSV)
+
+        chunks = list(ArrowProvider(CONFIG).iter_chunks(2))
+
+        assert [chunk.num_rows for chunk in chunks] == [2, 1]
+        assert all(isinstance(chunk, pa.RecordBatch) for chunk in chunks)
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_unsupported_options_use_pandas(self, mock_get: Mock) -> None:
+        """Options the Arrow CSV reader rejects are parsed by pandas instead."""
+        mock_get.return_value = _response(CSV)
+        read_kwargs = {**CONFIG["read_kwargs"], "nrows": 1}
+
+        table = ArrowProvider({**CONFIG, "read_kwargs": read_kwargs}).load()
+
+        assert table.num_rows == 1
+        assert table.schema.field("v").type == pa.float32()
+
+    def test_invalid_output_raises(self) -> None:
+        """Unknown outputs are rejected."""
+        with pytest.raises(ValueError, match="Unsupported output 'list'"):
+            ArrowProvider({"source": SOURCE, "output": "list"})
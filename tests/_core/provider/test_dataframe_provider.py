@@ -0,0 +1,606 @@
+"""Unit tests for DataFrameProvider."""
+
+import io
+import zipfile
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from dataset_hub import set_option
+from dataset_hub._core.provider.dataframe_provider import DataFrameProvider
+from dataset_hub._core.settings.loader import load_settings
+
+SOURCE = {"type": "url", "url": "https://example.com/data.csv", "format": "csv"}
+CSV = b"a,b\n1,x\n2,y\n"
+
+
+def _response(content: bytes) -> Mock:
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.iter_content.return_value = [content]
+    return response
+
+
+class TestDataFrameProviderCache:
+    """Tests for local caching in DataFrameProvider.load()."""
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_load_reads_cached_copy(self, mock_get: Mock) -> None:
+        """Repeated loads download the source only once."""
+        mock_get.return_value = _response(CSV)
+        provider = DataFrameProvider({"name": "toy", "source": SOURCE})
+
+        first = provider.load()
+        second = provider.load()
+
+        pd.testing.assert_frame_equal(first, second)
+        assert list(first.columns) == ["a", "b"]
+        mock_get.assert_called_once()
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_load_without_save_local_uses_temp_file(self, mock_get: Mock) -> None:
+        """With save_local disabled the source is read from a removed temp file."""
+        set_option("save_local", False)
+        mock_get.return_value = _response(CSV)
+        mock_read = Mock(return_value=pd.DataFrame({"a": [1]}))
+        with patch.dict(DataFrameProvider._READER_REGISTRY, {"csv": mock_read}):
+            DataFrameProvider({"name": "toy", "source": SOURCE}).load()
+
+        read_path = Path(mock_read.call_args.args[0])
+        assert read_path.name == "data.csv"
+        assert not read_path.exists()
+        assert not Path(load_settings()["data_path"]).exists()
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_load_falls_back_when_cache_unwritable(self, mock_get: Mock) -> None:
+        """OSError from the cache is logged and a temp download is used."""
+        mock_get.return_value = _response(CSV)
+        provider = DataFrameProvider({"name": "toy", "source": SOURCE})
+        with patch(
+            "dataset_hub._core.provider.dataframe_provider.CacheManager.fetch",
+            side_effect=PermissionError("read-only"),
+        ):
+            df = provider.load()
+        assert list(df.columns) == ["a", "b"]
+        mock_get.assert_called_once()
+
+
+class TestDataFrameProviderColumnarCache:
+    """Tests for the Parquet/Feather cache of parsed tables."""
+
+    @pytest.mark.parametrize("columnar_format", ["parquet", "feather"])
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_warm_load_skips_csv_parse(
+        self, mock_get: Mock, columnar_format: str
+    ) -> None:
+        """Second load is served from the columnar copy, not the CSV parser."""
+        pytest.importorskip("pyarrow")
+        set_option("columnar_cache", columnar_format)
+        mock_get.return_value = _response(CSV)
+        provider = DataFrameProvider({"name": "toy", "source": SOURCE})
+
+        cold = provider.load()
+        mock_read = Mock(side_effect=AssertionError("CSV parsed on warm load"))
+        with patch.dict(DataFrameProvider._READER_REGISTRY, {"csv": mock_read}):
+            warm = provider.load()
+
+        pd.testing.assert_frame_equal(cold, warm)
+        cached = list(Path(load_settings()["data_path"]).rglob(f"*.{columnar_format}"))
+        assert len(cached) == 1
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_read_kwargs_change_invalidates(self, mock_get: Mock) -> None:
+        """Different read_kwargs never reuse a table parsed with other options."""
+        pytest.importorskip("pyarrow")
+        set_option("columnar_cache", "parquet")
+        mock_get.return_value = _response(CSV)
+
+        DataFrameProvider({"name": "toy", "source": SOURCE}).load()
+        df = DataFrameProvider(
+            {"name": "toy", "source": SOURCE, "read_kwargs": {"usecols": ["a"]}}
+        ).load()
+
+        assert list(df.columns) == ["a"]
+        assert len(list(Path(load_settings()["data_path"]).rglob("*.parquet"))) == 2
+
+    def test_unsupported_columnar_format(self) -> None:
+        """Unknown columnar_cache values raise ValueError."""
+        set_option("columnar_cache", "orc")
+        provider = DataFrameProvider({"name": "toy", "source": SOURCE})
+        with pytest.raises(ValueError, match="Unsupported columnar_cache"):
+            provider._build_columnar_path(Path("data.csv"), SOURCE, {})
+
+
+class TestDataFrameProviderArchive:
+    """Tests for reading tables out of archive sources."""
+
+    @staticmethod
+    def _zip_bytes() -> bytes:
+        payload = io.BytesIO()
+        with zipfile.ZipFile(payload, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("train.csv", CSV)
+            archive.writestr("test.csv", b"a,b\n3,z\n")
+        return payload.getvalue()
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_load_selects_member(self, mock_get: Mock) -> None:
+        """The 'member' of the source selects the table inside a zip."""
+        mock_get.return_value = _response(self._zip_bytes())
+        source = {**SOURCE, "url": "https://example.com/data.zip", "member": "test.csv"}
+
+        df = DataFrameProvider({"name": "toy", "source": source}).load()
+
+        pd.testing.assert_frame_equal(df, pd.DataFrame({"a": [3], "b": ["z"]}))
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_load_streams_member_to_reader(self, mock_get: Mock) -> None:
+        """The reader gets a file object over the member, not the archive path."""
+        mock_get.return_value = _response(self._zip_bytes())
+        source = {**SOURCE, "url": "https://example.com/data.zip", "member": "*train*"}
+        mock_read = Mock(return_value=pd.DataFrame({"a": [1]}))
+
+        with patch.dict(DataFrameProvider._READER_REGISTRY, {"csv": mock_read}):
+            DataFrameProvider({"name": "toy", "source": source}).load()
+
+        assert mock_read.call_args.args[0].name == "train.csv"
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_load_ambiguous_member_raises(self, mock_get: Mock) -> None:
+        """A multi-member archive without 'member' raises ValueError."""
+        mock_get.return_value = _response(self._zip_bytes())
+        source = {**SOURCE, "url": "https://example.com/data.zip"}
+
+        with pytest.raises(ValueError, match="Set 'member'"):
+            DataFrameProvider({"name": "toy", "source": source}).load()
+
+
+class TestDataFrameProviderChunks:
+    """Tests for DataFrameProvider.iter_chunks()."""
+
+    CHUNKED_CSV = b"id,flag,name\n1,true,a\n2,false,b\n,,\n4,true,d\n5,false,e\n"
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_chunks_cover_table(self, mock_get: Mock) -> None:
+        """Chunks have at most chunksize rows and concatenate to the table."""
+        mock_get.return_value = _response(self.CHUNKED_CSV)
+        provider = DataFrameProvider({"name": "toy", "source": SOURCE})
+
+        chunks = list(provider.iter_chunks(2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert pd.concat(chunks)["id"].tolist() == [1, 2, pd.NA, 4, 5]
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_chunks_have_consistent_dtypes(self, mock_get: Mock) -> None:
+        """A chunk with missing values keeps the dtypes of the first chunk."""
+        mock_get.return_value = _response(self.CHUNKED_CSV)
+        provider = DataFrameProvider({"name": "toy", "source": SOURCE})
+
+        chunks = list(provider.iter_chunks(2))
+
+        assert all(chunk["id"].dtype == "Int64" for chunk in chunks)
+        assert all(chunk["flag"].dtype == "boolean" for chunk in chunks)
+        assert len({str(chunk["name"].dtype) for chunk in chunks}) == 1
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_chunks_from_parquet_row_groups(self, mock_get: Mock) -> None:
+        """A fresh Parquet copy is read in batches instead of the CSV."""
+        pytest.importorskip("pyarrow")
+        set_option("columnar_cache", "parquet")
+        mock_get.return_value = _response(CSV)
+        provider = DataFrameProvider({"name": "toy", "source": SOURCE})
+        provider.load()
+
+        with patch.object(DataFrameProvider, "_read_source") as mock_read:
+            chunks = list(provider.iter_chunks(1))
+
+        mock_read.assert_not_called()
+        assert [chunk["b"].tolist() for chunk in chunks] == [["x"], ["y"]]
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_chunks_from_archive_member(self, mock_get: Mock) -> None:
+        """CSV members of archives are read in chunks too."""
+        payload = io.BytesIO()
+        with zipfile.ZipFile(payload, "w") as archive:
+            archive.writestr("data.csv", CSV)
+        mock_get.return_value = _response(payload.getvalue())
+        source = {**SOURCE, "url": "https://example.com/data.zip"}
+
+        chunks = list(DataFrameProvider({"source": source}).iter_chunks(1))
+
+        assert [chunk["a"].tolist() for chunk in chunks] == [[1], [2]]
+
+    @pytest.mark.parametrize("chunksize", [0, -1, 1.5, True])
+    def test_invalid_chunksize_raises(self, chunksize: object) -> None:
+        """chunksize must be a positive integer, checked before any download."""
+        provider = DataFrameProvider({"name": "toy", "source": SOURCE})
+        with pytest.raises(ValueError, match="chunksize must be a positive integer"):
+            provider.iter_chunks(chunksize)  # type: ignore[arg-type]
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_incompatible_chunk_raises(self, mock_get: Mock) -> None:
+        """A chunk that cannot take the first chunk's dtypes raises ValueError."""
+        mock_get.return_value = _response(b"a\n1\n2.5\n")
+        provider = DataFrameProvider({"name": "toy", "source": SOURCE})
+
+        with pytest.raises(ValueError, match="Pass explicit 'dtype'"):
+            list(provider.iter_chunks(1))
+
+
+class TestDataFrameProviderSelection:
+    """Tests for column projection and row filters."""
+
+    WIDE_CSV = b"a,b,c\n1,x,10\n2,y,20\n3,z,30\n"
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_columns_pushed_to_csv_reader(self, mock_get: Mock) -> None:
+        """Only requested and filtered columns are parsed from CSV."""
+        mock_get.return_value = _response(self.WIDE_CSV)
+        provider = DataFrameProvider(
+            {
+                "name": "toy",
+                "source": SOURCE,
+                "columns": ["b"],
+                "filters": [("a", ">=", 2)],
+            }
+        )
+
+        mock_read = Mock(wraps=pd.read_csv)
+        with patch.dict(DataFrameProvider._READER_REGISTRY, {"csv": mock_read}):
+            df = provider.load()
+
+        assert mock_read.call_args.kwargs["usecols"] == ["b", "a"]
+        pd.testing.assert_frame_equal(df, pd.DataFrame({"b": ["y", "z"]}))
+
+    @pytest.mark.parametrize("columnar_format", ["parquet", "feather"])
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_selection_from_columnar_cache(
+        self, mock_get: Mock, columnar_format: str
+    ) -> None:
+        """Warm loads prune the columnar copy and still see the full table."""
+        pytest.importorskip("pyarrow")
+        set_option("columnar_cache", columnar_format)
+        mock_get.return_value = _response(self.WIDE_CSV)
+        selection = {"columns": ["c", "a"], "filters": [("b", "in", ["x", "z"])]}
+        cold = DataFrameProvider({"name": "toy", "source": SOURCE, **selection})
+        warm = DataFrameProvider({"name": "toy", "source": SOURCE, **selection})
+
+        expected = pd.DataFrame({"c": [10, 30], "a": [1, 3]})
+        pd.testing.assert_frame_equal(cold.load(), expected)
+        pd.testing.assert_frame_equal(warm.load(), expected)
+        full = DataFrameProvider({"name": "toy", "source": SOURCE}).load()
+        assert list(full.columns) == ["a", "b", "c"]
+
+    @pytest.mark.parametrize("op, value", [("!=", 1), ("not in", [1])])
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_missing_values_filtered_like_columnar_cache(
+        self, mock_get: Mock, op: str, value: object
+    ) -> None:
+        """Cold and warm (pushed down) loads drop the same missing values."""
+        pytest.importorskip("pyarrow")
+        set_option("columnar_cache", "parquet")
+        mock_get.return_value = _response(b"a,b\n1,x\n,y\n3,z\n")
+        params = {"name": "toy", "source": SOURCE, "filters": [("a", op, value)]}
+
+        cold = DataFrameProvider(params).load()
+        warm = DataFrameProvider(params).load()
+
+        pd.testing.assert_frame_equal(cold, warm)
+        assert cold["b"].tolist() == ["z"]
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_selection_applies_to_chunks(self, mock_get: Mock) -> None:
+        """iter_chunks prunes columns and drops filtered-out rows per chunk."""
+        mock_get.return_value = _response(self.WIDE_CSV)
+        provider = DataFrameProvider(
+            {"source": SOURCE, "columns": ["c"], "filters": [("a", "!=", 1)]}
+        )
+
+        chunks = list(provider.iter_chunks(1))
+
+        assert [chunk["c"].tolist() for chunk in chunks] == [[20], [30]]
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_unknown_column_raises(self, mock_get: Mock) -> None:
+        """Requesting a column that does not exist raises ValueError."""
+        mock_get.return_value = _response(CSV)
+        provider = DataFrameProvider({"source": {**SOURCE, "format": "json"}})
+        provider.config["columns"] = ["missing"]
+        mock_read = Mock(return_value=pd.DataFrame({"a": [1]}))
+
+        with patch.dict(DataFrameProvider._READER_REGISTRY, {"json": mock_read}):
+            with pytest.raises(ValueError, match="Columns not found"):
+                provider.load()
+
+    def test_columns_and_usecols_conflict(self) -> None:
+        """columns cannot be combined with read_kwargs usecols."""
+        with pytest.raises(ValueError, match="either 'columns' or 'usecols'"):
+            DataFrameProvider(
+                {"source": SOURCE, "columns": ["a"], "read_kwargs": {"usecols": [0]}}
+            )
+
+
+class TestDataFrameProviderSchema:
+    """Tests for declared column dtypes and the dtype_backend setting."""
+
+    TYPED_CSV = b"n,f,s\n1,0.5,a\n2,1.5,b\n3,2.5,a\n"
+    SCHEMA = {
+        "n": "int8",
+        "f": {"dtype": "float32", "description": "x"},
+        "s": "category",
+    }
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_schema_passed_to_csv_parser(self, mock_get: Mock) -> None:
+        """Declared dtypes are handed to read_csv as its dtype option."""
+        mock_get.return_value = _response(self.TYPED_CSV)
+        provider = DataFrameProvider({"source": SOURCE, "schema": self.SCHEMA})
+        mock_read = Mock(wraps=pd.read_csv)
+
+        with patch.dict(DataFrameProvider._READER_REGISTRY, {"csv": mock_read}):
+            df = provider.load()
+
+        assert mock_read.call_args.kwargs["dtype"] == {
+            "n": "int8",
+            "f": "float32",
+            "s": "category",
+        }
+        assert df.dtypes.astype(str).tolist() == ["int8", "float32", "category"]
+
+    @pytest.mark.parametrize("columnar_format", ["parquet", "feather"])
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_schema_survives_columnar_cache(
+        self, mock_get: Mock, columnar_format: str
+    ) -> None:
+        """Warm loads from the columnar cache keep the declared dtypes."""
+        pytest.importorskip("pyarrow")
+        set_option("columnar_cache", columnar_format)
+        mock_get.return_value = _response(self.TYPED_CSV)
+        config = {"name": "toy", "source": SOURCE, "schema": self.SCHEMA}
+
+        cold = DataFrameProvider(config).load()
+        warm = DataFrameProvider(config).load()
+
+        pd.testing.assert_frame_equal(cold, warm)
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_schema_in_chunks(self, mock_get: Mock) -> None:
+        """Chunks keep declared widths and do not drop unseen categories."""
+        mock_get.return_value = _response(self.TYPED_CSV)
+        provider = DataFrameProvider({"source": SOURCE, "schema": self.SCHEMA})
+
+        chunks = list(provider.iter_chunks(2))
+
+        assert all(str(chunk["n"].dtype) == "Int8" for chunk in chunks)
+        assert pd.concat(chunks)["s"].astype(str).tolist() == ["a", "b", "a"]
+
+    @pytest.mark.parametrize(
+        "backend, expected",
+        [("numpy_nullable", "Int64"), ("pyarrow", "int64[pyarrow]")],
+    )
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_dtype_backend_for_undeclared_columns(
+        self, mock_get: Mock, backend: str, expected: str
+    ) -> None:
+        """dtype_backend applies to inferred columns; declared ones win."""
+        pytest.importorskip("pyarrow")
+        set_option("dtype_backend", backend)
+        mock_get.return_value = _response(self.TYPED_CSV)
+        provider = DataFrameProvider({"source": SOURCE, "schema": {"f": "float32"}})
+
+        df = provider.load()
+
+        assert str(df["n"].dtype) == expected
+        assert str(df["f"].dtype) == "float32"
+
+    def test_invalid_dtype_backend_raises(self) -> None:
+        """An unknown dtype_backend setting raises ValueError."""
+        set_option("dtype_backend", "arrow")
+        with pytest.raises(ValueError, match="Unsupported dtype_backend 'arrow'"):
+            DataFrameProvider.dtype_backend()
+
+    @pytest.mark.parametrize("schema", [{"a": "floaty"}, {"a": {"type": "int"}}])
+    def test_invalid_schema_raises(self, schema: dict) -> None:
+        """Unknown dtypes or entries without a dtype are rejected."""
+        with pytest.raises(ValueError, match="Column 'a'"):
+            DataFrameProvider({"source": SOURCE, "schema": schema})
+
+
+class TestDataFrameProviderIndex:
+    """Tests for datetime indexes declared in the provider config."""
+
+    TIMED_CSV = (
+        b"Date;Time;v\n16/12/2006;17:24:00;1.5\n"
+        b"16/12/2006;17:25:00;2.5\n17/12/2006;00:00:00;3.5\n"
+    )
+    INDEX = {"columns": ["Date", "Time"], "format": "%d/%m/%Y %H:%M:%S"}
+
+    def _provider(self, **extra: object) -> DataFrameProvider:
+        return DataFrameProvider(
+            {
+                "name": "power",
+                "source": SOURCE,
+                "read_kwargs": {"sep": ";"},
+                "index": self.INDEX,
+                **extra,
+            }
+        )
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_load_builds_datetime_index(self, mock_get: Mock) -> None:
+        """Date and Time are parsed into a DatetimeIndex and dropped."""
+        mock_get.return_value = _response(self.TIMED_CSV)
+
+        df = self._provider().load()
+
+        expected = pd.DatetimeIndex(
+            ["2006-12-16 17:24", "2006-12-16 17:25", "2006-12-17 00:00"],
+            name="datetime",
+        )
+        pd.testing.assert_index_equal(df.index, expected)
+        assert list(df.columns) == ["v"]
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_index_unit_without_pyarrow(self, mock_get: Mock) -> None:
+        """The pandas fallback builds the index with the same unit as Arrow."""
+        mock_get.return_value = _response(self.TIMED_CSV)
+        to_datetime = pd.to_datetime
+
+        def to_datetime_ns(*args: object, **kwargs: object) -> pd.Series:
+            # pandas < 3 parses strings into nanoseconds
+            return to_datetime(*args, **kwargs).dt.as_unit("ns")  # type: ignore
+
+        with patch("dataset_hub._core.parsers.arrow.is_available", return_value=False):
+            with patch("pandas.to_datetime", side_effect=to_datetime_ns):
+                fallback = self._provider().load()
+        df = self._provider().load()
+
+        assert fallback.index.dtype == "datetime64[us]"
+        pd.testing.assert_frame_equal(fallback, df)
+
+    @pytest.mark.parametrize("columnar_format", ["parquet", "feather"])
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_index_stored_in_columnar_cache(
+        self, mock_get: Mock, columnar_format: str
+    ) -> None:
+        """Warm loads read the parsed timestamps instead of parsing again."""
+        pytest.importorskip("pyarrow")
+        set_option("columnar_cache", columnar_format)
+        mock_get.return_value = _response(self.TIMED_CSV)
+        cold = self._provider().load()
+
+        with patch("pandas.to_datetime") as mock_to_datetime:
+            warm = self._provider().load()
+
+        pd.testing.assert_frame_equal(cold, warm)
+        mock_to_datetime.assert_not_called()
+
+    @pytest.mark.parametrize("columnar_format", [None, "parquet"])
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_select_and_filter_on_index(
+        self, mock_get: Mock, columnar_format: str
+    ) -> None:
+        """The index can be filtered on and is kept when selecting columns."""
+        if columnar_format:
+            pytest.importorskip("pyarrow")
+            set_option("columnar_cache", columnar_format)
+        mock_get.return_value = _response(self.TIMED_CSV)
+        since = pd.Timestamp("2006-12-16 17:25")
+        provider = self._provider(columns=["v"], filters=[("datetime", ">=", since)])
+
+        cold = provider.load()
+        warm = provider.load()
+
+        for df in (cold, warm):
+            assert df["v"].tolist() == [2.5, 3.5]
+            assert df.index[0] == since
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_chunks_have_index(self, mock_get: Mock) -> None:
+        """Every chunk is indexed by the parsed timestamps."""
+        mock_get.return_value = _response(self.TIMED_CSV)
+
+        chunks = list(self._provider().iter_chunks(2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert all(isinstance(c.index, pd.DatetimeIndex) for c in chunks)
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_format_mismatch_raises(self, mock_get: Mock) -> None:
+        """Values that do not match the declared format raise ValueError."""
+        mock_get.return_value = _response(self.TIMED_CSV)
+        provider = self._provider(index={"columns": "Date", "format": "%Y-%m-%d"})
+
+        with pytest.raises(ValueError, match="Could not build index 'datetime'"):
+            provider.load()
+
+    @pytest.mark.parametrize(
+        "index",
+        [
+            {"format": "%Y"},
+            {"columns": [], "format": "%Y"},
+            {"columns": ["Date"]},
+            "Date",
+        ],
+    )
+    def test_invalid_index_raises(self, index: object) -> None:
+        """Index declarations without columns or format are rejected."""
+        with pytest.raises(ValueError, match="index"):
+            DataFrameProvider({"source": SOURCE, "index": index})
+
+
+class TestDataFrameProviderEngine:
+    """Tests for parser engine selection."""
+
+    @pytest.mark.parametrize("use_setting", [False, True])
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_engine_from_config_or_setting(
+        self, mock_get: Mock, use_setting: bool
+    ) -> None:
+        """The engine comes from the config, else from the read_engine setting."""
+        mock_get.return_value = _response(CSV)
+        config = {"source": SOURCE}
+        if use_setting:
+            set_option("read_engine", "pyarrow")
+        else:
+            config["engine"] = "pyarrow"
+        mock_read = Mock(return_value=pd.DataFrame({"a": [1]}))
+
+        with patch.dict(DataFrameProvider._ENGINE_REGISTRY["csv"], pyarrow=mock_read):
+            DataFrameProvider(config).load()
+
+        mock_read.assert_called_once()
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_failed_engine_falls_back(self, mock_get: Mock) -> None:
+        """Options unsupported by the engine fall back to the default reader."""
+        pytest.importorskip("pyarrow")
+        mock_get.return_value = _response(CSV)
+        config = {"source": SOURCE, "engine": "auto", "read_kwargs": {"nrows": 1}}
+
+        df = DataFrameProvider(config).load()
+
+        assert df["a"].tolist() == [1]
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_arrow_error_falls_back(self, mock_get: Mock) -> None:
+        """Arrow errors that are not ValueError also fall back."""
+        pa = pytest.importorskip("pyarrow")
+        mock_get.return_value = _response(CSV)
+        provider = DataFrameProvider({"source": SOURCE, "engine": "pyarrow"})
+        read_dataframe = provider.read_dataframe
+
+        def read(*args: object, **kwargs: object) -> pd.DataFrame:
+            if args[-1] == "pyarrow":
+                raise pa.ArrowTypeError("unsupported column type")
+            return read_dataframe(*args, **kwargs)  # type: ignore
+
+        with patch.object(provider, "read_dataframe", side_effect=read):
+            df = provider.load()
+
+        assert df["b"].tolist() == ["x", "y"]
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_auto_without_pyarrow_uses_default(self, mock_get: Mock) -> None:
+        """'auto' uses the pandas default engine when pyarrow is missing."""
+        mock_get.return_value = _response(CSV)
+        provider = DataFrameProvider({"source": SOURCE, "engine": "auto"})
+
+        with patch("dataset_hub._core.parsers.arrow.is_available", return_value=False):
+            assert provider.engine("csv") is None
+            assert provider.load()["b"].tolist() == ["x", "y"]
+
+    def test_setting_ignored_for_unsupported_format(self) -> None:
+        """A global engine does not apply to formats without that engine."""
+        set_option("read_engine", "c")
+        provider = DataFrameProvider({"source": {**SOURCE, "format": "json"}})
+
+        assert provider.engine("json") is None
+
+    def test_invalid_engine_raises(self) -> None:
+        """An engine that the source format does not support is rejected."""
+        with pytest.raises(ValueError, match="Engine 'ujson' is not supported"):
+            DataFrameProvider({"source": SOURCE, "engine": "ujson"})
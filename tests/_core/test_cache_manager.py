@@ -0,0 +1,139 @@
+"""Unit tests for the local on-disk CacheManager."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from dataset_hub import set_option
+from dataset_hub._core.cache_manager import CacheManager
+from tests.utils.http_server import LocalHTTPServer
+
+SOURCE = {"type": "url", "url": "https://example.com/data.csv", "format": "csv"}
+
+
+def _response(content: bytes) -> Mock:
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.iter_content.return_value = [content]
+    return response
+
+
+class TestCacheManager:
+    """Tests for cache keys, paths and fetching."""
+
+    def test_is_enabled_follows_save_local(self) -> None:
+        """Caching is controlled by the save_local setting."""
+        assert CacheManager.is_enabled()
+        set_option("save_local", False)
+        assert not CacheManager.is_enabled()
+
+    def test_config_hash_is_order_independent(self) -> None:
+        """Same config with different key order yields the same hash."""
+        reordered = {"format": "csv", "url": SOURCE["url"], "type": "url"}
+        assert CacheManager.config_hash(SOURCE) == CacheManager.config_hash(reordered)
+
+    def test_config_hash_changes_with_source(self) -> None:
+        """A different URL yields a different hash."""
+        other = {**SOURCE, "url": "https://example.com/other.csv"}
+        assert CacheManager.config_hash(SOURCE) != CacheManager.config_hash(other)
+
+    def test_build_cache_path_under_data_path(self, tmp_path: Path) -> None:
+        """Cache path lives under data_path/<dataset>/<hash>/."""
+        set_option("data_path", str(tmp_path))
+        path = CacheManager.build_cache_path("iris", SOURCE, "data.csv")
+        key = CacheManager.config_hash(SOURCE)
+        assert path == tmp_path / "iris" / key / "data.csv"
+        assert path.parent.is_dir()
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_fetch_downloads_once(self, mock_get: Mock) -> None:
+        """Second fetch is served from disk without a network request."""
+        mock_get.return_value = _response(b"a,b\n1,2\n")
+
+        first = CacheManager.fetch("iris", SOURCE)
+        second = CacheManager.fetch("iris", SOURCE)
+
+        assert first == second
+        assert first.read_bytes() == b"a,b\n1,2\n"
+        mock_get.assert_called_once()
+
+    @patch("dataset_hub._core.loaders.session.requests.Session.get")
+    def test_fetch_falls_back_to_dataset_filename(self, mock_get: Mock) -> None:
+        """URLs without a filename are cached as <dataset>.<format>."""
+        mock_get.return_value = _response(b"a\n1\n")
+        source = {**SOURCE, "url": "https://example.com/"}
+        assert CacheManager.fetch("iris", source).name == "iris.csv"
+
+    def test_concurrent_fetch_downloads_once(self) -> None:
+        """Workers racing on a cold cache share a single download."""
+        body = b"a,b\n" + b"1,2\n" * 10000
+        with LocalHTTPServer({"/data.csv": body}) as server:
+            source = {**SOURCE, "url": server.url("/data.csv")}
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                paths = list(
+                    pool.map(lambda _: CacheManager.fetch("toy", source), range(4))
+                )
+
+        assert len(set(paths)) == 1
+        assert paths[0].read_bytes() == body
+        assert [r["method"] for r in server.requests] == ["GET"]
+
+
+class TestCacheManagerRevalidation:
+    """Tests for conditional revalidation of cached sources."""
+
+    def _fetch_twice(self, server: LocalHTTPServer, new_body: bytes) -> Path:
+        source = {**SOURCE, "url": server.url("/data.csv")}
+        CacheManager.fetch("toy", source)
+        server.files["/data.csv"] = new_body
+        return CacheManager.fetch("toy", source)
+
+    def test_no_revalidation_by_default(self) -> None:
+        """Without revalidate, cache hits never touch the network."""
+        with LocalHTTPServer({"/data.csv": b"a\n1\n"}) as server:
+            path = self._fetch_twice(server, b"a\n2\n")
+
+        assert path.read_bytes() == b"a\n1\n"
+        assert len(server.requests) == 1
+
+    def test_unchanged_source_is_304_hit(self) -> None:
+        """An unchanged source answers 304 and the cached file is kept."""
+        set_option("revalidate", True)
+        with LocalHTTPServer({"/data.csv": b"a\n1\n"}) as server:
+            path = self._fetch_twice(server, b"a\n1\n")
+
+        assert path.read_bytes() == b"a\n1\n"
+        assert server.requests[-1]["If-None-Match"].startswith('"')
+
+    def test_changed_source_is_refreshed(self) -> None:
+        """A changed source is downloaded again and replaces the cached file."""
+        set_option("revalidate", True)
+        with LocalHTTPServer({"/data.csv": b"a\n1\n"}) as server:
+            path = self._fetch_twice(server, b"a\n2\n")
+
+        assert path.read_bytes() == b"a\n2\n"
+
+    def test_stale_while_revalidate(self) -> None:
+        """The stale copy is returned at once and refreshed in the background."""
+        set_option("revalidate", True)
+        set_option("stale_while_revalidate", True)
+        with LocalHTTPServer({"/data.csv": b"a\n1\n"}) as server:
+            path = self._fetch_twice(server, b"a\n2\n")
+            stale = path.read_bytes()
+            CacheManager.wait_for_refreshes(timeout=5)
+
+        assert stale in (b"a\n1\n", b"a\n2\n")
+        assert path.read_bytes() == b"a\n2\n"
+
+    def test_revalidation_error_serves_cached_copy(self) -> None:
+        """If the source is unreachable, the cached copy is still returned."""
+        set_option("revalidate", True)
+        set_option("http_retries", 0)
+        with LocalHTTPServer({"/data.csv": b"a\n1\n"}) as server:
+            source = {**SOURCE, "url": server.url("/data.csv")}
+            CacheManager.fetch("toy", source)
+            del server.files["/data.csv"]
+            path = CacheManager.fetch("toy", source)
+
+        assert path.read_bytes() == b"a\n1\n"
@@ -0,0 +1,79 @@
+"""Unit tests for the compiled dataset catalog."""
+
+import json
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from dataset_hub._core import catalog
+from dataset_hub._core.config_manager import ConfigManager
+from dataset_hub._core.utils.paths import list_available_datasets, list_task_types
+
+
+@pytest.fixture
+def fresh_catalog() -> Iterator[None]:
+    """Drop the memoized catalog and configs before and after a test."""
+    catalog.load_catalog.cache_clear()
+    ConfigManager._load_cached.cache_clear()
+    yield
+    catalog.load_catalog.cache_clear()
+    ConfigManager._load_cached.cache_clear()
+
+
+class TestCatalog:
+    """Tests for catalog compilation and lookup."""
+
+    def test_compiled_catalog_is_in_sync(self) -> None:
+        """catalog.json must match the YAML configs.
+
+        Run ``python scripts/build_catalog.py`` after editing a config.
+        """
+        compiled = json.loads(catalog.CATALOG_PATH.read_text(encoding="utf-8"))
+
+        assert compiled == catalog.build_catalog()
+
+    def test_listings_match_config_files(self) -> None:
+        """Task types and dataset names come from the catalog."""
+        package_path = catalog.PACKAGE_PATH
+
+        assert list_task_types() == sorted(
+            p.parent.name for p in package_path.glob("*/_configs")
+        )
+        assert list_available_datasets("classification") == sorted(
+            p.stem for p in (package_path / "classification/_configs").glob("*.yaml")
+        )
+        assert list_available_datasets("unknown") == []
+
+    def test_load_config_reads_no_files(self, fresh_catalog: None) -> None:
+        """After the catalog is loaded, config lookups touch no files."""
+        catalog.load_catalog()
+
+        with patch("builtins.open", side_effect=AssertionError("file opened")):
+            with patch.object(Path, "glob", side_effect=AssertionError("scanned")):
+                config = ConfigManager.load_config("titanic", "classification")
+                list_available_datasets("classification")
+
+        assert list(config["providers"]) == ["data"]
+
+    def test_load_config_returns_copies(self) -> None:
+        """Modifying a returned config does not affect later lookups."""
+        config = ConfigManager.load_config("iris", "classification")
+        config["providers"]["data"]["params"]["source"]["url"] = "changed"
+
+        again = ConfigManager.load_config("iris", "classification")
+
+        assert again["providers"]["data"]["params"]["source"]["url"] != "changed"
+
+    def test_unknown_dataset_raises(self) -> None:
+        """Datasets without a bundled config raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="missing"):
+            ConfigManager.load_config("missing", "classification")
+
+    def test_missing_catalog_compiles_yaml(
+        self, fresh_catalog: None, tmp_path: Path
+    ) -> None:
+        """Without catalog.json the YAML configs are compiled in memory."""
+        with patch.object(catalog, "CATALOG_PATH", tmp_path / "catalog.json"):
+            assert catalog.load_catalog() == catalog.build_catalog()
@@ -0,0 +1,111 @@
+"""Unit tests for ConfigManager."""
+
+from typing import Any, Dict
+
+import pytest
+
+from dataset_hub._core.config_manager import ConfigManager
+
+
+def _part(name: str, **extra: Any) -> Dict[str, Any]:
+    source = {"type": "url", "url": f"https://example.com/{name}.csv", "format": "csv"}
+    return {"name": name, "source": source, **extra}
+
+
+class TestConfigManagerTransform:
+    """Tests for the dataset_parts -> providers transformation."""
+
+    def test_single_part_is_data_table(self) -> None:
+        """A single-part dataset should fill the 'data' table."""
+        config = ConfigManager._transform_to_provider_schema(
+            {"dataset_parts": [_part("iris", read_kwargs={"sep": ","})]}
+        )
+
+        assert list(config["providers"]) == ["data"]
+        params = config["providers"]["data"]["params"]
+        assert params["name"] == "iris"
+        assert params["read_kwargs"] == {"sep": ","}
+
+    def test_multi_part_uses_table_then_name(self) -> None:
+        """Parts should be keyed by 'table', falling back to the part name."""
+        config = ConfigManager._transform_to_provider_schema(
+            {
+                "dataset_parts": [
+                    _part("adult_train", table="train"),
+                    _part("adult_test", table="test"),
+                    _part("adult_meta"),
+                ]
+            }
+        )
+
+        assert list(config["providers"]) == ["train", "test", "adult_meta"]
+        assert config["providers"]["test"]["params"]["name"] == "adult_test"
+
+    def test_columns_block_becomes_schema(self) -> None:
+        """The YAML columns block is passed to the provider as its schema."""
+        config = ConfigManager._transform_to_provider_schema(
+            {"dataset_parts": [_part("iris", columns={"species": "category"})]}
+        )
+
+        assert config["providers"]["data"]["params"]["schema"] == {
+            "species": "category"
+        }
+
+    def test_index_block_is_passed_through(self) -> None:
+        """The YAML index block is passed to the provider unchanged."""
+        index = {"columns": ["Date", "Time"], "format": "%d/%m/%Y %H:%M:%S"}
+        config = ConfigManager._transform_to_provider_schema(
+            {"dataset_parts": [_part("power", index=index)]}
+        )
+
+        assert config["providers"]["data"]["params"]["index"] == index
+
+    @pytest.mark.parametrize(
+        "as_type, provider_type, output",
+        [
+            ("pd.DataFrame", "dataframe", None),
+            ("pa.Table", "arrow", "table"),
+            ("pa.RecordBatchReader", "arrow", "reader"),
+        ],
+    )
+    def test_as_type_selects_provider(
+        self, as_type: str, provider_type: str, output: Any
+    ) -> None:
+        """as_type selects the provider and its output container."""
+        config = ConfigManager._transform_to_provider_schema(
+            {"dataset_parts": [_part("iris", as_type=as_type)]}
+        )
+
+        provider = config["providers"]["data"]
+        assert provider["type"] == provider_type
+        assert provider["params"].get("output") == output
+
+    def test_unknown_as_type_raises(self) -> None:
+        """Unsupported output containers are rejected."""
+        with pytest.raises(ValueError, match="Unsupported as_type 'np.ndarray'"):
+            ConfigManager._transform_to_provider_schema(
+                {"dataset_parts": [_part("iris", as_type="np.ndarray")]}
+            )
+
+    def test_duplicate_table_raises(self) -> None:
+        """Two parts filling the same table should be rejected."""
+        parts = [_part("a", table="train"), _part("b", table="train")]
+
+        with pytest.raises(ValueError, match="Duplicate table name 'train'"):
+            ConfigManager._transform_to_provider_schema({"dataset_parts": parts})
+
+    def test_multi_part_without_name_raises(self) -> None:
+        """Parts of a multi-part dataset need a table or a name."""
+        unnamed = _part("b")
+        del unnamed["name"]
+
+        with pytest.raises(ValueError, match="'table' or 'name'"):
+            ConfigManager._transform_to_provider_schema(
+                {"dataset_parts": [_part("a"), unnamed]}
+            )
+
+    def test_bundled_configs_load(self) -> None:
+        """A bundled dataset config should map to a single 'data' table."""
+        config = ConfigManager.load_config("titanic", "classification")
+
+        assert list(config["providers"]) == ["data"]
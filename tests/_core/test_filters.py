@@ -0,0 +1,76 @@
+"""Unit tests for row filters."""
+
+import pandas as pd
+import pytest
+
+from dataset_hub._core.filters import apply_filters, filter_columns, validate_filters
+
+DF = pd.DataFrame({"a": [1, 2, None, 4], "b": ["x", "y", "x", "z"]})
+
+
+class TestValidateFilters:
+    """Tests for validate_filters()."""
+
+    def test_lists_become_tuples(self) -> None:
+        """Filters given as lists (e.g. from YAML) are normalized to tuples."""
+        assert validate_filters([["a", ">", 1]]) == [("a", ">", 1)]
+
+    def test_none_is_empty(self) -> None:
+        """No filters normalize to an empty list."""
+        assert validate_filters(None) == []
+
+    @pytest.mark.parametrize(
+        "filters, message",
+        [
+            ([("a", ">")], "triple"),
+            (["a > 1"], "triple"),
+            ([("a", "~", 1)], "Unsupported filter operator '~'"),
+            ([("b", "in", "xy")], "collection of values"),
+        ],
+    )
+    def test_invalid_filters_raise(self, filters: list, message: str) -> None:
+        """Malformed filters raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            validate_filters(filters)
+
+
+class TestApplyFilters:
+    """Tests for apply_filters() and filter_columns()."""
+
+    def test_conjunction(self) -> None:
+        """Rows must match every filter; missing values never match."""
+        result = apply_filters(DF, [("a", ">=", 2), ("b", "!=", "z")])
+        assert result.to_dict("list") == {"a": [2.0], "b": ["y"]}
+
+    @pytest.mark.parametrize(
+        "filters, expected",
+        [
+            ([("a", "!=", 1)], [2.0, 4.0]),
+            ([("a", "not in", [1])], [2.0, 4.0]),
+        ],
+    )
+    def test_negations_skip_missing(self, filters: list, expected: list) -> None:
+        """'!=' and 'not in' do not match missing values either."""
+        assert apply_filters(DF, filters)["a"].tolist() == expected
+
+    def test_in_operator_and_index_renumbered(self) -> None:
+        """'in' selects by membership and a RangeIndex is renumbered."""
+        result = apply_filters(DF, [("b", "in", ["x", "z"])])
+        assert result["a"].tolist()[::2] == [1.0, 4.0]
+        assert result.index.tolist() == [0, 1, 2]
+
+    def test_custom_index_is_kept(self) -> None:
+        """A meaningful index keeps the labels of the matching rows."""
+        df = DF.set_index("b")
+        result = apply_filters(df, [("a", "<", 3)])
+        assert result.index.tolist() == ["x", "y"]
+
+    def test_unknown_column_raises(self) -> None:
+        """Filtering on a missing column raises ValueError."""
+        with pytest.raises(ValueError, match="Filter column 'c' not found"):
+            apply_filters(DF, [("c", "==", 1)])
+
+    def test_filter_columns_unique(self) -> None:
+        """Referenced columns are listed once, in order."""
+        filters = [("b", "==", "x"), ("a", ">", 1), ("b", "!=", "y")]
+        assert filter_columns(filters) == ["b", "a"]
@@ -0,0 +1,125 @@
+"""Unit tests for get_data with multi-part datasets."""
+
+import asyncio
+import time
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from dataset_hub import set_option
+from dataset_hub._core.config_manager import ConfigManager
+from dataset_hub._core.get_data import aget_data, get_data
+from tests.utils.http_server import LocalHTTPServer
+
+TABLES = {"train": b"a,b\n1,2\n3,4\n", "test": b"a,b\n5,6\n", "meta": b"k,v\nx,y\n"}
+
+
+def _config(server: LocalHTTPServer) -> Dict[str, Any]:
+    parts = [
+        {
+            "name": f"adult_{table}",
+            "table": table,
+            "source": {
+                "type": "url",
+                "url": server.url(f"/{table}.csv"),
+                "format": "csv",
+            },
+        }
+        for table in TABLES
+    ]
+    return ConfigManager._transform_to_provider_schema({"dataset_parts": parts})
+
+
+class TestGetDataMultiPart:
+    """Tests for loading every dataset part into one DataBundle."""
+
+    @pytest.fixture
+    def server(self) -> Any:
+        files = {f"/{table}.csv": body for table, body in TABLES.items()}
+        with LocalHTTPServer(files) as server:
+            with patch(
+                "dataset_hub._core.get_data.ConfigManager.load_config",
+                side_effect=lambda name, task_type: _config(server),
+            ):
+                yield server
+
+    def test_bundle_has_all_tables(self, server: LocalHTTPServer) -> None:
+        """Every part should be loaded under its table name."""
+        bundle = get_data("adult", "classification", verbose=False)
+
+        assert list(bundle.keys()) == ["train", "test", "meta"]
+        pd.testing.assert_frame_equal(
+            bundle["test"], pd.DataFrame({"a": [5], "b": [6]})
+        )
+
+    def test_parts_load_in_parallel(self, server: LocalHTTPServer) -> None:
+        """Loading should take about as long as one part, not the sum."""
+        server.delay = 0.3
+
+        start = time.perf_counter()
+        get_data("adult", "classification", verbose=False)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.3 * len(TABLES)
+
+    def test_chunksize_returns_iterators(self, server: LocalHTTPServer) -> None:
+        """With chunksize every table is an iterator of DataFrame chunks."""
+        bundle = get_data("adult", "classification", verbose=False, chunksize=1)
+
+        chunks = list(bundle["train"])
+        assert [len(chunk) for chunk in chunks] == [1, 1]
+        assert pd.concat(chunks)["a"].tolist() == [1, 3]
+
+    def test_as_type_overrides_config(self, server: LocalHTTPServer) -> None:
+        """as_type returns every table in the requested container."""
+        pa = pytest.importorskip("pyarrow")
+
+        bundle = get_data("adult", "classification", verbose=False, as_type="pa.Table")
+
+        assert all(isinstance(bundle[table], pa.Table) for table in TABLES)
+        assert bundle["test"].column("a").to_pylist() == [5]
+
+
+class TestRevalidateOncePerLoad:
+    """Tests that a load asks the server about a cached source only once."""
+
+    @pytest.fixture
+    def server(self) -> Any:
+        files = {f"/{table}.csv": body for table, body in TABLES.items()}
+        with LocalHTTPServer(files) as server:
+            with patch(
+                "dataset_hub._core.get_data.ConfigManager.load_config",
+                side_effect=lambda name, task_type: _config(server),
+            ):
+                get_data("adult", "classification", verbose=False)
+                set_option("revalidate", True)
+                set_option("max_memory", 2**30)
+                server.requests.clear()
+                yield server
+
+    def _gets(self, server: LocalHTTPServer) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for request in server.requests:
+            counts[request["path"]] = counts.get(request["path"], 0) + 1
+        return counts
+
+    def test_get_data(self, server: LocalHTTPServer) -> None:
+        """Estimating and loading a table share one conditional request."""
+        get_data("adult", "classification", verbose=False)
+
+        assert self._gets(server) == {f"/{table}.csv": 1 for table in TABLES}
+
+    def test_aget_data(self, server: LocalHTTPServer) -> None:
+        """The download step of aload is reused by the parsing step."""
+        asyncio.run(aget_data("adult", "classification", verbose=False))
+
+        assert self._gets(server) == {f"/{table}.csv": 1 for table in TABLES}
+
+    def test_repeated_loads_revalidate(self, server: LocalHTTPServer) -> None:
+        """Every new load revalidates again."""
+        get_data("adult", "classification", verbose=False)
+        get_data("adult", "classification", verbose=False)
+
+        assert self._gets(server) == {f"/{table}.csv": 2 for table in TABLES}
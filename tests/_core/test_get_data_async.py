@@ -0,0 +1,110 @@
+"""Unit tests for the asyncio loading API."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+import requests
+
+from dataset_hub import DataBundle, aget_data, aget_many
+from dataset_hub._core.loaders.url_loader import UrlLoader
+from tests.utils.http_server import LocalHTTPServer
+
+NAMES = ["iris", "titanic", "wine"]
+
+
+def _config(server: LocalHTTPServer, name: str) -> Dict[str, Any]:
+    source = {"type": "url", "url": server.url(f"/{name}.csv"), "format": "csv"}
+    provider = {"type": "dataframe", "params": {"name": name, "source": source}}
+    return {"providers": {"data": provider}}
+
+
+class TestAsyncGetData:
+    """Tests for aget_data() and aget_many()."""
+
+    @pytest.fixture
+    def server(self) -> Any:
+        files = {f"/{name}.csv": b"a,b\n1,2\n3,4\n" for name in NAMES}
+        with LocalHTTPServer(files) as server:
+            with patch(
+                "dataset_hub._core.get_data.ConfigManager.load_config",
+                side_effect=lambda name, task_type: _config(server, name),
+            ):
+                yield server
+
+    def test_aget_data_returns_bundle(self, server: LocalHTTPServer) -> None:
+        """aget_data should return the same bundle as get_data."""
+        bundle = asyncio.run(aget_data("iris", "classification", verbose=False))
+
+        assert isinstance(bundle, DataBundle)
+        pd.testing.assert_frame_equal(
+            bundle["data"], pd.DataFrame({"a": [1, 3], "b": [2, 4]})
+        )
+
+    def test_aget_data_does_not_block_loop(self, server: LocalHTTPServer) -> None:
+        """The event loop should keep running while a dataset downloads."""
+        server.delay = 0.3
+        ticks: List[float] = []
+
+        async def ticker() -> None:
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.02)
+
+        async def main() -> None:
+            task = asyncio.create_task(ticker())
+            await aget_data("iris", "classification", verbose=False)
+            task.cancel()
+
+        asyncio.run(main())
+
+        assert len(ticks) >= 5
+
+    def test_aget_many_overlaps_loads(self, server: LocalHTTPServer) -> None:
+        """Loads started by aget_many should run concurrently, in input order."""
+        server.delay = 0.3
+        specs = [(name, "classification") for name in NAMES]
+
+        start = time.perf_counter()
+        bundles = asyncio.run(aget_many(specs, verbose=False))
+        elapsed = time.perf_counter() - start
+
+        assert len(bundles) == len(NAMES)
+        assert all(isinstance(bundle, DataBundle) for bundle in bundles)
+        assert elapsed < 0.3 * len(NAMES)
+
+    def test_aget_many_return_exceptions(self, server: LocalHTTPServer) -> None:
+        """With return_exceptions, a failed load should not hide the others."""
+        specs = [("iris", "classification"), ("missing", "classification")]
+
+        results = asyncio.run(aget_many(specs, verbose=False, return_exceptions=True))
+
+        assert isinstance(results[0], DataBundle)
+        assert isinstance(results[1], requests.RequestException)
+
+    def test_aget_data_uses_executor(self, server: LocalHTTPServer) -> None:
+        """Parsing should run in the executor passed by the caller."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with patch.object(executor, "submit", wraps=executor.submit) as submit:
+                asyncio.run(
+                    aget_data("iris", "classification", False, executor=executor)
+                )
+
+        assert submit.called
+
+
+class TestSourceLoaderAload:
+    """Tests for SourceLoader.aload()."""
+
+    def test_aload_matches_load(self) -> None:
+        """aload should return the same bytes as load."""
+        with LocalHTTPServer({"/data.csv": b"a,b\n1,2\n"}) as server:
+            loader = UrlLoader(server.url("/data.csv"))
+
+            buffer = asyncio.run(loader.aload())
+
+        assert buffer.view == b"a,b\n1,2\n"
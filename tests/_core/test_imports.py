@@ -0,0 +1,76 @@
+"""Import-time regression tests for lazy loading."""
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+import dataset_hub
+
+# Dependencies that must only be imported when a dataset is loaded
+HEAVY_MODULES = ("pandas", "numpy", "requests", "yaml", "pyarrow")
+
+
+def _import_times(code: str) -> Dict[str, int]:
+    """Run `code` in a fresh interpreter and return ``-X importtime`` output.
+
+    Returns:
+        Dict[str, int]: Imported module name to cumulative microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestLazyImports:
+    """Tests that light entry points do not import heavy dependencies."""
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "import dataset_hub",
+            "import dataset_hub; dataset_hub.set_option('verbose', False)",
+            "import dataset_hub.classification, dataset_hub.timeseries",
+            "from dataset_hub._core.utils.paths import list_available_datasets, "
+            "list_task_types; [list_available_datasets(t) for t in list_task_types()]",
+        ],
+    )
+    def test_no_heavy_imports(self, code: str) -> None:
+        """Importing the package, settings and listing skip heavy modules."""
+        times = _import_times(code)
+
+        assert "dataset_hub" in times
+        assert [m for m in HEAVY_MODULES if m in times] == []
+
+    def test_first_access_imports(self) -> None:
+        """Accessing a getter imports its module."""
+        times = _import_times("import dataset_hub; dataset_hub.classification.get_iris")
+
+        assert "pandas" in times
+        assert "dataset_hub.classification.datasets" in times
+
+    def test_lazy_attributes(self) -> None:
+        """Every public name resolves and is listed by dir()."""
+        for name in dataset_hub.__all__:
+            assert getattr(dataset_hub, name) is not None
+        assert set(dataset_hub.__all__) <= set(dir(dataset_hub))
+        assert dataset_hub.classification.get_iris.__name__ == "get_iris"
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="no_such_name"):
+            dataset_hub.no_such_name  # noqa: B018
+        with pytest.raises(AttributeError, match="no_such_name"):
+            dataset_hub.classification.no_such_name  # noqa: B018
@@ -0,0 +1,211 @@
+"""Unit tests for memory estimates and the max_memory budget."""
+
+import asyncio
+import io
+import zipfile
+from typing import Any, Dict, Iterator, List
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from dataset_hub import add_trace_callback, remove_trace_callback, set_option
+from dataset_hub._core.config_manager import ConfigManager
+from dataset_hub._core.get_data import aget_data, get_data
+from dataset_hub._core.memory import MemoryEstimate, max_memory
+from dataset_hub._core.provider.dataframe_provider import DataFrameProvider
+from dataset_hub._core.tracing import Span
+from tests.utils.http_server import LocalHTTPServer
+
+FRAME = pd.DataFrame(
+    {
+        "id": range(5000),
+        "name": [f"name-{i % 97}" for i in range(5000)],
+        "value": [i / 7 for i in range(5000)],
+    }
+)
+CSV = FRAME.to_csv(index=False).encode()
+
+
+def _zip_bytes() -> bytes:
+    payload = io.BytesIO()
+    with zipfile.ZipFile(payload, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("data.csv", CSV)
+    return payload.getvalue()
+
+
+def _parquet_bytes() -> bytes:
+    payload = io.BytesIO()
+    FRAME.to_parquet(payload, index=False)
+    return payload.getvalue()
+
+
+FILES = {"/data.csv": CSV, "/data.zip": _zip_bytes(), "/data.parquet": _parquet_bytes()}
+ACTUAL = int(FRAME.memory_usage(deep=True).sum())
+
+
+def _source(server: LocalHTTPServer, path: str) -> Dict[str, Any]:
+    format_ = "parquet" if path.endswith(".parquet") else "csv"
+    return {"type": "url", "url": server.url(path), "format": format_}
+
+
+def _config(server: LocalHTTPServer, paths: Dict[str, str]) -> Dict[str, Any]:
+    parts = [
+        {"name": table, "source": _source(server, path)}
+        for table, path in paths.items()
+    ]
+    config: Dict[str, Any] = ConfigManager._transform_to_provider_schema(
+        {"dataset_parts": parts}
+    )
+    return config
+
+
+def _provider(server: LocalHTTPServer, path: str) -> DataFrameProvider:
+    return DataFrameProvider({"name": "sample", "source": _source(server, path)})
+
+
+@pytest.fixture
+def server() -> Iterator[LocalHTTPServer]:
+    with LocalHTTPServer(FILES) as server:
+        yield server
+
+
+class TestEstimateMemory:
+    """Tests for DataFrameProvider.estimate_memory."""
+
+    @pytest.mark.parametrize("path", ["/data.csv", "/data.zip", "/data.parquet"])
+    def test_estimate_close_to_actual(self, server: LocalHTTPServer, path: str) -> None:
+        """Estimates are within 20% of the loaded memory_usage(deep=True)."""
+        estimate = _provider(server, path).estimate_memory()
+
+        assert estimate is not None
+        assert estimate.rows == pytest.approx(len(FRAME), rel=0.2)
+        assert estimate.bytes == pytest.approx(ACTUAL, rel=0.2)
+        assert estimate.streamable
+
+    def test_estimate_scales_a_sample(self, server: LocalHTTPServer) -> None:
+        """A CSV larger than the sample is extrapolated from its size."""
+        with patch.object(DataFrameProvider, "SAMPLE_BYTES", 16 * 1024):
+            estimate = _provider(server, "/data.zip").estimate_memory()
+
+        assert estimate is not None
+        assert estimate.bytes == pytest.approx(ACTUAL, rel=0.2)
+
+    def test_no_estimate_without_cache(self, server: LocalHTTPServer) -> None:
+        """Without the local cache the size is not estimated."""
+        set_option("save_local", False)
+        assert _provider(server, "/data.csv").estimate_memory() is None
+
+    def test_chunk_rows_fit_a_share_of_the_budget(self) -> None:
+        """Chunks use a quarter of the budget."""
+        estimate = MemoryEstimate(bytes=1000, rows=100, streamable=True)
+        assert estimate.chunk_rows(400) == 10
+        assert estimate.chunk_rows(1) == 1
+
+    @pytest.mark.parametrize("value", [0, -1, 1.5, "1GB", True])
+    def test_invalid_setting(self, value: Any) -> None:
+        """max_memory must be a positive integer."""
+        set_option("max_memory", value)
+        with pytest.raises(ValueError, match="max_memory"):
+            max_memory()
+
+
+class TestMemoryBudget:
+    """Tests for the max_memory budget in get_data."""
+
+    def _load(
+        self, server: LocalHTTPServer, paths: Dict[str, str], **kwargs: Any
+    ) -> Any:
+        config = _config(server, paths)
+        with patch(
+            "dataset_hub._core.get_data.ConfigManager.load_config",
+            side_effect=lambda name, task_type: config,
+        ):
+            return get_data("sample", "classification", verbose=False, **kwargs)
+
+    def test_no_accounting_without_consumer(self, server: LocalHTTPServer) -> None:
+        """Without a budget or tracing, memory use is not measured."""
+        with patch("dataset_hub._core.memory.table_nbytes") as table_nbytes:
+            bundle = self._load(server, {"data": "/data.csv"})
+
+        table_nbytes.assert_not_called()
+        assert bundle.metadata["data"] == {"chunked": False}
+
+    def test_metadata_with_trace_consumer(self, server: LocalHTTPServer) -> None:
+        """With tracing enabled, memory use and peak RSS are reported."""
+        spans: List[Span] = []
+        add_trace_callback(spans.append)
+        try:
+            bundle = self._load(server, {"data": "/data.csv"})
+        finally:
+            remove_trace_callback(spans.append)
+
+        metadata = bundle.metadata["data"]
+        assert metadata["memory_bytes"] == ACTUAL
+        assert metadata["peak_rss_bytes"] > 0
+        assert metadata["chunked"] is False
+        assert "estimated_bytes" not in metadata
+        (load,) = [span for span in spans if span.name == "load"]
+        assert load.attributes["memory_bytes"] == ACTUAL
+
+    def test_within_budget_loads_at_once(self, server: LocalHTTPServer) -> None:
+        """Tables that fit are loaded as DataFrames."""
+        set_option("max_memory", 100 * ACTUAL)
+        bundle = self._load(server, {"data": "/data.csv"})
+
+        assert isinstance(bundle["data"], pd.DataFrame)
+        assert bundle.metadata["data"]["estimated_bytes"] > 0
+        assert bundle.metadata["data"]["memory_bytes"] == ACTUAL
+        assert bundle.metadata["data"]["chunked"] is False
+
+    @pytest.mark.parametrize("path", ["/data.csv", "/data.parquet"])
+    def test_over_budget_returns_chunks(
+        self, server: LocalHTTPServer, path: str
+    ) -> None:
+        """A table over the budget is returned as an iterator of chunks."""
+        set_option("max_memory", ACTUAL // 2)
+        bundle = self._load(server, {"data": path})
+
+        metadata = bundle.metadata["data"]
+        assert metadata["chunked"] is True
+        assert metadata["memory_bytes"] is None
+        chunks = list(bundle["data"])
+        assert max(len(chunk) for chunk in chunks) <= metadata["chunksize"]
+        pd.testing.assert_frame_equal(
+            pd.concat(chunks, ignore_index=True), FRAME, check_dtype=False
+        )
+
+    def test_budget_argument_overrides_setting(self, server: LocalHTTPServer) -> None:
+        """A budget passed to the call replaces the option, also in the cache key."""
+        set_option("max_memory", 100 * ACTUAL)
+        set_option("memory_cache_size", 100 * ACTUAL)
+        paths = {"data": "/data.csv"}
+
+        chunked = self._load(server, paths, max_memory=ACTUAL // 2)
+        loaded = self._load(server, paths)
+
+        assert chunked.metadata["data"]["chunked"] is True
+        assert isinstance(loaded["data"], pd.DataFrame)
+
+    def test_non_streamable_over_budget_raises(self, server: LocalHTTPServer) -> None:
+        """Tables that cannot be chunked fail before they are parsed."""
+        set_option("max_memory", ACTUAL // 2)
+        with patch.object(DataFrameProvider, "_can_stream", return_value=False):
+            with patch.object(DataFrameProvider, "load") as load:
+                with pytest.raises(MemoryError, match="max_memory"):
+                    self._load(server, {"data": "/data.csv"})
+        load.assert_not_called()
+
+    def test_budget_in_aget_data(self, server: LocalHTTPServer) -> None:
+        """aget_data honors the budget too."""
+        set_option("max_memory", ACTUAL // 2)
+        config = _config(server, {"train": "/data.csv", "test": "/data.zip"})
+        with patch(
+            "dataset_hub._core.get_data.ConfigManager.load_config",
+            side_effect=lambda name, task_type: config,
+        ):
+            bundle = asyncio.run(aget_data("sample", "classification", verbose=False))
+
+        assert bundle.metadata["train"]["chunked"] is True
+        assert bundle.metadata["test"]["chunked"] is True
+        assert sum(len(chunk) for chunk in bundle["test"]) == len(FRAME)
@@ -0,0 +1,159 @@
+"""Unit tests for the in-memory dataset cache."""
+
+from typing import Any
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from dataset_hub import cache_clear, cache_info, set_option
+from dataset_hub._core.config_manager import ConfigManager
+from dataset_hub._core.data_bundle import DataBundle
+from dataset_hub._core.get_data import get_data
+from dataset_hub._core.memory_cache import MemoryCache
+from tests.utils.http_server import LocalHTTPServer
+
+CSV = b"a,b\n1,x\n2,y\n3,z\n"
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"a": range(rows)})
+
+
+class TestMemoryCache:
+    """Tests for MemoryCache."""
+
+    def test_disabled_by_default(self) -> None:
+        """Without a budget nothing is stored."""
+        cache = MemoryCache()
+        key = cache.build_key("iris")
+
+        cache.put(key, DataBundle({"data": _frame(3)}))
+
+        assert cache.get(key) is None
+        assert cache.info().entries == 0
+
+    def test_hit_returns_protected_copy(self) -> None:
+        """Mutating a returned frame does not change the cached one."""
+        set_option("memory_cache_size", 10**6)
+        cache = MemoryCache()
+        key = cache.build_key("iris")
+        cache.put(key, DataBundle({"data": _frame(3)}))
+
+        first = cache.get(key)
+        assert first is not None
+        first["data"].loc[0, "a"] = 99
+        second = cache.get(key)
+
+        assert second is not None
+        assert second["data"]["a"].tolist() == [0, 1, 2]
+        assert cache.info().hits == 2
+
+    def test_lru_eviction_by_bytes(self) -> None:
+        """The least recently used dataset is evicted beyond the budget."""
+        size = int(_frame(100).memory_usage(deep=True).sum())
+        set_option("memory_cache_size", 2 * size)
+        cache = MemoryCache()
+        keys = [cache.build_key(name) for name in ("a", "b", "c")]
+
+        cache.put(keys[0], DataBundle({"data": _frame(100)}))
+        cache.put(keys[1], DataBundle({"data": _frame(100)}))
+        cache.get(keys[0])
+        cache.put(keys[2], DataBundle({"data": _frame(100)}))
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.info().currsize == 2 * size
+
+    def test_oversized_and_lazy_values_skipped(self) -> None:
+        """Datasets above the budget and iterators are not cached."""
+        set_option("memory_cache_size", 100)
+        cache = MemoryCache()
+
+        cache.put(cache.build_key("big"), DataBundle({"data": _frame(1000)}))
+        cache.put(cache.build_key("lazy"), DataBundle({"data": iter([])}))
+
+        assert cache.info().entries == 0
+
+    def test_key_depends_on_options_and_settings(self) -> None:
+        """Load options and data-changing settings are part of the key."""
+        base = MemoryCache.build_key("iris", ["a"], [("a", "in", [1, 2])])
+
+        assert base == MemoryCache.build_key("iris", ["a"], [("a", "in", [1, 2])])
+        assert base != MemoryCache.build_key("iris", ["b"], None)
+        set_option("dtype_backend", "numpy_nullable")
+        assert base != MemoryCache.build_key("iris", ["a"], [("a", "in", [1, 2])])
+
+    @pytest.mark.parametrize(
+        "name, value", [("max_memory", 2**30), ("columnar_cache", "parquet")]
+    )
+    def test_key_depends_on_load_settings(self, name: str, value: Any) -> None:
+        """Loads under another memory budget or columnar cache are not shared."""
+        base = MemoryCache.build_key("iris", "classification")
+        set_option(name, value)
+        assert base != MemoryCache.build_key("iris", "classification")
+
+    def test_invalid_budget_raises(self) -> None:
+        """A negative budget is rejected."""
+        set_option("memory_cache_size", -1)
+        with pytest.raises(ValueError, match="memory_cache_size"):
+            MemoryCache.max_size()
+
+
+class TestGetDataMemoryCache:
+    """Tests for the memory cache in get_data()."""
+
+    @pytest.fixture
+    def server(self) -> Any:
+        with LocalHTTPServer({"/iris.csv": CSV}) as server:
+            source = {"type": "url", "url": server.url("/iris.csv"), "format": "csv"}
+            config = ConfigManager._transform_to_provider_schema(
+                {"dataset_parts": [{"name": "iris", "source": source}]}
+            )
+            with patch(
+                "dataset_hub._core.get_data.ConfigManager.load_config",
+                return_value=config,
+            ) as load_config:
+                yield load_config
+
+    def test_repeated_load_skips_pipeline(self, server: Any) -> None:
+        """A repeated call returns an equal frame without loading the config."""
+        set_option("memory_cache_size", 10**6)
+
+        first = get_data("iris", "classification", verbose=False)["data"]
+        second = get_data("iris", "classification", verbose=False)["data"]
+
+        pd.testing.assert_frame_equal(first, second)
+        assert server.call_count == 1
+        assert cache_info().hits == 1
+        assert cache_info().misses == 1
+
+    def test_options_are_cached_separately(self, server: Any) -> None:
+        """Different columns are different cache entries."""
+        set_option("memory_cache_size", 10**6)
+
+        get_data("iris", "classification", verbose=False)
+        subset = get_data("iris", "classification", verbose=False, columns=["b"])
+
+        assert list(subset["data"].columns) == ["b"]
+        assert cache_info().entries == 2
+
+    def test_chunks_are_not_cached(self, server: Any) -> None:
+        """Chunked loads always run the pipeline."""
+        set_option("memory_cache_size", 10**6)
+
+        get_data("iris", "classification", verbose=False, chunksize=2)
+        get_data("iris", "classification", verbose=False, chunksize=2)
+
+        assert server.call_count == 2
+        assert cache_info().entries == 0
+
+    def test_cache_clear(self, server: Any) -> None:
+        """cache_clear drops entries so the next call loads again."""
+        set_option("memory_cache_size", 10**6)
+        get_data("iris", "classification", verbose=False)
+
+        cache_clear()
+        get_data("iris", "classification", verbose=False)
+
+        assert server.call_count == 2
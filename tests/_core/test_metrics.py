@@ -0,0 +1,205 @@
+"""Unit tests for the metrics registry."""
+
+import io
+import math
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterator
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from dataset_hub import metrics_snapshot, set_option, write_metrics
+from dataset_hub._core import metrics
+from dataset_hub._core.config_manager import ConfigManager
+from dataset_hub._core.get_data import get_data
+from dataset_hub._core.metrics import Counter, Histogram, format_prometheus
+from tests.utils.http_server import LocalHTTPServer
+
+CSV = b"a,b\n1,x\n2,y\n3,z\n"
+
+
+def _samples(name: str) -> Any:
+    return metrics_snapshot()[name]["samples"]
+
+
+class TestMetricTypes:
+    """Tests for Counter and Histogram."""
+
+    def test_counter_by_labels(self) -> None:
+        """Counters add up per label combination."""
+        counter = Counter("c_total", "Help.", ("host",))
+        counter.inc(("a",))
+        counter.inc(("a",), 2)
+        counter.inc(("b",))
+
+        assert counter.samples() == [
+            {"labels": {"host": "a"}, "value": 3},
+            {"labels": {"host": "b"}, "value": 1},
+        ]
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Observations land in the first bucket not below them."""
+        histogram = Histogram("h_seconds", "Help.", (), buckets=(1.0, 5.0))
+        for value in (0.5, 1.0, 3.0, 10.0):
+            histogram.observe((), value)
+
+        (sample,) = histogram.samples()
+        assert sample["buckets"] == {1.0: 2, 5.0: 3, math.inf: 4}
+        assert sample["count"] == 4
+        assert sample["sum"] == pytest.approx(14.5)
+
+
+class TestLoadMetrics:
+    """Tests for the metrics collected by get_data."""
+
+    @pytest.fixture
+    def server(self) -> Iterator[LocalHTTPServer]:
+        files = {"/iris.csv": CSV}
+        with LocalHTTPServer(files) as server:
+            source = {"type": "url", "url": server.url("/iris.csv"), "format": "csv"}
+            config: Dict[str, Any] = ConfigManager._transform_to_provider_schema(
+                {"dataset_parts": [{"name": "iris", "source": source}]}
+            )
+            with patch(
+                "dataset_hub._core.get_data.ConfigManager.load_config",
+                side_effect=lambda name, task_type: config,
+            ):
+                yield server
+
+    def test_cold_then_warm_load(self, server: LocalHTTPServer) -> None:
+        """Bytes are counted as downloaded first, then as served locally."""
+        get_data("iris", "classification", verbose=False)
+        get_data("iris", "classification", verbose=False)
+
+        assert _samples("dataset_hub_loads_total") == [
+            {
+                "labels": {
+                    "dataset": "iris",
+                    "task_type": "classification",
+                    "status": "ok",
+                },
+                "value": 2,
+            }
+        ]
+        host = {"host": "127.0.0.1"}
+        assert _samples("dataset_hub_downloaded_bytes_total") == [
+            {"labels": host, "value": len(CSV)}
+        ]
+        assert _samples("dataset_hub_local_bytes_total") == [
+            {"labels": host, "value": len(CSV)}
+        ]
+        assert [s["value"] for s in _samples("dataset_hub_parsed_rows_total")] == [6]
+        (parse,) = _samples("dataset_hub_parse_seconds")
+        assert parse["labels"] == {"dataset": "iris", "format": "csv"}
+        assert parse["count"] == 2
+
+    def test_changed_upstream_file(self, server: LocalHTTPServer) -> None:
+        """A revalidation replacing the cached copy counts as a download."""
+        set_option("revalidate", True)
+        get_data("iris", "classification", verbose=False)
+        changed = CSV + b"4,w\n" * 100
+        server.files["/iris.csv"] = changed
+
+        get_data("iris", "classification", verbose=False)
+
+        host = {"host": "127.0.0.1"}
+        assert _samples("dataset_hub_downloaded_bytes_total") == [
+            {"labels": host, "value": len(CSV) + len(changed)}
+        ]
+        assert _samples("dataset_hub_local_bytes_total") == []
+        assert _samples("dataset_hub_source_cache_requests_total") == [
+            {"labels": {**host, "result": "miss"}, "value": 2}
+        ]
+
+    def test_failures_by_host(self, server: LocalHTTPServer) -> None:
+        """A failed download is counted per stage and host."""
+        server.files.clear()
+
+        with pytest.raises(requests.RequestException):
+            get_data("iris", "classification", verbose=False)
+
+        failures = {
+            (s["labels"]["stage"], s["labels"]["host"]): s["value"]
+            for s in _samples("dataset_hub_failures_total")
+        }
+        assert failures == {("download", "127.0.0.1"): 1}
+        assert _samples("dataset_hub_loads_total")[0]["labels"]["status"] == "error"
+
+    def test_one_failure_per_failed_call(self, server: LocalHTTPServer) -> None:
+        """The enclosing spans of a failed stage are not counted again."""
+        server.files.clear()
+
+        for _ in range(2):
+            with pytest.raises(requests.RequestException):
+                get_data("iris", "classification", verbose=False)
+
+        failures = _samples("dataset_hub_failures_total")
+        assert sum(s["value"] for s in failures) == 2
+
+    def test_failed_chunk_iteration(self, server: LocalHTTPServer) -> None:
+        """Chunks failing after get_data returned count one failure."""
+        server.files.clear()
+        chunks = get_data("iris", "classification", chunksize=2, verbose=False)
+
+        with pytest.raises(requests.RequestException):
+            list(chunks["data"])
+
+        failures = {
+            (s["labels"]["stage"], s["labels"]["host"]): s["value"]
+            for s in _samples("dataset_hub_failures_total")
+        }
+        assert failures == {("download", "127.0.0.1"): 1}
+        assert not metrics._OPEN_SPANS and not metrics._FAILED_STAGES
+
+    def test_decompress_without_trace_consumer(self, server: LocalHTTPServer) -> None:
+        """Decompression time is recorded without a trace consumer."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zipped:
+            zipped.writestr("iris.csv", CSV)
+        server.files["/iris.zip"] = archive.getvalue()
+        source = {"type": "url", "url": server.url("/iris.zip"), "format": "csv"}
+        config = ConfigManager._transform_to_provider_schema(
+            {"dataset_parts": [{"name": "iris", "source": source}]}
+        )
+        with patch(
+            "dataset_hub._core.get_data.ConfigManager.load_config",
+            side_effect=lambda name, task_type: config,
+        ):
+            get_data("iris", "classification", verbose=False)
+
+        (sample,) = _samples("dataset_hub_decompress_seconds")
+        assert sample["labels"] == {"dataset": "iris"}
+        assert sample["count"] == 1
+        (decompressed,) = _samples("dataset_hub_decompressed_bytes_total")
+        assert decompressed["value"] == len(CSV)
+
+    def test_prometheus_file(self, server: LocalHTTPServer, tmp_path: Path) -> None:
+        """The metrics_path option rewrites a Prometheus text file per load."""
+        path = tmp_path / "dataset_hub.prom"
+        set_option("metrics_path", str(path))
+
+        get_data("iris", "classification", verbose=False)
+
+        text = path.read_text()
+        assert "# TYPE dataset_hub_load_seconds histogram" in text
+        assert (
+            'dataset_hub_loads_total{dataset="iris",task_type="classification",'
+            'status="ok"} 1'
+        ) in text
+        assert 'dataset_hub_load_seconds_bucket{dataset="iris",' in text
+        assert 'le="+Inf"} 1' in text
+        assert text == format_prometheus()
+
+    def test_write_metrics_escapes_labels(self, tmp_path: Path) -> None:
+        """Label values are escaped as in the exposition format."""
+        counter = Counter("x_total", "Help.", ("path",))
+        counter.inc(('a"b\\c',))
+
+        with patch("dataset_hub._core.metrics.METRICS", (counter,)):
+            write_metrics(tmp_path / "x.prom")
+
+        assert (tmp_path / "x.prom").read_text().splitlines()[-1] == (
+            'x_total{path="a\\"b\\\\c"} 1'
+        )
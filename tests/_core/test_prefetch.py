@@ -0,0 +1,119 @@
+"""Unit tests for the bulk prefetch API."""
+
+import time
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+
+from dataset_hub import PrefetchResult, prefetch, set_option
+from tests.utils.http_server import LocalHTTPServer
+
+DATASETS = {
+    "classification": ["iris", "titanic"],
+    "regression": ["california_housing"],
+}
+
+
+def _config(server: LocalHTTPServer, name: str) -> Dict[str, Any]:
+    source = {"type": "url", "url": server.url(f"/{name}.csv"), "format": "csv"}
+    provider = {"type": "dataframe", "params": {"name": name, "source": source}}
+    return {"providers": {"data": provider}}
+
+
+class TestPrefetch:
+    """Tests for dataset_hub.prefetch()."""
+
+    @pytest.fixture
+    def server(self) -> Any:
+        files = {
+            f"/{name}.csv": b"a,b\n1,2\n"
+            for names in DATASETS.values()
+            for name in names
+        }
+        with LocalHTTPServer(files) as server:
+            with patch(
+                "dataset_hub._core.prefetch.ConfigManager.load_config",
+                side_effect=lambda name, task_type: _config(server, name),
+            ):
+                yield server
+
+    def test_prefetch_by_task_type(self, server: LocalHTTPServer) -> None:
+        """All datasets of the selected task types are downloaded."""
+        results = prefetch(task_types=["classification", "regression"])
+
+        assert [(r.task_type, r.dataset_name) for r in results] == [
+            ("classification", "iris"),
+            ("classification", "titanic"),
+            ("regression", "california_housing"),
+        ]
+        assert all(r.ok and r.bytes == 8 for r in results)
+        assert all(r.parse_seconds is None for r in results)
+
+    def test_prefetch_by_name_with_parse(self, server: LocalHTTPServer) -> None:
+        """Named datasets are fetched and optionally parsed."""
+        results = prefetch(names=["titanic"], parse=True)
+
+        assert len(results) == 1
+        assert results[0].dataset_name == "titanic"
+        assert results[0].parse_seconds is not None
+
+    def test_prefetch_unknown_name(self, server: LocalHTTPServer) -> None:
+        """Unknown dataset names raise ValueError before any download."""
+        with pytest.raises(ValueError, match="not_a_dataset"):
+            prefetch(names=["not_a_dataset"])
+        assert server.requests == []
+
+    def test_prefetch_single_name(self, server: LocalHTTPServer) -> None:
+        """A single name or task type may be passed as a string."""
+        results = prefetch(names="iris", task_types="classification")
+
+        assert [r.dataset_name for r in results] == ["iris"]
+
+    def test_prefetch_parts_concurrently(self, server: LocalHTTPServer) -> None:
+        """The parts of a multi-part dataset are fetched in parallel."""
+        config = {
+            "providers": {
+                table: _config(server, name)["providers"]["data"]
+                for table, name in [("train", "iris"), ("test", "titanic")]
+            }
+        }
+        server.delay = 0.3
+        with patch(
+            "dataset_hub._core.prefetch.ConfigManager.load_config",
+            return_value=config,
+        ):
+            start = time.perf_counter()
+            (result,) = prefetch(names=["iris"])
+            elapsed = time.perf_counter() - start
+
+        assert result.ok and result.bytes == 16
+        assert elapsed < 0.3 * 2
+
+    def test_prefetch_reports_failures(self, server: LocalHTTPServer) -> None:
+        """A failing dataset is reported without stopping the others."""
+        set_option("http_retries", 0)
+        del server.files["/iris.csv"]
+        results = prefetch(task_types=["classification"])
+
+        by_name = {r.dataset_name: r for r in results}
+        assert not by_name["iris"].ok
+        assert "RequestException" in str(by_name["iris"].error)
+        assert by_name["titanic"].ok
+
+    def test_prefetch_runs_concurrently(self, server: LocalHTTPServer) -> None:
+        """Total time is close to the slowest dataset, not the sum."""
+        server.delay = 0.3
+        start = time.perf_counter()
+        results = prefetch(task_types=["classification", "regression"])
+        elapsed = time.perf_counter() - start
+
+        assert all(r.ok for r in results)
+        assert elapsed < 0.3 * len(results)
+
+    def test_prefetch_requires_save_local(self, server: LocalHTTPServer) -> None:
+        """Without a local cache there is nothing to prefetch into."""
+        set_option("save_local", False)
+        results = prefetch(names=["iris"])
+        assert isinstance(results[0], PrefetchResult)
+        assert "save_local" in str(results[0].error)
@@ -0,0 +1,243 @@
+"""Unit tests for per-stage tracing spans."""
+
+import asyncio
+import io
+import json
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+from unittest.mock import patch
+
+import pytest
+
+from dataset_hub import set_option
+from dataset_hub._core import tracing
+from dataset_hub._core.config_manager import ConfigManager
+from dataset_hub._core.get_data import aget_data, get_data
+from dataset_hub._core.tracing import Span, add_trace_callback, remove_trace_callback
+from tests.utils.http_server import LocalHTTPServer
+
+CSV = b"a,b\n1,x\n2,y\n3,z\n"
+
+
+def _zipped(name: str, body: bytes) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(name, body)
+    return buffer.getvalue()
+
+
+def _config(server: LocalHTTPServer, paths: Dict[str, str]) -> Dict[str, Any]:
+    parts = [
+        {
+            "name": f"ds_{table}",
+            "table": table,
+            "source": {"type": "url", "url": server.url(path), "format": "csv"},
+        }
+        for table, path in paths.items()
+    ]
+    return ConfigManager._transform_to_provider_schema({"dataset_parts": parts})
+
+
+def _by_name(spans: List[Span]) -> Dict[str, List[Span]]:
+    names: Dict[str, List[Span]] = {}
+    for span in spans:
+        names.setdefault(span.name, []).append(span)
+    return names
+
+
+@pytest.fixture
+def spans() -> Iterator[List[Span]]:
+    """Collect the spans emitted during a test."""
+    collected: List[Span] = []
+    add_trace_callback(collected.append)
+    yield collected
+    remove_trace_callback(collected.append)
+
+
+@pytest.fixture
+def server() -> Iterator[LocalHTTPServer]:
+    files = {"/a.csv": CSV, "/b.csv": CSV, "/c.zip": _zipped("c.csv", CSV)}
+    with LocalHTTPServer(files) as server:
+        yield server
+
+
+def _patch_config(server: LocalHTTPServer, paths: Dict[str, str]) -> Any:
+    return patch(
+        "dataset_hub._core.get_data.ConfigManager.load_config",
+        side_effect=lambda name, task_type: _config(server, paths),
+    )
+
+
+class TestTracing:
+    """Tests for the spans emitted by get_data."""
+
+    def test_stages_of_a_cold_load(
+        self, server: LocalHTTPServer, spans: List[Span]
+    ) -> None:
+        """A first load emits every stage as one trace."""
+        with _patch_config(server, {"data": "/a.csv"}):
+            get_data("ds", "classification", verbose=False)
+
+        names = _by_name(spans)
+        assert set(names) == {
+            "get_data",
+            "config",
+            "load",
+            "fetch",
+            "download",
+            "parse",
+            "package",
+        }
+        root = names["get_data"][0]
+        assert root.parent_id is None
+        assert root.attributes["dataset"] == "ds"
+        assert {span.trace_id for span in spans} == {root.trace_id}
+        assert names["load"][0].parent_id == root.span_id
+        assert names["fetch"][0].parent_id == names["load"][0].span_id
+        assert names["download"][0].parent_id == names["fetch"][0].span_id
+        assert names["fetch"][0].attributes["cache_hit"] is False
+        assert names["download"][0].attributes["bytes"] == len(CSV)
+        assert names["parse"][0].attributes["rows"] == 3
+        assert names["package"][0].attributes["columns"] == 2
+        assert all(span.duration >= 0 for span in spans)
+
+    def test_cached_load_has_no_download(
+        self, server: LocalHTTPServer, spans: List[Span]
+    ) -> None:
+        """A cache hit is reported by the fetch span."""
+        with _patch_config(server, {"data": "/a.csv"}):
+            get_data("ds", "classification", verbose=False)
+            spans.clear()
+            get_data("ds", "classification", verbose=False)
+
+        names = _by_name(spans)
+        assert "download" not in names
+        assert names["fetch"][0].attributes == {
+            "dataset": "ds_data",
+            "url": server.url("/a.csv"),
+            "cache_hit": True,
+            "bytes": len(CSV),
+        }
+
+    def test_parts_in_threads_share_the_trace(
+        self, server: LocalHTTPServer, spans: List[Span]
+    ) -> None:
+        """Tables loaded on worker threads are children of the call."""
+        with _patch_config(server, {"train": "/a.csv", "test": "/b.csv"}):
+            get_data("ds", "classification", verbose=False)
+
+        names = _by_name(spans)
+        root = names["get_data"][0]
+        assert sorted(s.attributes["table"] for s in names["load"]) == [
+            "test",
+            "train",
+        ]
+        assert {s.parent_id for s in names["load"]} == {root.span_id}
+        assert {s.trace_id for s in spans} == {root.trace_id}
+
+    def test_archive_member_emits_decompress(
+        self, server: LocalHTTPServer, spans: List[Span]
+    ) -> None:
+        """Reading a zipped source reports the decompressed bytes."""
+        with _patch_config(server, {"data": "/c.zip"}):
+            get_data("ds", "classification", verbose=False)
+
+        names = _by_name(spans)
+        decompress = names["decompress"][0]
+        assert decompress.attributes["bytes"] == len(CSV)
+        assert decompress.parent_id == names["parse"][0].span_id
+
+    def test_chunks_join_the_trace(
+        self, server: LocalHTTPServer, spans: List[Span]
+    ) -> None:
+        """Stages run while iterating chunks are children of get_data."""
+        with _patch_config(server, {"data": "/c.zip"}):
+            bundle = get_data("ds", "classification", verbose=False, chunksize=2)
+        assert [span.name for span in spans] == ["config", "get_data"]
+        chunks = list(bundle["data"])
+
+        assert sum(len(chunk) for chunk in chunks) == 3
+        root = _by_name(spans)["get_data"][0]
+        assert {span.trace_id for span in spans} == {root.trace_id}
+        fetch = _by_name(spans)["fetch"][0]
+        assert fetch.parent_id == root.span_id
+
+    def test_memory_cache_hit(self, server: LocalHTTPServer, spans: List[Span]) -> None:
+        """A memory cache hit emits only the get_data span."""
+        set_option("memory_cache_size", 10**6)
+        with _patch_config(server, {"data": "/a.csv"}):
+            get_data("ds", "classification", verbose=False)
+            spans.clear()
+            get_data("ds", "classification", verbose=False)
+
+        assert [span.name for span in spans] == ["get_data"]
+        assert spans[0].attributes["memory_cache_hit"] is True
+
+    def test_aget_data_spans(self, server: LocalHTTPServer, spans: List[Span]) -> None:
+        """aget_data emits the same stages within one trace."""
+        with _patch_config(server, {"train": "/a.csv", "test": "/b.csv"}):
+            asyncio.run(aget_data("ds", "classification", verbose=False))
+
+        names = _by_name(spans)
+        root = names["get_data"][0]
+        assert len(names["parse"]) == 2
+        assert {s.trace_id for s in spans} == {root.trace_id}
+
+    def test_error_is_recorded(self, spans: List[Span]) -> None:
+        """A failing stage is emitted with its error."""
+        with pytest.raises(FileNotFoundError):
+            get_data("missing", "classification", verbose=False)
+
+        names = _by_name(spans)
+        assert names["config"][0].error.startswith("FileNotFoundError")
+        assert names["get_data"][0].error is not None
+
+
+class TestTraceConsumers:
+    """Tests for callbacks and the JSON-lines exporter."""
+
+    def test_json_lines_exporter(self, server: LocalHTTPServer, tmp_path: Path) -> None:
+        """The trace_path option appends one JSON object per span."""
+        trace_path = tmp_path / "trace.jsonl"
+        set_option("trace_path", str(trace_path))
+
+        with _patch_config(server, {"data": "/a.csv"}):
+            get_data("ds", "classification", verbose=False)
+
+        records = [json.loads(line) for line in trace_path.read_text().splitlines()]
+        assert records[-1]["name"] == "get_data"
+        assert {"parse", "download"} <= {record["name"] for record in records}
+        assert set(records[0]) == set(Span("x", "t", "s").to_dict())
+
+    def test_metrics_without_consumers(self, tmp_path: Path) -> None:
+        """Without consumers, measured spans still update the metrics only."""
+        assert not tracing.is_enabled()
+        with patch.object(tracing.metrics, "observe_span") as observe:
+            with patch.object(tracing, "_export_json_line") as export:
+                tracing.emit("decompress", 0.0, 1.0, dataset="ds")
+        assert observe.call_args.args[0].name == "decompress"
+        export.assert_not_called()
+
+    def test_failing_callback_is_ignored(self) -> None:
+        """A raising callback does not break the load or other callbacks."""
+        collected: List[Span] = []
+
+        def broken(span: Span) -> None:
+            raise RuntimeError("boom")
+
+        add_trace_callback(broken)
+        add_trace_callback(collected.append)
+        try:
+            with tracing.span("stage", rows=1):
+                pass
+        finally:
+            remove_trace_callback(broken)
+            remove_trace_callback(collected.append)
+
+        assert [(s.name, s.attributes) for s in collected] == [("stage", {"rows": 1})]
+
+    def test_remove_unknown_callback_raises(self) -> None:
+        """Removing a callback that was never added raises ValueError."""
+        with pytest.raises(ValueError):
+            remove_trace_callback(print)
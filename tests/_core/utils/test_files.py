@@ -0,0 +1,60 @@
+"""Unit tests for file helpers."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from dataset_hub._core.utils.files import atomic_path, file_lock
+
+
+class TestAtomicPath:
+    """Tests for atomic_path() context manager."""
+
+    def test_atomic_path_replaces_destination(self, tmp_path: Path) -> None:
+        """File appears at destination only after the block completes."""
+        dest = tmp_path / "sub" / "data.csv"
+        with atomic_path(dest) as tmp:
+            tmp.write_bytes(b"a,b\n1,2\n")
+            assert tmp.parent == dest.parent
+            assert not dest.exists()
+        assert dest.read_bytes() == b"a,b\n1,2\n"
+        assert list(dest.parent.iterdir()) == [dest]
+
+    def test_atomic_path_keeps_original_on_error(self, tmp_path: Path) -> None:
+        """On error the original file is untouched and the temp file removed."""
+        dest = tmp_path / "data.csv"
+        dest.write_bytes(b"old")
+        with pytest.raises(RuntimeError):
+            with atomic_path(dest) as tmp:
+                tmp.write_bytes(b"partial")
+                raise RuntimeError("interrupted")
+        assert dest.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [dest]
+
+
+class TestFileLock:
+    """Tests for file_lock() context manager."""
+
+    def test_file_lock_serializes_holders(self, tmp_path: Path) -> None:
+        """Only one holder is inside the locked block at a time."""
+        lock = tmp_path / "data.csv.lock"
+        inside = []
+        overlaps = []
+
+        def worker() -> None:
+            with file_lock(lock):
+                overlaps.append(len(inside))
+                inside.append(1)
+                time.sleep(0.01)
+                inside.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert overlaps == [0, 0, 0, 0]
+        assert lock.exists()
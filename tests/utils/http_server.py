@@ -0,0 +1,148 @@
+import hashlib
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Dict, List, Optional, Tuple, Type
+
+
+class LocalHTTPServer:
+    """
+    Threaded HTTP/1.1 server serving in-memory files for offline tests.
+
+    Keep-alive is supported, and every accepted TCP connection and request is
+    recorded so tests can assert on connection reuse and request headers.
+
+    Files are served with a content-based ``ETag``. Single ``Range: bytes=N-``
+    / ``bytes=N-M`` requests (optionally guarded by ``If-Range``) are answered
+    with 206 unless `ranges` is False. ``If-None-Match`` with the current ETag
+    is answered with 304. ``fail_after`` maps a path to a byte
+    count after which the connection is dropped mid-body, once per entry.
+    ``delay`` adds latency (seconds) before each response.
+
+    Example::
+
+        with LocalHTTPServer({"/data.csv": b"a,b\\n1,2\\n"}) as server:
+            url = server.url("/data.csv")
+    """
+
+    def __init__(self, files: Dict[str, bytes], ranges: bool = True) -> None:
+        self.files = dict(files)
+        self.ranges = ranges
+        self.fail_after: Dict[str, int] = {}
+        self.delay = 0.0
+        self.connections = 0
+        self.requests: List[Dict[str, str]] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.01,), daemon=True
+        )
+
+    def url(self, path: str) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}{path}"
+
+    def __enter__(self) -> "LocalHTTPServer":
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self) -> Type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+            def do_HEAD(self) -> None:
+                self._respond(send_body=False)
+
+            def do_GET(self) -> None:
+                self._respond(send_body=True)
+
+            def _respond(self, send_body: bool) -> None:
+                with server._lock:
+                    server.requests.append(
+                        {"method": self.command, "path": self.path, **self.headers}
+                    )
+                time.sleep(server.delay)
+                body = server.files.get(self.path)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                etag = f'"{hashlib.md5(body).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                start, end = self._requested_range(len(body), etag)
+                if start is not None and start >= len(body):
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{len(body)}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if start is None:
+                    self.send_response(200)
+                    start, end = 0, len(body) - 1
+                else:
+                    self.send_response(206)
+                    self.send_header(
+                        "Content-Range", f"bytes {start}-{end}/{len(body)}"
+                    )
+                self.send_header("Content-Length", str(end - start + 1))
+                self.send_header("ETag", etag)
+                if server.ranges:
+                    self.send_header("Accept-Ranges", "bytes")
+                self.end_headers()
+                if not send_body:
+                    return
+
+                payload = body[start : end + 1]
+                fail_after = server.fail_after.pop(self.path, None)
+                if fail_after is not None:
+                    self.wfile.write(payload[:fail_after])
+                    self.wfile.flush()
+                    self.close_connection = True
+                    return
+                self.wfile.write(payload)
+
+            def _requested_range(
+                self, size: int, etag: str
+            ) -> Tuple[Optional[int], int]:
+                header = self.headers.get("Range")
+                if not server.ranges or not header:
+                    return None, size - 1
+                if_range = self.headers.get("If-Range")
+                if if_range is not None and if_range != etag:
+                    return None, size - 1
+                match = re.fullmatch(r"bytes=(\d+)-(\d*)", header)
+                if not match:
+                    return None, size - 1
+                start = int(match.group(1))
+                end = int(match.group(2)) if match.group(2) else size - 1
+                return start, min(end, size - 1)
+
+        return Handler